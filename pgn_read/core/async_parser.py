@@ -0,0 +1,150 @@
+# async_parser.py
+# Copyright 2025 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Read games from an asyncio stream without blocking the event loop.
+
+The aread_games asynchronous generator runs PGN read_games() in a thread,
+of the event loop's default executor unless another is given, reading text
+from the stream on the event loop as the parser needs it.  Games are passed
+back to the event loop in batches through a bounded asyncio.Queue, so the
+parser waits when the consumer falls behind.
+
+The games, and their game_offset values, are the ones PGN read_games()
+gives when reading the same text from a file.
+
+"""
+import asyncio
+import codecs
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from .game import Game
+from .parser import PGN
+
+# The games passed to the event loop together.
+BATCH_SIZE = 100
+
+# The batches waiting for the consumer before the parser waits.
+MAX_BATCHES = 4
+
+# Characters, or bytes, requested from stream in each read.
+READ_SIZE = 65536
+
+DEFAULT_ENCODING = "iso-8859-1"
+
+
+class AsyncParserError(Exception):
+    """Exception raised where games cannot be read as requested."""
+
+
+async def aread_games(
+    stream,
+    game_class=Game,
+    size=READ_SIZE,
+    encoding=DEFAULT_ENCODING,
+    batch_size=BATCH_SIZE,
+    max_batches=MAX_BATCHES,
+    executor=None,
+):
+    """Yield Game, or game_class, instances for games read from stream.
+
+    stream has a coroutine read(size) method, like asyncio.StreamReader or
+    an asynchronous file, returning bytes or str and an empty value at end
+    of stream.  Bytes are decoded using encoding.  The stream is not closed.
+
+    executor is None, for the event loop's default executor, or a
+    concurrent.futures.ThreadPoolExecutor.  The parser shares the event
+    loop, the queue of batches, and the stream, with the event loop so it
+    must run in a thread of this process: a ProcessPoolExecutor cannot be
+    used because these cannot be pickled.
+
+    """
+    if executor is not None and not isinstance(executor, ThreadPoolExecutor):
+        raise AsyncParserError("executor must be a ThreadPoolExecutor")
+    loop = asyncio.get_running_loop()
+    queue = asyncio.Queue(maxsize=max_batches)
+    stop = threading.Event()
+    worker = loop.run_in_executor(
+        executor,
+        _parse_into_queue,
+        PGN(game_class=game_class),
+        _StreamSource(stream, loop, encoding, stop),
+        size,
+        batch_size,
+        queue,
+        loop,
+        stop,
+    )
+    try:
+        while True:
+            batch = await queue.get()
+            if batch is None:
+                break
+            for game in batch:
+                yield game
+        await worker
+    finally:
+        stop.set()
+        while not worker.done():
+            # Allow a parser waiting for space in queue to see stop set.
+            while not queue.empty():
+                queue.get_nowait()
+            await asyncio.wait((worker,), timeout=0.1)
+
+
+def _parse_into_queue(parser, source, size, batch_size, queue, loop, stop):
+    """Put batches of games read from source by parser on queue.
+
+    None is put on queue when source is exhausted or parsing fails.
+
+    """
+
+    def put(item):
+        asyncio.run_coroutine_threadsafe(queue.put(item), loop).result()
+
+    try:
+        batch = []
+        for game in parser.read_games(source, size=size):
+            if stop.is_set():
+                return
+            batch.append(game)
+            if len(batch) == batch_size:
+                put(batch)
+                batch = []
+        if batch and not stop.is_set():
+            put(batch)
+    finally:
+        put(None)
+
+
+class _StreamSource:
+    """File-like object whose read() method reads text from stream.
+
+    read() is called from the executor and waits while the read is done on
+    the event loop.
+
+    """
+
+    def __init__(self, stream, loop, encoding, stop):
+        """Note stream, loop on which it is read, and decoding."""
+        self._stream = stream
+        self._loop = loop
+        self._decoder = codecs.getincrementaldecoder(encoding)()
+        self._stop = stop
+
+    def read(self, size):
+        """Return text read from stream, or '' at end or when stopped."""
+        while not self._stop.is_set():
+            data = asyncio.run_coroutine_threadsafe(
+                self._stream.read(size), self._loop
+            ).result()
+            if isinstance(data, str):
+                return data
+            text = self._decoder.decode(data, final=not data)
+            if text or not data:
+                return text
+        return ""
+
+    def close(self):
+        """Do nothing: the stream belongs to the caller."""
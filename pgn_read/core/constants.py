@@ -322,6 +322,15 @@ FULL_DISAMBIGUATION_ALLOWED = r'(?s:([18]=[QB]).*\1|[18]=N|\[\s*FEN\s*")'
 # The token is assumed to not represent a pawn move.
 PAWN_MOVE_TOKEN_POSSIBLE_BISHOP = r"\A[Bb][1-8]\Z"
 
+# For peeking at the square token which may be the second part of a long
+# algebraic move split by whitespace, 'e2 e4' say, so game.GameIgnoreCasePGN
+# can decide what the first part means before applying it.  The following
+# whitespace ensures the square is the whole token.
+SPLIT_LAN_DESTINATION = r"\s+([a-hA-H][1-8])(?=\s)"
+
+# Index of captured group for square in split long algebraic move.
+SLD_DESTINATION = 1
+
 # The parser.PGN.read_games method uses UNTERMINATED when deciding if a PGN Tag
 # found in an error sequence should start a new game.
 UNTERMINATED = "<{"
@@ -392,6 +401,11 @@ TAG_SETUP = "SetUp"
 SETUP_VALUE_FEN_ABSENT = "0"
 SETUP_VALUE_FEN_PRESENT = "1"
 
+# Opening information Tags.
+TAG_ECO = "ECO"
+TAG_OPENING = "Opening"
+TAG_VARIATION = "Variation"
+
 # PGN constants
 PGN_CAPTURE_MOVE = "x"
 PGN_PAWN = ""
@@ -0,0 +1,330 @@
+# eco_trie.py
+# Copyright 2025 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Classify the openings of games by ECO code while the games are read.
+
+ECOTrie holds the move sequences of an opening table, given as PGN games
+with ECO, Opening, and Variation, tags, as a trie.  The table is read once
+with the PGN class and the trie is saved in a compact binary file which is
+loaded without parsing PGN again.
+
+GameECO extends Game by following the main line moves of a game through
+the trie as the game is read, noting the ECO code, opening, and variation,
+of the last opening reached.  Following stops at the first move not in the
+trie so the cost is a dict lookup for each of the first few moves of a
+game.
+
+The edges of the trie are keyed by the pieces removed from and placed on
+squares by a move, not by the movetext, so 'Nf3', 'Ngf3', and 'Ng1f3' are
+the same move.  A game which reaches a position in the table by a move
+order not in the table is classified by the last position reached in the
+table's order, because the trie is of move sequences not positions.
+
+"""
+import sys
+import struct
+from array import array
+
+from .constants import TAG_FEN, TAG_ECO, TAG_OPENING, TAG_VARIATION
+from .game import Game
+from .parser import PGN
+
+# Identify file as an ECO trie and the layout version.
+TRIE_MAGIC = b"PGNECOTR"
+TRIE_VERSION = 2
+_header = struct.Struct("<8sIIII")
+
+# Typecodes for the columns saved in the trie file.
+_PARENT = "I"
+_MOVE = "I"
+_OPENING = "i"
+
+# Node index of root of trie, the standard starting position.
+_ROOT = 0
+
+# Opening index of nodes which are not the end of a line in the table.
+_NO_OPENING = -1
+
+# Typecode for the lengths of the encoded str items saved in the trie file.
+# The items are length-prefixed rather than separated because tag values
+# can contain any character, including newline and tab.
+_LENGTH = "I"
+_ENCODING = "utf-8"
+
+# Number of str items for each opening: ECO code, opening, and variation.
+_OPENING_FIELDS = 3
+
+
+class ECOTrieError(Exception):
+    """Exception raised reading an ECO trie file."""
+
+
+def move_key(position_delta):
+    """Return str key for trie edge of move which gives position_delta.
+
+    The key is the squares and names of the pieces removed by the move
+    followed by those placed by the move, each in sorted order.
+
+    """
+    remove, place = position_delta
+    return "-".join(
+        (
+            "".join(
+                sorted([square + piece.name for square, piece in remove[0]])
+            ),
+            "".join(
+                sorted([square + piece.name for square, piece in place[0]])
+            ),
+        )
+    )
+
+
+class _GameMainLine(Game):
+    """Note trie keys of main line moves while reading an opening table."""
+
+    def __init__(self):
+        """Extend to initialise the list of trie keys."""
+        super().__init__()
+        self.move_keys = []
+
+    def _append_decorated_text(self, movetext):
+        """Extend to note trie key of movetext in main line."""
+        super()._append_decorated_text(movetext)
+        if len(self._ravstack) == 1:
+            self.move_keys.append(move_key(self._position_deltas[-1]))
+
+    def _append_decorated_castles_text(self, movetext):
+        """Extend to note trie key of movetext in main line."""
+        super()._append_decorated_castles_text(movetext)
+        if len(self._ravstack) == 1:
+            self.move_keys.append(move_key(self._position_deltas[-1]))
+
+
+class ECOTrie:
+    """Trie of the move sequences of the lines in an ECO opening table.
+
+    The openings attribute is a list of (ECO code, opening, variation)
+    tuples, with '' for absent tags.  Each node of the trie is the position
+    after the moves on the path from the root, and may be the end of a line
+    in the table, with the index of the line's item in openings.
+
+    """
+
+    def __init__(self):
+        """Create a trie with the starting position only."""
+        self.openings = []
+        self._opening_numbers = {}
+        self.moves = []
+        self._move_numbers = {}
+        self.parents = array(_PARENT, (_ROOT,))
+        self.node_moves = array(_MOVE, (0,))
+        self.node_openings = array(_OPENING, (_NO_OPENING,))
+        self._children = [{}]
+
+    def __len__(self):
+        """Return number of nodes in trie, including the root."""
+        return len(self._children)
+
+    def add_pgn(self, source):
+        """Add opening table read from source by parser.PGN read_games()."""
+        self.add_games(PGN(game_class=_GameMainLine).read_games(source))
+
+    def add_games(self, games):
+        """Add lines in games to trie.
+
+        games is an iterable of _GameMainLine instances.  Games with errors,
+        a PGN FEN tag, or no moves, are ignored.  The first game for a line
+        decides the opening if the table has the line more than once.
+
+        """
+        opening_numbers = self._opening_numbers
+        openings = self.openings
+        node_openings = self.node_openings
+        for game in games:
+            if game.state is not None or not game.move_keys:
+                continue
+            tags = game.pgn_tags
+            if TAG_FEN in tags:
+                continue
+            node = _ROOT
+            for key in game.move_keys:
+                node = self._add_child(node, key)
+            if node_openings[node] != _NO_OPENING:
+                continue
+            opening = (
+                tags.get(TAG_ECO, ""),
+                tags.get(TAG_OPENING, ""),
+                tags.get(TAG_VARIATION, ""),
+            )
+            number = opening_numbers.get(opening)
+            if number is None:
+                number = len(openings)
+                opening_numbers[opening] = number
+                openings.append(opening)
+            node_openings[node] = number
+
+    def _add_child(self, node, key):
+        """Return child of node for move key, adding child if needed."""
+        child = self._children[node].get(key)
+        if child is not None:
+            return child
+        number = self._move_numbers.get(key)
+        if number is None:
+            number = len(self.moves)
+            self._move_numbers[key] = number
+            self.moves.append(key)
+        child = len(self._children)
+        self._children[node][key] = child
+        self._children.append({})
+        self.parents.append(node)
+        self.node_moves.append(number)
+        self.node_openings.append(_NO_OPENING)
+        return child
+
+    def child(self, node, key):
+        """Return child of node for move key, or None if not in trie."""
+        return self._children[node].get(key)
+
+    def opening(self, node):
+        """Return (ECO code, opening, variation) at node, or None."""
+        number = self.node_openings[node]
+        if number == _NO_OPENING:
+            return None
+        return self.openings[number]
+
+    def _columns(self):
+        """Return the arrays saved in a trie file in file order."""
+        return (self.parents, self.node_moves, self.node_openings)
+
+    def write_trie(self, path):
+        """Write trie to file at path.
+
+        The moves and openings are written as a column of the lengths of
+        the encoded str items followed by the encoded items.  Nodes are
+        written in the order added, so a parent is always before it's
+        children.  Numbers are written in little-endian order whatever the
+        platform.
+
+        """
+        items = [move.encode(_ENCODING) for move in self.moves]
+        for opening in self.openings:
+            items.extend(field.encode(_ENCODING) for field in opening)
+        lengths = array(_LENGTH, (len(item) for item in items))
+        with open(path, mode="wb") as file:
+            file.write(
+                _header.pack(
+                    TRIE_MAGIC,
+                    TRIE_VERSION,
+                    len(self._children),
+                    len(self.moves),
+                    len(self.openings),
+                )
+            )
+            for column in (lengths,) + self._columns():
+                if sys.byteorder != "little":
+                    column = array(column.typecode, column)
+                    column.byteswap()
+                column.tofile(file)
+            file.write(b"".join(items))
+
+    def read_trie(self, path):
+        """Replace trie with the one in file at path."""
+        with open(path, mode="rb") as file:
+            header = file.read(_header.size)
+            if len(header) != _header.size:
+                raise ECOTrieError(path + " is not an ECO trie")
+            magic, version, nodes, moves, openings = _header.unpack(header)
+            if magic != TRIE_MAGIC:
+                raise ECOTrieError(path + " is not an ECO trie")
+            if version != TRIE_VERSION:
+                raise ECOTrieError(path + " ECO trie version is not supported")
+            lengths = array(_LENGTH)
+            try:
+                for column, count in zip(
+                    (lengths,) + self._columns(),
+                    (moves + openings * _OPENING_FIELDS, nodes, nodes, nodes),
+                ):
+                    del column[:]
+                    column.fromfile(file, count)
+                    if sys.byteorder != "little":
+                        column.byteswap()
+            # ValueError is raised if the file ends part way through a number.
+            except (EOFError, ValueError) as exc:
+                raise ECOTrieError(path + " ECO trie is truncated") from exc
+            data = file.read(sum(lengths))
+            if len(data) != sum(lengths):
+                raise ECOTrieError(path + " ECO trie is truncated")
+        items = []
+        start = 0
+        for length in lengths:
+            items.append(data[start : start + length].decode(_ENCODING))
+            start += length
+        self.moves[:] = items[:moves]
+        self._move_numbers = {m: n for n, m in enumerate(self.moves)}
+        self.openings[:] = [
+            tuple(items[start : start + _OPENING_FIELDS])
+            for start in range(moves, len(items), _OPENING_FIELDS)
+        ]
+        self._opening_numbers = {o: n for n, o in enumerate(self.openings)}
+        moves = self.moves
+        children = [{} for node in range(nodes)]
+        for node, parent, move in zip(
+            range(1, nodes), self.parents[1:], self.node_moves[1:]
+        ):
+            children[parent][moves[move]] = node
+        self._children = children
+
+
+class GameECO(Game):
+    """Note ECO code, opening, and variation, of game from an ECOTrie.
+
+    The eco_trie class attribute is the ECOTrie used: set it in a subclass,
+    or on GameECO, before reading games.  Games are not classified when
+    eco_trie is None or the game has a PGN FEN tag.
+
+    The eco, opening, and variation, attributes are None until a move in
+    the main line reaches a line in the opening table.
+
+    """
+
+    eco_trie = None
+
+    def __init__(self):
+        """Extend to initialise the opening classification."""
+        super().__init__()
+        self.eco = None
+        self.opening = None
+        self.variation = None
+        self._eco_node = None
+
+    def set_initial_board_state(self, position_delta):
+        """Extend to start classification at root of trie if possible."""
+        super().set_initial_board_state(position_delta)
+        if self.eco_trie is not None and TAG_FEN not in self._tags:
+            self._eco_node = _ROOT
+
+    def _append_decorated_text(self, movetext):
+        """Extend to follow trie for movetext in main line."""
+        super()._append_decorated_text(movetext)
+        if self._eco_node is not None and len(self._ravstack) == 1:
+            self._follow_eco_trie()
+
+    def _append_decorated_castles_text(self, movetext):
+        """Extend to follow trie for movetext in main line."""
+        super()._append_decorated_castles_text(movetext)
+        if self._eco_node is not None and len(self._ravstack) == 1:
+            self._follow_eco_trie()
+
+    def _follow_eco_trie(self):
+        """Move to child node for latest move and note opening if any."""
+        eco_trie = self.eco_trie
+        node = eco_trie.child(
+            self._eco_node, move_key(self._position_deltas[-1])
+        )
+        self._eco_node = node
+        if node is None:
+            return
+        opening = eco_trie.opening(node)
+        if opening is not None:
+            self.eco, self.opening, self.variation = opening
@@ -42,6 +42,8 @@ from .constants import (
     TP_MOVE,
     TP_PROMOTE_TO_PIECE,
     PGN_NAMED_PIECES,
+    SPLIT_LAN_DESTINATION,
+    SLD_DESTINATION,
 )
 from .game_text_pgn import (
     GameTextPGN,
@@ -49,11 +51,11 @@ from .game_text_pgn import (
     text_format,
     possible_bishop_or_bpawn,
 )
-from .gamedata import generate_fen_for_position
 from .squares import fen_source_squares
 
 disambiguate_promotion_format = re.compile(DISAMBIGUATE_PROMOTION)
 text_promotion_format = re.compile(TEXT_PROMOTION)
+split_lan_destination = re.compile(SPLIT_LAN_DESTINATION)
 
 
 # GameIgnoreCasePGN uses many GameTextPGN methods without extending them.
@@ -78,6 +80,24 @@ class GameIgnoreCasePGN(GameTextPGN):
 
     # Defaults for GameIgnoreCasePGN instance state.
     _promotion_disambiguation_detected = False
+    _peeked_token = None
+    _lookahead_recovery_count = 0
+    _undo_recovery_count = 0
+
+    @property
+    def lookahead_recovery_count(self):
+        """Return number of moves decided by peeking at the next token.
+
+        These are moves like 'e2 e4' which would otherwise be recovered by
+        undoing a PGN error, see undo_recovery_count.
+
+        """
+        return self._lookahead_recovery_count
+
+    @property
+    def undo_recovery_count(self):
+        """Return number of PGN errors undone when processing next token."""
+        return self._undo_recovery_count
 
     # Introduced so self.append_token_after_error() can process possible
     # bishop moves detected by self.append_pawn_move().
@@ -90,6 +110,7 @@ class GameIgnoreCasePGN(GameTextPGN):
         """
 
     def _undo_append_token_and_set_error(self):
+        self._undo_recovery_count += 1
         self._state = None
         self._state_stack[-1] = self._state
         self._error_list.pop()
@@ -111,7 +132,21 @@ class GameIgnoreCasePGN(GameTextPGN):
 
         Otherwise delegate to superclass to apply the token in error context.
 
+        A token already used when peeking ahead from the preceeding token,
+        to give a move which is not legal, is ignored.  It is appended if
+        the preceeding token was a possible bishop or b-pawn move.  This is
+        what happens when the error is undone instead of peeking ahead.
+
         """
+        peeked_token = self._peeked_token
+        if peeked_token is not None:
+            del self._peeked_token
+            if match.start() == peeked_token[0]:
+                if peeked_token[1]:
+                    # Ignore method in GameTextPGN class.
+                    # Pylint reports bad-super-call.
+                    super(GameTextPGN, self).append_token_after_error(match)
+                return
         if self._bishop_or_bpawn:
             if self._append_recovered_bishop_or_bpawn_move(match):
                 if self._full_disambiguation_detected:
@@ -276,14 +311,7 @@ class GameIgnoreCasePGN(GameTextPGN):
                 self.append_token_and_set_error(match)
                 return
             self._movetext_offset = len(self._text)
-        fen = generate_fen_for_position(
-            self._piece_placement_data.values(),
-            self._active_color,
-            self._castling_availability,
-            self._en_passant_target_square,
-            self._halfmove_clock,
-            self._fullmove_number,
-        )
+        fen = self.get_fen_for_position()
         setup = import_format.match('[SetUp"1"]')
         fen = import_format.match(fen.join(('[FEN"', '"]')))
         bishop_move = GameTextPGN()
@@ -460,6 +488,14 @@ class GameIgnoreCasePGN(GameTextPGN):
         # self._state is None and self._bishop_or_bpawn will have been set
         # by self.append_other_or_disambiguation_pgn().
         assert self._state is None
+
+        # The token was used when peeking ahead from the preceeding token.
+        peeked_token = self._peeked_token
+        if peeked_token is not None:
+            del self._peeked_token
+            if match.start() == peeked_token[0]:
+                return
+
         if self._bishop_or_bpawn:
             bishop = text_format.match(
                 self._bishop_or_bpawn.group().upper() + match.group().lower()
@@ -511,6 +547,8 @@ class GameIgnoreCasePGN(GameTextPGN):
             del self._full_disambiguation_detected
             self._bishop_or_bpawn = None
             return
+        elif self._append_split_long_algebraic_notation_move(match, mgl):
+            return
         else:
             self._long_algebraic_notation_pawn_move(text_format.match(mgl))
             if self._state is not None:
@@ -592,13 +630,99 @@ class GameIgnoreCasePGN(GameTextPGN):
         super(GameTextPGN, self).append_pawn_promote_move(promotion_match)
         self._bishop_or_bpawn = None
 
+    def _append_split_long_algebraic_notation_move(self, match, mgl):
+        """Return True if match and the square token after it are applied.
+
+        mgl is match in lower case, the name of an occupied square, which is
+        not a move.  Movetext like 'e2 e4' is two tokens, so peek at the text
+        after match for the destination square and decide the move before
+        appending match as a PGN error which the next token would undo.
+
+        The peeked token is remembered so it can be ignored when consumed.
+
+        """
+        peek = split_lan_destination.match(match.string, match.end())
+        if peek is None:
+            return False
+        square = peek.group(SLD_DESTINATION)
+        bishop_or_bpawn = possible_bishop_or_bpawn.match(match.group())
+        if bishop_or_bpawn:
+            recovery = self._bishop_or_bpawn_recovery(
+                bishop_or_bpawn.group(), square
+            )
+            if not recovery or recovery[0] is None:
+                return False
+
+            # As if match had been appended as a PGN error.
+            self._bishop_or_bpawn = bishop_or_bpawn
+            recovery[0](recovery[1])
+            if self._state is None:
+                if self._full_disambiguation_detected:
+                    del self._full_disambiguation_detected
+                self._bishop_or_bpawn = None
+        else:
+            piece = self._piece_placement_data[mgl]
+            if self._active_color == FEN_WHITE_ACTIVE:
+                pawn = FEN_WHITE_PAWN
+            else:
+                pawn = FEN_BLACK_PAWN
+            if piece.color != self._active_color or piece.name != pawn:
+                return False
+            square = square.lower()
+            if not text_format.match(LAN_MOVE_SEPARATOR.join((mgl, square))):
+                return False
+            pgn_match = import_format.match(mgl + square)
+            if not pgn_match or pgn_match.lastindex != IFG_PAWN_TO_RANK:
+                return False
+            # Ignore method in GameTextPGN class.
+            # Pylint reports bad-super-call.
+            super(GameTextPGN, self).append_pawn_move(pgn_match)
+            self._bishop_or_bpawn = None
+        self._peeked_token = (
+            peek.start(SLD_DESTINATION),
+            bishop_or_bpawn is not None,
+        )
+        self._lookahead_recovery_count += 1
+        return True
+
     def _append_recovered_bishop_or_bpawn_move(self, match):
         """Return True if match is resolved to a bishop or b-pawn move."""
-        mgt = match.group().lower()
+        recovery = self._bishop_or_bpawn_recovery(
+            self._bishop_or_bpawn.group(), match.group()
+        )
+        if recovery is None:
+            self.append_token_and_set_error(match)
+
+        # This looks equivalent to doing nothing, but if removed leads to
+        # an exception in _append_pawn_move at 'if mgl[0] != mgl[3]:'.
+        # Without the adjustment to self._text[-1] the text from match
+        # appears in two adjacent self._text elements.
+        elif recovery[0] is None:
+            error_text = self._text[-1]
+            self._undo_append_token_and_set_error()
+            self.append_token_and_set_error(match)
+            self._text[-1] = error_text
+
+        else:
+            self._undo_append_token_and_set_error()
+            recovery[0](recovery[1])
+        return bool(self._state is None)
+
+    def _bishop_or_bpawn_recovery(self, bishop_or_bpawn, token):
+        """Return method and match to apply bishop_or_bpawn and token as move.
+
+        Return None if the tokens cannot be a bishop or b-pawn move, and
+        (None, None) if they can be either but neither is legal.
+
+        The game is not changed so the decision can be made before the first
+        token is appended as a PGN error.
+
+        """
+        mgt = token.lower()
         promotion_match = text_format.match(
             LAN_MOVE_SEPARATOR.join(
                 (
-                    self._bishop_or_bpawn.group().lower(),
+                    bishop_or_bpawn.lower(),
                     mgt[:-1] + mgt[-1].upper(),
                 )
             )
@@ -613,11 +737,9 @@ class GameIgnoreCasePGN(GameTextPGN):
         ):
             mgt = LAN_MOVE_SEPARATOR + mgt
         bishop_match = text_format.match(
-            "".join((self._bishop_or_bpawn.group().upper(), mgt))
-        )
-        pawn_match = text_format.match(
-            "".join((self._bishop_or_bpawn.group().lower(), mgt))
+            "".join((bishop_or_bpawn.upper(), mgt))
         )
+        pawn_match = text_format.match("".join((bishop_or_bpawn.lower(), mgt)))
         bishop_lastindex = (
             bishop_match and bishop_match.lastindex == IFG_PIECE_DESTINATION
         )
@@ -627,18 +749,9 @@ class GameIgnoreCasePGN(GameTextPGN):
 
         # Try the available matches.
         if promotion_lastindex:
-            self._undo_append_token_and_set_error()
-            super().append_pawn_promote_move(promotion_match)
-            self._bishop_or_bpawn = None
-        elif bishop_lastindex and pawn_lastindex:
-            fen = generate_fen_for_position(
-                self._piece_placement_data.values(),
-                self._active_color,
-                self._castling_availability,
-                self._en_passant_target_square,
-                self._halfmove_clock,
-                self._fullmove_number,
-            )
+            return self._append_recovered_pawn_promote_move, promotion_match
+        if bishop_lastindex and pawn_lastindex:
+            fen = self.get_fen_for_position()
             setup = import_format.match('[SetUp"1"]')
             fen = import_format.match(fen.join(('[FEN"', '"]')))
             bishop_move = GameTextPGN()
@@ -650,38 +763,23 @@ class GameIgnoreCasePGN(GameTextPGN):
             pawn_move.append_start_tag(fen)
             pawn_move.append_pawn_move(pawn_match)
             if bishop_move.state is None and pawn_move.state is None:
-                if match.group()[0].isupper():
-                    self._undo_append_token_and_set_error()
-                    super().append_piece_move(bishop_match)
-                else:
-                    self._undo_append_token_and_set_error()
-                    self._append_pawn_move(pawn_match)
-            elif bishop_move.state is None:
-                self._undo_append_token_and_set_error()
-                super().append_piece_move(bishop_match)
-            elif pawn_move.state is None:
-                self._undo_append_token_and_set_error()
-                self._append_pawn_move(pawn_match)
-
-            # This looks equivalent to doing nothing, but if removed leads to
-            # an exception in _append_pawn_move at 'if mgl[0] != mgl[3]:'.
-            # Without the adjustment to self._text[-1] the text from match
-            # appears in two adjacent self._text elements.
-            else:
-                error_text = self._text[-1]
-                self._undo_append_token_and_set_error()
-                self.append_token_and_set_error(match)
-                self._text[-1] = error_text
+                if token[0].isupper():
+                    return super().append_piece_move, bishop_match
+                return self._append_pawn_move, pawn_match
+            if bishop_move.state is None:
+                return super().append_piece_move, bishop_match
+            if pawn_move.state is None:
+                return self._append_pawn_move, pawn_match
+            return None, None
+        if pawn_lastindex:
+            return self._append_pawn_move, pawn_match
+        if bishop_lastindex:
+            return super().append_piece_move, bishop_match
+        return None
 
-        elif pawn_lastindex:
-            self._undo_append_token_and_set_error()
-            self._append_pawn_move(pawn_match)
-        elif bishop_lastindex:
-            self._undo_append_token_and_set_error()
-            super().append_piece_move(bishop_match)
-        else:
-            self.append_token_and_set_error(match)
-        return bool(self._state is None)
+    def _append_recovered_pawn_promote_move(self, match):
+        super().append_pawn_promote_move(match)
+        self._bishop_or_bpawn = None
 
     def _append_pawn_move(self, match):
         mgl = match.group()
@@ -708,14 +806,7 @@ class GameIgnoreCasePGN(GameTextPGN):
     # B[1-8][xX] and b[1-8xX] are intended targets.
     # Others seem covered already.
     def _append_bishop_or_bpawn_capture(self, match):
-        fen = generate_fen_for_position(
-            self._piece_placement_data.values(),
-            self._active_color,
-            self._castling_availability,
-            self._en_passant_target_square,
-            self._halfmove_clock,
-            self._fullmove_number,
-        )
+        fen = self.get_fen_for_position()
         mgt = match.group().lower()
         bishop_match = text_format.match("".join((mgt[0].upper(), mgt[1:])))
         if PGN_PROMOTION in mgt:
@@ -756,14 +847,7 @@ class GameIgnoreCasePGN(GameTextPGN):
             self.append_token_and_set_error(match)
 
     def _append_bishop_or_bpawn_move(self, match):
-        fen = generate_fen_for_position(
-            self._piece_placement_data.values(),
-            self._active_color,
-            self._castling_availability,
-            self._en_passant_target_square,
-            self._halfmove_clock,
-            self._fullmove_number,
-        )
+        fen = self.get_fen_for_position()
         mgt = match.group().lower()
         bishop_match = text_format.match(
             "".join((mgt[0].upper(), mgt[1:].replace(LAN_MOVE_SEPARATOR, "")))
@@ -14,14 +14,18 @@ from .constants import (
     FEN_NULL,
     FEN_WHITE_PAWN,
     FEN_BLACK_PAWN,
+    FEN_WHITE_QUEEN,
+    FEN_BLACK_QUEEN,
+    FEN_WHITE_ROOK,
+    FEN_BLACK_ROOK,
+    FEN_WHITE_BISHOP,
+    FEN_BLACK_BISHOP,
     FEN_WHITE_KNIGHT,
     FEN_BLACK_KNIGHT,
     PGN_CAPTURE_MOVE,
     FEN_PAWNS,
     SIDE_TO_MOVE_KING,
-    PIECE_TO_KING,
     PGN_KING,
-    PGN_KNIGHT,
 )
 from .game import Game
 from .squares import (
@@ -75,220 +79,193 @@ class GameIndicateCheck(Game):
             self._text[-1] += "#" if self._is_position_checkmate() else "+"
 
     def _is_position_checkmate(self):
-        """Return True if the side to move is checkmated."""
-        piece_placement_data = self._piece_placement_data.copy()
-        pieces_on_board = self._pieces_on_board
-        side_to_move_king = SIDE_TO_MOVE_KING[self._active_color]
-        king_square = pieces_on_board[side_to_move_king][0].square.name
-        escape_squares = source_squares[PGN_KING][king_square]
+        """Return True if the side to move is checkmated.
+
+        The king can escape to any adjacent square not occupied by a piece
+        of its own side and not attacked with the king removed from the
+        board, so squares behind the king on the line of a check are seen
+        as attacked.  Most checks are met this way and the pieces giving
+        check are not looked for.
+
+        Otherwise a single check is met if a piece not pinned to the king
+        can capture the checking piece or move to a square between it and
+        the king.  A pinned piece cannot do either.
+
+        """
+        ppd = self._piece_placement_data
         active_color = self._active_color
+        king_square = self._pieces_on_board[SIDE_TO_MOVE_KING[active_color]][
+            0
+        ].square.name
 
         # Be sure to put king back!
-        del self._piece_placement_data[king_square]
-
-        # Can king avoid check by moving?
-        # Test all possible destination squares without putting king on them.
-        for sqr in escape_squares:
-            if sqr not in piece_placement_data:
-                if not self.is_square_attacked_by_other_side(
-                    sqr, active_color
-                ):
-                    self._piece_placement_data[king_square] = (
-                        piece_placement_data[king_square]
-                    )
-                    return False
-            elif (
-                PIECE_TO_KING[piece_placement_data[sqr].name]
-                != side_to_move_king
-            ):
+        king = ppd.pop(king_square)
+        try:
+            for sqr in source_squares[PGN_KING][king_square]:
+                piece = ppd.get(sqr)
+                if piece is not None and piece.color == active_color:
+                    continue
                 if not self.is_square_attacked_by_other_side(
                     sqr, active_color
                 ):
-                    self._piece_placement_data[king_square] = (
-                        piece_placement_data[king_square]
-                    )
                     return False
+        finally:
+            ppd[king_square] = king
 
-        # Put king back.
-        self._piece_placement_data[king_square] = piece_placement_data[
-            king_square
-        ]
-
-        # Can side to move block the check?
-        attack_lines = self._get_attacks_on_square_by_other_side(king_square)
-        if len(attack_lines) > 1:
-            return True
-        if len(attack_lines) == 0:
-            return False
-        if self._legal_move_to_square_exists(
-            attack_lines[0], PGN_CAPTURE_MOVE, king_square
+        checking_squares = self._get_checking_squares(king_square)
+        if len(checking_squares) != 1:
+            return len(checking_squares) > 1
+        checking_square = checking_squares[0]
+        pinned_squares = self.get_pinned_lines_and_check()[0]
+        if self._unpinned_move_to_square_exists(
+            checking_square, PGN_CAPTURE_MOVE, pinned_squares
         ):
             return False
-        ptp = fen_squares[attack_lines[0]].point_to_point.get(king_square)
-        if ptp is not None:
-            for sqr in ptp:
-                if self._legal_move_to_square_exists(sqr, "", king_square):
-                    return False
-            return True
-        ptp = source_squares[PGN_KNIGHT].get(attack_lines[0])
-        if ptp is not None:
-            for sqr in ptp:
-                if self._legal_move_to_square_exists(sqr, "", king_square):
-                    return False
-            return True
-        return False
-
-    def _get_attacks_on_square_by_other_side(self, square):
-        """Return list of attacking squares.
+        for sqr in fen_squares[checking_square].point_to_point.get(
+            king_square, ()
+        ):
+            if self._unpinned_move_to_square_exists(sqr, "", pinned_squares):
+                return False
+        return not self._en_passant_capture_of_checking_pawn_exists(
+            checking_square, king_square
+        )
 
-        This method is intended for deciding if a check is checkmate, so the
-        list is returned early if it's length reaches two because a single
-        move cannot block checks from two squares.
+    def _get_checking_squares(self, king_square):
+        """Return squares of pieces of side not to move attacking king_square.
 
-        It is assumed the king cannot escape check by moving itself.
+        Unlike is_square_attacked_by_other_side all the attacking pieces are
+        found.
 
         """
-        piece_placement_data = self._piece_placement_data
+        ppd = self._piece_placement_data
         active_color = self._active_color
-        attacking_squares = []
-
-        for square_list in fen_squares[square].attack_lines():
+        checking_squares = []
+        for square_list in fen_squares[king_square].attack_lines():
             for sqr in square_list:
-                if sqr not in piece_placement_data:
+                if sqr not in ppd:
                     continue
-                piece = piece_placement_data[sqr]
-                if piece.color == active_color:
-                    break
-                sources = fen_source_squares.get(piece.name)
-                if sources is None or sqr not in sources.get(square, ""):
-                    break
-                attacking_squares.append(sqr)
-                if len(attacking_squares) > 1:
-                    return attacking_squares
+                piece = ppd[sqr]
+                if piece.color != active_color and sqr in fen_source_squares[
+                    piece.name
+                ].get(king_square, ()):
+                    checking_squares.append(sqr)
                 break
-
         if active_color == FEN_WHITE_ACTIVE:
-            knight_search = FEN_BLACK_KNIGHT
+            knight = FEN_BLACK_KNIGHT
         else:
-            knight_search = FEN_WHITE_KNIGHT
-        square_list = fen_source_squares[knight_search]
-        # pylint message C0206 'Consider iterating with .items()'.
-        # Evaluating 'square_list[sqr]' is not considered frequent enough.
-        # Changing to 'square_list.keys()' attracts extra C0201 message
-        # 'Consider iterating dictionary directly instead of calling .keys()'.
-        for sqr in square_list:
-            if sqr not in piece_placement_data:
-                continue
-            piece = piece_placement_data[sqr]
-            if piece.color == active_color:
-                break
-            if piece.name == knight_search:
-                if square in square_list[sqr]:
-                    attacking_squares.append(sqr)
-                    if len(attacking_squares) > 1:
-                        return attacking_squares
-
-        return attacking_squares
+            knight = FEN_WHITE_KNIGHT
+        for sqr in fen_source_squares[knight][king_square]:
+            piece = ppd.get(sqr)
+            if piece is not None and piece.name == knight:
+                checking_squares.append(sqr)
+        return checking_squares
 
-    def _legal_move_to_square_exists(self, square, capture, king_square):
-        """Return True if a legal move to square exists.
+    def _unpinned_move_to_square_exists(self, square, capture, pinned_squares):
+        """Return True if a piece of side to move can move to square.
 
-        This method is intended for deciding if a check is checkmate, and it
-        is assumed the king cannot move.
+        The king and pieces on pinned_squares are ignored: it is assumed the
+        king cannot capture on square and a pinned piece cannot meet a check.
+        pinned_squares is the pinned piece lines from the
+        get_pinned_lines_and_check method, or any container of the squares
+        of pinned pieces.
 
-        En-passant captures cannot block a check but they can remove a pawn
-        giving check.  Test if en-passant prevents checkmate as last thing
-        because it seems least likely case and the algorithm is unlike any of
-        the other line and point-to-point cases.
+        capture is PGN_CAPTURE_MOVE if square is occupied by the checking
+        piece and "" if square is empty, and decides the pawn moves tried.
 
         """
         ppd = self._piece_placement_data
-        checked_king = ppd[king_square].name
         active_color = self._active_color
-        for from_square, piece in ppd.copy().items():
-            if piece.color != active_color:
-                continue
-            name = piece.name
-            if name == checked_king:
-                continue
-            if name in FEN_PAWNS:
-                name += capture
-                if square in source_squares[name]:
-                    if from_square not in source_squares[name][square]:
-                        continue
-                    ppd_to = ppd.pop(square, None)
-                    ppd_from = ppd.pop(from_square)
-                    ppd[square] = ppd_from
-                    check = self.is_square_attacked_by_other_side(
-                        king_square, active_color
-                    )
-                    del ppd[square]
-                    if ppd_to is not None:
-                        ppd[square] = ppd_to
-                    ppd[from_square] = ppd_from
-                    if not check:
-                        return True
-                continue
-            if from_square in fen_source_squares[name][square]:
-                if name in (FEN_WHITE_KNIGHT, FEN_BLACK_KNIGHT):
-                    ppd_to = ppd.pop(square, None)
-                    ppd_from = ppd.pop(from_square)
-                    ppd[square] = ppd_from
-                    check = self.is_square_attacked_by_other_side(
-                        king_square, active_color
-                    )
-                    del ppd[square]
-                    if ppd_to is not None:
-                        ppd[square] = ppd_to
-                    ppd[from_square] = ppd_from
-                    if not check:
-                        return True
+        for square_list in fen_squares[square].attack_lines():
+            for sqr in square_list:
+                if sqr not in ppd:
                     continue
-                ptp = fen_squares[from_square].point_to_point[square]
-                for line_sq in ptp:
+                piece = ppd[sqr]
+                if (
+                    piece.color == active_color
+                    and piece.name in _SLIDING_PIECES
+                    and sqr not in pinned_squares
+                    and sqr in fen_source_squares[piece.name][square]
+                ):
+                    return True
+                break
+        if active_color == FEN_WHITE_ACTIVE:
+            knight = FEN_WHITE_KNIGHT
+            pawn = FEN_WHITE_PAWN
+        else:
+            knight = FEN_BLACK_KNIGHT
+            pawn = FEN_BLACK_PAWN
+        for sqr in fen_source_squares[knight][square]:
+            piece = ppd.get(sqr)
+            if (
+                piece is not None
+                and piece.name == knight
+                and sqr not in pinned_squares
+            ):
+                return True
+        ptp = fen_squares[square].point_to_point
+        for sqr in source_squares[pawn + capture].get(square, ()):
+            piece = ppd.get(sqr)
+            if (
+                piece is not None
+                and piece.name == pawn
+                and sqr not in pinned_squares
+            ):
+                for line_sq in ptp.get(sqr, ()):
                     if line_sq in ppd:
                         break
                 else:
-                    ppd_to = ppd.pop(square, None)
-                    ppd_from = ppd.pop(from_square)
-                    ppd[square] = ppd_from
-                    check = self.is_square_attacked_by_other_side(
-                        king_square, active_color
-                    )
-                    del ppd[square]
-                    if ppd_to is not None:
-                        ppd[square] = ppd_to
-                    ppd[from_square] = ppd_from
-                    if not check:
-                        return True
-        if capture and self._en_passant_target_square != FEN_NULL:
-            for k, value in en_passant_target_squares[active_color].items():
-                if value != self._en_passant_target_square:
-                    continue
-                if k[0] != square:
-                    continue
-                if active_color == FEN_WHITE_ACTIVE:
-                    pawn = FEN_WHITE_PAWN
-                else:
-                    pawn = FEN_BLACK_PAWN
-                for from_square in fen_source_squares[pawn][
-                    self._en_passant_target_square
-                ]:
-                    piece = ppd.get(from_square)
-                    if piece is None:
-                        continue
-                    if piece.name != pawn:
-                        continue
-                    ppd_to = ppd.pop(square, None)
-                    ppd_from = ppd.pop(from_square)
-                    ppd[self._en_passant_target_square] = ppd_from
-                    check = self.is_square_attacked_by_other_side(
-                        king_square, active_color
-                    )
-                    del ppd[self._en_passant_target_square]
-                    if ppd_to is not None:
-                        ppd[square] = ppd_to
-                    ppd[from_square] = ppd_from
-                    if not check:
-                        return True
+                    return True
         return False
+
+    def _en_passant_capture_of_checking_pawn_exists(
+        self, checking_square, king_square
+    ):
+        """Return True if checking pawn can be captured en-passant.
+
+        The capture is made on the board to test if the king is left in
+        check, which may happen when both pawns leave the king's rank.
+
+        """
+        ep_square = self._en_passant_target_square
+        if ep_square == FEN_NULL:
+            return False
+        ppd = self._piece_placement_data
+        active_color = self._active_color
+        if ppd[checking_square].name not in FEN_PAWNS:
+            return False
+        for key, value in en_passant_target_squares[active_color].items():
+            if value == ep_square and key[0] == checking_square:
+                break
+        else:
+            return False
+        if active_color == FEN_WHITE_ACTIVE:
+            pawn = FEN_WHITE_PAWN
+        else:
+            pawn = FEN_BLACK_PAWN
+        for from_square in fen_source_squares[pawn][ep_square]:
+            piece = ppd.get(from_square)
+            if piece is None or piece.name != pawn:
+                continue
+            captured = ppd.pop(checking_square)
+            ppd[ep_square] = ppd.pop(from_square)
+            check = self.is_square_attacked_by_other_side(
+                king_square, active_color
+            )
+            ppd[from_square] = ppd.pop(ep_square)
+            ppd[checking_square] = captured
+            if not check:
+                return True
+        return False
+
+
+# The pieces which attack along lines of squares.
+_SLIDING_PIECES = frozenset(
+    (
+        FEN_WHITE_QUEEN,
+        FEN_BLACK_QUEEN,
+        FEN_WHITE_ROOK,
+        FEN_BLACK_ROOK,
+        FEN_WHITE_BISHOP,
+        FEN_BLACK_BISHOP,
+    )
+)
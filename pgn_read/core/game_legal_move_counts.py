@@ -0,0 +1,49 @@
+# game_legal_move_counts.py
+# Copyright 2025 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Portable Game Notation (PGN) position and game navigation data structures.
+
+GameLegalMoveCounts extends Game by noting the number of legal moves in each
+position reached in the game score.
+
+"""
+from .game import Game
+
+
+class GameLegalMoveCounts(Game):
+    """Note the count of legal moves in each position in the game score.
+
+    The counts are noted while the game is read, when the board is already
+    in each position, so the moves are not replayed.
+
+    The initial position is followed by the position after each move,
+    including moves in RAVs, in the order the moves appear in the game score:
+    the order of positions yielded by the iter_positions method.
+
+    """
+
+    def __init__(self):
+        """Extend to note legal move counts."""
+        super().__init__()
+        self._legal_move_counts = []
+
+    @property
+    def legal_move_counts(self):
+        """Return list of legal move counts for positions in game score."""
+        return self._legal_move_counts
+
+    def set_initial_board_state(self, position_delta):
+        """Extend to note count of legal moves in initial position."""
+        super().set_initial_board_state(position_delta)
+        self._legal_move_counts.append(len(self.generate_legal_moves()))
+
+    def _append_decorated_text(self, movetext):
+        """Extend to note count of legal moves after movetext is played."""
+        super()._append_decorated_text(movetext)
+        self._legal_move_counts.append(len(self.generate_legal_moves()))
+
+    def _append_decorated_castles_text(self, movetext):
+        """Extend to note count of legal moves after movetext is played."""
+        super()._append_decorated_castles_text(movetext)
+        self._legal_move_counts.append(len(self.generate_legal_moves()))
@@ -62,17 +62,75 @@ from .constants import (
     DEFAULT_SORT_TAG_RESULT_VALUE,
     SEVEN_TAG_ROSTER_DEFAULTS,
     PGN_TOKEN_SEPARATOR,
+    PGN_CAPTURE_MOVE,
+    PGN_PROMOTION,
+    PGN_KING,
+    PGN_O_O,
+    PGN_O_O_O,
+    FEN_TO_PGN,
+    FEN_PAWNS,
+    CASTLING_MOVE_RIGHTS,
+    PROMOTED_PIECE_NAME,
 )
 from .piece import Piece
 from .squares import (
     fen_squares,
     fen_square_names,
+    source_squares,
     fen_source_squares,
     en_passant_target_squares,
 )
 
 white_black_tag_value_format = re.compile(r"\s*([^,.\s]+)")
 KNIGHTS = FEN_WHITE_KNIGHT + FEN_BLACK_KNIGHT
+KINGS = FEN_WHITE_KING + FEN_BLACK_KING
+
+# Pieces of the other side which may give check or pin a piece along a line
+# to the king of the side to move, and pieces which give check from a point.
+OTHER_SIDE_LINE_PIECES = {
+    FEN_WHITE_ACTIVE: (FEN_BLACK_QUEEN, FEN_BLACK_ROOK, FEN_BLACK_BISHOP),
+    FEN_BLACK_ACTIVE: (FEN_WHITE_QUEEN, FEN_WHITE_ROOK, FEN_WHITE_BISHOP),
+}
+OTHER_SIDE_POINT_PIECES = {
+    FEN_WHITE_ACTIVE: (FEN_BLACK_KNIGHT, FEN_BLACK_PAWN),
+    FEN_BLACK_ACTIVE: (FEN_WHITE_KNIGHT, FEN_WHITE_PAWN),
+}
+
+# The lines along which queens, rooks, and bishops, move from each square,
+# nearest square first; and the squares pawns move to from each square: one
+# or two squares forward and the squares attacked.  See _create_move_tables.
+LINE_PIECE_MOVES = {}
+PAWN_ADVANCES = {}
+PAWN_CAPTURES = {}
+
+# The squares used when castling: king, rook, king destination, and rook
+# destination.  The squares between king and rook must be empty, and the
+# king must not pass through, or land on, an attacked square.
+CASTLING_SQUARES = {
+    (side, castles): tuple(FILE_NAMES[file] + rank for file in files)
+    for side, rank in (
+        (FEN_WHITE_ACTIVE, RANK_NAMES[-1]),
+        (FEN_BLACK_ACTIVE, RANK_NAMES[0]),
+    )
+    for castles, files in ((PGN_O_O, (4, 7, 6, 5)), (PGN_O_O_O, (4, 0, 2, 3)))
+}
+
+# Board arrays are lists of 64 items in FEN square order, a8 to h1.
+BOARD_SQUARE_COUNT = len(FILE_NAMES) * len(RANK_NAMES)
+_EMPTY_BOARD = (None,) * BOARD_SQUARE_COUNT
+_EMPTY_SQUARE = "1"
+_EMPTY_SQUARE_RUNS = tuple(
+    (_EMPTY_SQUARE * count, str(count))
+    for count in range(len(FILE_NAMES), 1, -1)
+)
+_RANK_STARTS = range(0, BOARD_SQUARE_COUNT, len(FILE_NAMES))
+
+# Pawns are promoted on arrival at these ranks.
+_PROMOTION_RANKS = RANK_NAMES[0] + RANK_NAMES[-1]
+
+# Tokens, stripped of separators, which start and end a RAV in game score.
+_START_RAV = "("
+_END_RAV = ")"
 
 
 class GameError(Exception):
@@ -100,9 +158,16 @@ class GameData:
     _castling_availability = None
     _active_color = None
 
+    # Latest position delta and pinned piece lines and check flag for the
+    # side to move in the position: see get_pinned_lines_and_check method.
+    _pinned_lines_and_check = None
+
     # Locate position in PGN text file of latest game.
     game_offset = 0
 
+    # Name of limit exceeded if parser.PGN cut off the game.
+    limit_exceeded = None
+
     def __init__(self):
         """Create empty data structure for a game presented in PGN format."""
         # There is 1:1 between self._text and self._position_deltas.
@@ -131,6 +196,11 @@ class GameData:
         # exceeded.
         self._pieces_on_board = {}
 
+        # The Piece instances in self._piece_placement_data indexed by square
+        # number, a8 is 0 and h1 is 63, with None for empty squares.  This is
+        # the order of squares in the piece placement field of a FEN.
+        self._board = list(_EMPTY_BOARD)
+
         # Track and label Recursive Annotation Variations (RAV).
         self._ravstack = []
 
@@ -209,6 +279,11 @@ class GameData:
         """Return _position_deltas tuple of changes between positions."""
         return self._position_deltas
 
+    @property
+    def error_list(self):
+        """Return token offsets of PGN errors in RAVs and the main line."""
+        return self._error_list
+
     @property
     def game_ok(self):
         """Return True if game and all variations have no PGN errors."""
@@ -347,6 +422,21 @@ class GameData:
         ) = self._position_deltas[-1][0][1:]
         del self._position_deltas[-1]
 
+    def unmake_move(self):
+        """Take back the latest move and delete its board state.
+
+        The pieces placed by the move are removed from the board, and the
+        pieces removed by the move are put back, before the board state is
+        deleted by undo_board_state.
+
+        """
+        delta = self._position_deltas[-1]
+        for sn_p_n in delta[1][0]:
+            self.remove_piece_from_board(sn_p_n)
+        for sn_p_n in delta[0][0]:
+            self.place_piece_on_board(sn_p_n)
+        self.undo_board_state()
+
     def is_check_given_by_move(self):
         """Return True if move gives check."""
         piece_placement_data = self._piece_placement_data
@@ -401,20 +491,13 @@ class GameData:
             knight_search = FEN_BLACK_KNIGHT
         else:
             knight_search = FEN_WHITE_KNIGHT
-        square_list = fen_source_squares[knight_search]
-        # pylint message C0206 'Consider iterating with .items()'.
-        # Evaluating 'square_list[sqr]' is not considered frequent enough.
-        # Changing to 'square_list.keys()' attracts extra C0201 message
-        # 'Consider iterating dictionary directly instead of calling .keys()'.
-        for sqr in square_list:
+        # The knight moves from square are the squares from which a knight
+        # attacks square.
+        for sqr in fen_source_squares[knight_search][square]:
             if sqr not in piece_placement_data:
                 continue
-            piece = piece_placement_data[sqr]
-            if piece.color == side:
-                break
-            if piece.name == knight_search:
-                if square in square_list[sqr]:
-                    return True
+            if piece_placement_data[sqr].name == knight_search:
+                return True
 
         return False
 
@@ -460,6 +543,390 @@ class GameData:
                 return True
         return False
 
+    def get_pinned_lines_and_check(self):
+        """Return pinned piece lines and check flag for side to move.
+
+        The pinned piece lines is a dict of the squares of pieces pinned to
+        the king of the side to move, mapped to the set of squares on the
+        line from the king through the pinned piece to the pinning piece:
+        the squares to which the pinned piece may move.  The check flag is
+        True if the king of the side to move is in check.
+
+        A piece not in the dict, other than the king, can move without
+        exposing the king to check if the check flag is False.
+
+        The answer is calculated once for each position.  The position is
+        identified by the latest position delta, which is the same object
+        until the position changes: undo_board_state restores the previous
+        position delta and position.
+
+        """
+        position_deltas = self._position_deltas
+        delta = position_deltas[-1] if position_deltas else None
+        pinned_lines_and_check = self._pinned_lines_and_check
+        if (
+            pinned_lines_and_check is not None
+            and pinned_lines_and_check[0] is delta
+        ):
+            return pinned_lines_and_check[1:]
+        pinned_lines_and_check = (delta,) + self._find_pinned_lines_and_check()
+        self._pinned_lines_and_check = pinned_lines_and_check
+        return pinned_lines_and_check[1:]
+
+    def _find_pinned_lines_and_check(self):
+        """Return pinned piece lines and check flag for side to move.
+
+        Only the lines between the king and the other side's queens, rooks,
+        and bishops, which attack the king on an empty board are examined.
+
+        """
+        side = self._active_color
+        king_square = self._pieces_on_board[SIDE_TO_MOVE_KING[side]][0].square
+        king_square_name = king_square.name
+        point_to_point = king_square.point_to_point
+        piece_placement_data = self._piece_placement_data
+        pieces_on_board = self._pieces_on_board
+        pinned_lines = {}
+        check = False
+        for name in OTHER_SIDE_LINE_PIECES[side]:
+            sources = fen_source_squares[name][king_square_name]
+            for piece in pieces_on_board[name]:
+                square = piece.square.name
+                if square not in sources:
+                    continue
+                line = point_to_point[square]
+                pinned_square = None
+                for between in line:
+                    if between not in piece_placement_data:
+                        continue
+                    if (
+                        pinned_square is not None
+                        or piece_placement_data[between].color != side
+                    ):
+                        break
+                    pinned_square = between
+                else:
+                    if pinned_square is None:
+                        check = True
+                    else:
+                        pinned_lines[pinned_square] = frozenset(
+                            line + (square,)
+                        )
+        if not check:
+            for name in OTHER_SIDE_POINT_PIECES[side]:
+                for square in fen_source_squares[name].get(
+                    king_square_name, ()
+                ):
+                    if square not in piece_placement_data:
+                        continue
+                    if piece_placement_data[square].name == name:
+                        check = True
+                        break
+        return pinned_lines, check
+
+    def legal_moves(self):
+        """Return list of legal moves, as PGN movetext, in current position.
+
+        The movetext is in PGN export format without check indicators.
+
+        """
+        return [move[0] for move in self.generate_legal_moves()]
+
+    def generate_legal_moves(self):
+        """Return list of (movetext, modify, arguments) for legal moves.
+
+        movetext is the move in PGN export format without check indicators,
+        and modify(*arguments) makes the move on the board: modify is one of
+        the _modify_game_state_* methods.  unmake_move() takes back the move.
+
+        A move by a piece other than the king is legal if the king is not in
+        check and the piece is not pinned to the king, or it moves along the
+        line of the pin.  Otherwise, and for en passant captures, the move
+        is made and taken back to see if the king is left in check.
+
+        """
+        side = self._active_color
+        piece_placement_data = self._piece_placement_data
+        pinned_lines, check = self.get_pinned_lines_and_check()
+        if side == FEN_WHITE_ACTIVE:
+            fullmove_number = self._fullmove_number
+        else:
+            fullmove_number = self._fullmove_number + 1
+        moves = []
+
+        # Piece moves are collected by piece name and destination to decide
+        # the disambiguation needed in movetext.
+        piece_moves = {}
+        for square, piece in list(piece_placement_data.items()):
+            if piece.color != side:
+                continue
+            name = piece.name
+            if name in KINGS:
+                continue
+            pinned_line = pinned_lines.get(square)
+            if name in FEN_PAWNS:
+                self._append_legal_pawn_moves(
+                    moves, piece, pinned_line, check, fullmove_number
+                )
+                continue
+            lines = LINE_PIECE_MOVES.get(name)
+            if lines is None:
+                destinations = [
+                    sqr
+                    for sqr in fen_source_squares[name][square]
+                    if sqr not in piece_placement_data
+                    or piece_placement_data[sqr].color != side
+                ]
+            else:
+                destinations = []
+                for line in lines[square]:
+                    for sqr in line:
+                        if sqr not in piece_placement_data:
+                            destinations.append(sqr)
+                            continue
+                        if piece_placement_data[sqr].color != side:
+                            destinations.append(sqr)
+                        break
+            for destination in destinations:
+                if pinned_line is not None and destination not in pinned_line:
+                    continue
+                if destination in piece_placement_data:
+                    modify = self._modify_game_state_piece_capture
+                    arguments = (
+                        (
+                            (
+                                destination,
+                                piece_placement_data[destination],
+                            ),
+                            (square, piece),
+                        ),
+                        ((destination, piece),),
+                        fullmove_number,
+                    )
+                else:
+                    modify = self._modify_game_state_piece_move
+                    arguments = (
+                        ((square, piece),),
+                        ((destination, piece),),
+                        fullmove_number,
+                    )
+                if check and not self._is_move_legal(modify, arguments):
+                    continue
+                piece_moves.setdefault((name, destination), []).append(
+                    (square, modify, arguments)
+                )
+        for (name, destination), candidates in piece_moves.items():
+            pgn_name = FEN_TO_PGN[name]
+            for square, modify, arguments in candidates:
+                if len(candidates) == 1:
+                    from_square = ""
+                elif [c[0][0] for c in candidates].count(square[0]) == 1:
+                    from_square = square[0]
+                elif [c[0][1] for c in candidates].count(square[1]) == 1:
+                    from_square = square[1]
+                else:
+                    from_square = square
+                if len(arguments[0]) == 2:
+                    from_square += PGN_CAPTURE_MOVE
+                moves.append(
+                    (
+                        pgn_name + from_square + destination,
+                        modify,
+                        arguments,
+                    )
+                )
+        self._append_legal_king_moves(moves, check, fullmove_number)
+        return moves
+
+    def _is_move_legal(self, modify, arguments):
+        """Return True if modify(*arguments) does not leave king in check."""
+        modify(*arguments)
+        legal = not self.is_side_off_move_in_check()
+        self.unmake_move()
+        return legal
+
+    def _append_legal_pawn_moves(
+        self, moves, piece, pinned_line, check, fullmove_number
+    ):
+        """Append legal moves by pawn piece to moves.
+
+        See generate_legal_moves for pinned_line, check, and fullmove_number.
+
+        """
+        side = self._active_color
+        piece_placement_data = self._piece_placement_data
+        name = piece.name
+        square = piece.square.name
+        candidates = []
+        for destination in PAWN_ADVANCES[name][square]:
+            if destination in piece_placement_data:
+                break
+            candidates.append((destination, ((square, piece),), destination))
+        for destination in PAWN_CAPTURES[name][square]:
+            captured = piece_placement_data.get(destination)
+            if captured is not None and captured.color != side:
+                candidates.append(
+                    (
+                        destination,
+                        ((destination, captured), (square, piece)),
+                        square[0] + PGN_CAPTURE_MOVE + destination,
+                    )
+                )
+        for destination, remove, movetext in candidates:
+            if pinned_line is not None and destination not in pinned_line:
+                continue
+            if destination[1] in _PROMOTION_RANKS:
+                if len(remove) == 2:
+                    modify = self._modify_game_state_pawn_promote_capture
+                else:
+                    modify = self._modify_game_state_pawn_promote
+                for pgn_name, promoted_name in PROMOTED_PIECE_NAME[
+                    side
+                ].items():
+                    arguments = (
+                        remove,
+                        (
+                            (
+                                destination,
+                                piece.promoted_pawn(
+                                    promoted_name, destination
+                                ),
+                            ),
+                        ),
+                        fullmove_number,
+                    )
+                    if check and not self._is_move_legal(modify, arguments):
+                        break
+                    moves.append(
+                        (
+                            movetext + PGN_PROMOTION + pgn_name,
+                            modify,
+                            arguments,
+                        )
+                    )
+                continue
+            if len(remove) == 2:
+                modify = self._modify_game_state_pawn_capture
+                arguments = (remove, ((destination, piece),), fullmove_number)
+            else:
+                modify = self._modify_game_state_pawn_move
+                arguments = (
+                    remove,
+                    ((destination, piece),),
+                    fullmove_number,
+                    en_passant_target_squares[OTHER_SIDE[side]].get(
+                        (destination, square), FEN_NULL
+                    ),
+                )
+            if check and not self._is_move_legal(modify, arguments):
+                continue
+            moves.append((movetext, modify, arguments))
+
+        # En passant captures may expose the king to check along the rank
+        # of the two pawns, so are always tried on the board.
+        destination = self._en_passant_target_square
+        if destination not in PAWN_CAPTURES[name][square]:
+            return
+        movetext = square[0] + PGN_CAPTURE_MOVE + destination
+        capture_square = en_passant_target_squares[movetext]
+        captured = piece_placement_data.get(capture_square)
+        if captured is None or FEN_PAWNS.get(captured.name) == side:
+            return
+        modify = self._modify_game_state_pawn_capture
+        arguments = (
+            ((capture_square, captured), (square, piece)),
+            ((destination, piece),),
+            fullmove_number,
+        )
+        if self._is_move_legal(modify, arguments):
+            moves.append((movetext, modify, arguments))
+
+    def _append_legal_king_moves(self, moves, check, fullmove_number):
+        """Append legal king moves, including castling, to moves.
+
+        See generate_legal_moves for check and fullmove_number.
+
+        """
+        side = self._active_color
+        piece_placement_data = self._piece_placement_data
+        king = self._pieces_on_board[SIDE_TO_MOVE_KING[side]][0]
+        square = king.square.name
+
+        # The king is taken off the board so squares on the far side of the
+        # king from a line piece giving check are seen as attacked.
+        del piece_placement_data[square]
+        try:
+            for destination in fen_source_squares[king.name][square]:
+                captured = piece_placement_data.get(destination)
+                if captured is not None and captured.color == side:
+                    continue
+                if self.is_square_attacked_by_other_side(destination, side):
+                    continue
+                if captured is None:
+                    moves.append(
+                        (
+                            PGN_KING + destination,
+                            self._modify_game_state_piece_move,
+                            (
+                                ((square, king),),
+                                ((destination, king),),
+                                fullmove_number,
+                            ),
+                        )
+                    )
+                else:
+                    moves.append(
+                        (
+                            PGN_KING + PGN_CAPTURE_MOVE + destination,
+                            self._modify_game_state_piece_capture,
+                            (
+                                ((destination, captured), (square, king)),
+                                ((destination, king),),
+                                fullmove_number,
+                            ),
+                        )
+                    )
+        finally:
+            piece_placement_data[square] = king
+        if check:
+            return
+        castling_availability = self._castling_availability
+        for castles in (PGN_O_O, PGN_O_O_O):
+            if (
+                CASTLING_MOVE_RIGHTS[side, castles]
+                not in castling_availability
+            ):
+                continue
+            king_square, rook_square, king_destination, rook_destination = (
+                CASTLING_SQUARES[side, castles]
+            )
+            if king_square != square:
+                continue
+            rook = piece_placement_data.get(rook_square)
+            if rook is None or rook.color != side:
+                continue
+            if any(
+                sqr in piece_placement_data
+                for sqr in fen_squares[square].point_to_point[rook_square]
+            ):
+                continue
+            if any(
+                self.is_square_attacked_by_other_side(sqr, side)
+                for sqr in (king_destination, rook_destination)
+            ):
+                continue
+            moves.append(
+                (
+                    castles,
+                    self._modify_game_state_castles,
+                    (
+                        ((square, king), (rook_square, rook)),
+                        ((king_destination, king), (rook_destination, rook)),
+                        fullmove_number,
+                    ),
+                )
+            )
+
     def set_initial_position(self):
         """Initialise board state, using PGN FEN tag if there is one.
 
@@ -763,12 +1230,13 @@ class GameData:
             self._castling_availability = FEN_INITIAL_CASTLING
             self._halfmove_clock = 0
             self._fullmove_number = 1
+        squares = self._board
+        squares[:] = _EMPTY_BOARD
+        for piece in board:
+            squares[piece.square.number] = piece
         self.set_initial_board_state(
             (
-                tuple(
-                    (p, p.square.name)
-                    for p in self._piece_placement_data.values()
-                ),
+                tuple(squares),
                 self._active_color,
                 self._castling_availability,
                 self._en_passant_target_square,
@@ -788,6 +1256,7 @@ class GameData:
 
         """
         del self._piece_placement_data[sn_p_n[0]]
+        self._board[fen_squares[sn_p_n[0]].number] = None
 
     def remove_piece_from_board(self, sn_p_n):
         """Remove piece from board as part of making a move.
@@ -821,6 +1290,7 @@ class GameData:
                 )
             )
         del piece_placement_data[square]
+        self._board[piece.square.number] = None
 
     def place_piece_on_square(self, sn_p_n):
         """Place piece on square as part of making a move.
@@ -833,8 +1303,10 @@ class GameData:
         active_color is changed after a move is completed.
 
         """
-        self._piece_placement_data[sn_p_n[0]] = sn_p_n[1]
-        sn_p_n[1].set_square(sn_p_n[0])
+        piece = sn_p_n[1]
+        self._piece_placement_data[sn_p_n[0]] = piece
+        piece.set_square(sn_p_n[0])
+        self._board[piece.square.number] = piece
 
     def place_piece_on_board(self, sn_p_n):
         """Place piece on board as part of making a move.
@@ -853,6 +1325,7 @@ class GameData:
         piece = sn_p_n[1]
         self._piece_placement_data[sn_p_n[0]] = piece
         piece.set_square(sn_p_n[0])
+        self._board[piece.square.number] = piece
         pieces_on_board = self._pieces_on_board
         name = piece.name
         if name == FEN_WHITE_PAWN:
@@ -862,6 +1335,59 @@ class GameData:
         else:
             pieces_on_board[name].append(piece)
 
+    def restore_board_snapshot(self, board_snapshot):
+        """Set board to board_snapshot, a tuple in board array order.
+
+        Only the squares where the board and board_snapshot differ are
+        changed, so entering and leaving a RAV of a few moves is cheap.
+
+        """
+        squares = self._board
+        changed = [
+            number
+            for number, piece in enumerate(board_snapshot)
+            if piece is not squares[number]
+        ]
+        piece_placement_data = self._piece_placement_data
+        pieces_on_board = self._pieces_on_board
+
+        # Remove all changed pieces before placing any because a piece may
+        # be on a changed square in both the board and board_snapshot.
+        for number in changed:
+            piece = squares[number]
+            if piece is None:
+                continue
+            del piece_placement_data[piece.square.name]
+            if piece.name == FEN_WHITE_PAWN:
+                pieces_on_board[piece.square.file + FEN_WHITE_PAWN].remove(
+                    piece
+                )
+            elif piece.name == FEN_BLACK_PAWN:
+                pieces_on_board[piece.square.file + FEN_BLACK_PAWN].remove(
+                    piece
+                )
+            else:
+                pieces_on_board[piece.name].remove(piece)
+            squares[number] = None
+        for number in changed:
+            piece = board_snapshot[number]
+            if piece is None:
+                continue
+            square = fen_square_names[number]
+            piece_placement_data[square] = piece
+            piece.set_square(square)
+            squares[number] = piece
+            if piece.name == FEN_WHITE_PAWN:
+                pieces_on_board[piece.square.file + FEN_WHITE_PAWN].append(
+                    piece
+                )
+            elif piece.name == FEN_BLACK_PAWN:
+                pieces_on_board[piece.square.file + FEN_BLACK_PAWN].append(
+                    piece
+                )
+            else:
+                pieces_on_board[piece.name].append(piece)
+
     def set_position_to_play_first_rav_at_move(self):
         """Set position to play first move of first RAV for move.
 
@@ -900,16 +1426,7 @@ class GameData:
                 self.place_piece_on_board(place[0][0])
                 self.place_piece_on_square(place[0][1])
 
-        self._ravstack[-1].extend(
-            (
-                tuple(
-                    (p, p.square.name)
-                    for p in self._piece_placement_data.values()
-                ),
-                remove,
-                place,
-            )
-        )
+        self._ravstack[-1].extend((tuple(self._board), remove, place))
         self.set_board_state(((self._ravstack[-1][1],) + place[1:],))
         (
             self._active_color,
@@ -929,49 +1446,14 @@ class GameData:
         adjacent to the same '('.
 
         """
-        rav_piece_placement_data = self._position_deltas[-1][0][0]
-        pieces_on_board = self._pieces_on_board
-        for val in pieces_on_board.values():
-            val.clear()
-        piece_placement_data = self._piece_placement_data
-        piece_placement_data.clear()
-        for piece, square in rav_piece_placement_data:
-            piece_placement_data[square] = piece
-            piece.set_square(square)
-            if piece.name == FEN_WHITE_PAWN:
-                pieces_on_board[piece.square.file + FEN_WHITE_PAWN].append(
-                    piece
-                )
-            elif piece.name == FEN_BLACK_PAWN:
-                pieces_on_board[piece.square.file + FEN_BLACK_PAWN].append(
-                    piece
-                )
-            else:
-                pieces_on_board[piece.name].append(piece)
+        self.restore_board_snapshot(self._position_deltas[-1][0][0])
         self.repeat_board_state()
         self._ravstack[-1].extend((self._position_deltas[-1][0], None, None))
 
     def set_position_to_play_main_line_at_move(self):
         """Set position associated with end_of_rav token."""
-        rav_piece_placement_data, place, remove = self._ravstack[-1][1:]
-        pieces_on_board = self._pieces_on_board
-        for val in pieces_on_board.values():
-            val.clear()
-        piece_placement_data = self._piece_placement_data
-        piece_placement_data.clear()
-        for piece, square in rav_piece_placement_data:
-            piece_placement_data[square] = piece
-            piece.set_square(square)
-            if piece.name == FEN_WHITE_PAWN:
-                pieces_on_board[piece.square.file + FEN_WHITE_PAWN].append(
-                    piece
-                )
-            elif piece.name == FEN_BLACK_PAWN:
-                pieces_on_board[piece.square.file + FEN_BLACK_PAWN].append(
-                    piece
-                )
-            else:
-                pieces_on_board[piece.name].append(piece)
+        board_snapshot, place, remove = self._ravstack[-1][1:]
+        self.restore_board_snapshot(board_snapshot)
         if len(place[0]) == len(remove[0]):
             # If these two piece names are different the source move was a pawn
             # promotion: remove and place the pieces on the board rather than
@@ -1010,10 +1492,7 @@ class GameData:
         self.set_board_state(
             (
                 (
-                    tuple(
-                        (p, p.square.name)
-                        for p in self._piece_placement_data.values()
-                    ),
+                    tuple(self._board),
                     self._active_color,
                     self._castling_availability,
                     self._en_passant_target_square,
@@ -1025,39 +1504,19 @@ class GameData:
 
     def set_position_to_play_prior_right_nested_rav_at_move(self):
         """Set position for end_of_rav token of right-nested RAV."""
-        rav_piece_placement_data = self._ravstack[-1][1]
-        pieces_on_board = self._pieces_on_board
-        for val in pieces_on_board.values():
-            val.clear()
-        piece_placement_data = self._piece_placement_data
-        piece_placement_data.clear()
-        for piece, square in rav_piece_placement_data[0]:
-            piece_placement_data[square] = piece
-            piece.set_square(square)
-            if piece.name == FEN_WHITE_PAWN:
-                pieces_on_board[piece.square.file + FEN_WHITE_PAWN].append(
-                    piece
-                )
-            elif piece.name == FEN_BLACK_PAWN:
-                pieces_on_board[piece.square.file + FEN_BLACK_PAWN].append(
-                    piece
-                )
-            else:
-                pieces_on_board[piece.name].append(piece)
+        rav_position = self._ravstack[-1][1]
+        self.restore_board_snapshot(rav_position[0])
         (
             self._active_color,
             self._castling_availability,
             self._en_passant_target_square,
             self._halfmove_clock,
             self._fullmove_number,
-        ) = rav_piece_placement_data[1:]
+        ) = rav_position[1:]
         self.set_board_state(
             (
                 (
-                    tuple(
-                        (p, p.square.name)
-                        for p in self._piece_placement_data.values()
-                    ),
+                    tuple(self._board),
                     self._active_color,
                     self._castling_availability,
                     self._en_passant_target_square,
@@ -1304,6 +1763,156 @@ class GameData:
             return []
         return self._text[self._movetext_offset :]
 
+    def get_fen_for_position(self):
+        """Return Forsyth Edwards Notation (FEN) for current position."""
+        return generate_fen_for_board(
+            self._board,
+            self._active_color,
+            self._castling_availability,
+            self._en_passant_target_square,
+            self._halfmove_clock,
+            self._fullmove_number,
+        )
+
+    def get_epd_for_position(self):
+        """Return Extended Position Description (EPD) for current position.
+
+        The four position fields are returned, without any operations.
+
+        """
+        return generate_epd_for_board(
+            self._board,
+            self._active_color,
+            self._castling_availability,
+            self._en_passant_target_square,
+        )
+
+    def iter_positions(self, epd=False):
+        """Yield (ply, path, movetext, FEN) for each position in game score.
+
+        The initial position is followed by the position after each move,
+        including moves in RAVs, in the order the moves appear in the game
+        score.  The positions are built by replaying the position deltas
+        noted when the game was read, so moves are not validated again.
+
+        ply is the number of half moves from the standard starting position
+        to the position: the ply of the move played.  movetext is the token
+        for the move in the game score, or None for the initial position.
+
+        path is a tuple of (ply, number) pairs, one for each RAV containing
+        the move starting with the outermost: the RAV is the number'th
+        alternative, counting from 1, to the move at ply in the enclosing
+        line.  The path is () for the main line.
+
+        The fourth item is EPD, without operations, rather than FEN if epd
+        is True: convenient as a key for detecting transpositions.
+
+        Moves after an error are not yielded, but moves in the main line
+        after a RAV containing an error are yielded.
+
+        """
+        if epd:
+            return self._replay_position_deltas(
+                _generate_epd_for_position_fields
+            )
+        return self._replay_position_deltas(generate_fen_for_board)
+
+    def iter_movetext(self):
+        """Yield (ply, path, movetext) for each position in game score.
+
+        The items are the first three of those yielded by iter_positions but
+        the positions are not built.
+
+        """
+        return self._replay_position_deltas(None)
+
+    def _replay_position_deltas(self, position_text):
+        """Yield items for iter_positions or iter_movetext from deltas.
+
+        position_text is the function which gives the FEN or EPD of a board,
+        or None for the iter_movetext items which have no position.
+
+        """
+        initial_position = self._initial_position
+        if initial_position is None:
+            return
+        board = list(initial_position[0])
+        if position_text is None:
+            yield _ply_for_position(initial_position[1:]), (), None
+        else:
+            yield (
+                _ply_for_position(initial_position[1:]),
+                (),
+                None,
+                position_text(board, *initial_position[1:]),
+            )
+
+        # Each item is the path, ply of latest move, and alternatives noted
+        # at each ply, for the RAVs being replayed.
+        lines = [[(), None, {}]]
+        position_deltas = self._position_deltas
+        error_list = self._error_list
+        delta_count = len(position_deltas)
+        delta_index = 0
+        previous_delta = None
+
+        # Tokens after an error do not have a position delta except the ')'
+        # which ends the RAV containing the error.  error_depth counts the
+        # RAVs started after the error.
+        error_depth = None
+        for token_index, token in enumerate(self._text):
+            if error_depth is not None:
+                token = token.strip()
+                if token == _START_RAV:
+                    error_depth += 1
+                    continue
+                if token != _END_RAV:
+                    continue
+                if error_depth:
+                    error_depth -= 1
+                    continue
+                error_depth = None
+            if delta_index == delta_count:
+                return
+            delta = position_deltas[delta_index]
+            delta_index += 1
+            if token_index in error_list:
+                if len(lines) == 1:
+                    return
+                previous_delta = delta
+                error_depth = 0
+                continue
+            if delta is None or delta is previous_delta:
+                continue
+            previous_delta = delta
+            if len(delta) == 1:
+                if position_text is not None:
+                    board[:] = delta[0][0]
+                if token.strip() == _START_RAV:
+                    line = lines[-1]
+                    ply = line[1]
+                    number = line[2].get(ply, 0) + 1
+                    line[2][ply] = number
+                    lines.append([line[0] + ((ply, number),), None, {}])
+                else:
+                    del lines[-1]
+                continue
+            line = lines[-1]
+            line[1] = _ply_for_position(delta[1][1:])
+            if position_text is None:
+                yield line[1], line[0], token
+                continue
+            for square, piece in delta[0][0]:
+                board[fen_squares[square].number] = None
+            for square, piece in delta[1][0]:
+                board[fen_squares[square].number] = piece
+            yield (
+                line[1],
+                line[0],
+                token,
+                position_text(board, *delta[1][1:]),
+            )
+
     def pgn_error_notification(self):
         """Do nothing.  Subclasses should override to fit requirements.
 
@@ -1493,25 +2102,7 @@ class GameData:
             )
 
             # This is most of set_position_to_play_right_nested_rav_at_move.
-            rav_piece_placement_data = self._position_deltas[-1][0][0]
-            pieces_on_board = self._pieces_on_board
-            for val in pieces_on_board.values():
-                val.clear()
-            piece_placement_data = self._piece_placement_data
-            piece_placement_data.clear()
-            for piece, square in rav_piece_placement_data:
-                piece_placement_data[square] = piece
-                piece.set_square(square)
-                if piece.name == FEN_WHITE_PAWN:
-                    pieces_on_board[piece.square.file + FEN_WHITE_PAWN].append(
-                        piece
-                    )
-                elif piece.name == FEN_BLACK_PAWN:
-                    pieces_on_board[piece.square.file + FEN_BLACK_PAWN].append(
-                        piece
-                    )
-                else:
-                    pieces_on_board[piece.name].append(piece)
+            self.restore_board_snapshot(self._position_deltas[-1][0][0])
 
             (
                 self._active_color,
@@ -1832,3 +2423,215 @@ def generate_fen_for_position(
         )
     )
     return fen
+
+
+def _generate_piece_placement_for_board(board):
+    """Return FEN piece placement field for board.
+
+    board is a sequence of 64 items in FEN square order, a8 to h1, which are
+    Piece instances or None for empty squares.
+
+    """
+    placement = "".join(
+        [_EMPTY_SQUARE if piece is None else piece.name for piece in board]
+    )
+    placement = FEN_RANK_DELIM.join(
+        [placement[start : start + len(FILE_NAMES)] for start in _RANK_STARTS]
+    )
+    for run, count in _EMPTY_SQUARE_RUNS:
+        placement = placement.replace(run, count)
+    return placement
+
+
+def generate_fen_for_board(
+    board,
+    active_color,
+    castling_availability,
+    en_passant_target_square,
+    halfmove_clock,
+    fullmove_number,
+):
+    """Return Forsyth Edwards Notation (FEN) string for board and position.
+
+    board is a sequence of 64 items in FEN square order, a8 to h1, which are
+    Piece instances or None for empty squares.
+
+    The FEN is the one generate_fen_for_position would give for the pieces
+    on board, but the pieces do not have to be sorted into square order.
+
+    """
+    return FEN_FIELD_DELIM.join(
+        (
+            _generate_piece_placement_for_board(board),
+            active_color,
+            castling_availability,
+            en_passant_target_square,
+            str(halfmove_clock),
+            str(fullmove_number),
+        )
+    )
+
+
+def generate_epd_for_board(
+    board,
+    active_color,
+    castling_availability,
+    en_passant_target_square,
+):
+    """Return Extended Position Description (EPD) for board and position.
+
+    The four position fields are returned, without any operations.
+
+    """
+    return FEN_FIELD_DELIM.join(
+        (
+            _generate_piece_placement_for_board(board),
+            active_color,
+            castling_availability,
+            en_passant_target_square,
+        )
+    )
+
+
+def _generate_epd_for_position_fields(
+    board,
+    active_color,
+    castling_availability,
+    en_passant_target_square,
+    halfmove_clock,
+    fullmove_number,
+):
+    """Return EPD for board and position fields ignoring the move clocks."""
+    del halfmove_clock, fullmove_number
+    return generate_epd_for_board(
+        board, active_color, castling_availability, en_passant_target_square
+    )
+
+
+def _ply_for_position(position):
+    """Return half moves to position from standard starting position.
+
+    position is (active color, castling availability, en passant target
+    square, halfmove clock, fullmove number), as in position deltas.
+
+    """
+    ply = (position[4] - 1) * 2
+    if position[0] == FEN_BLACK_ACTIVE:
+        ply += 1
+    return ply
+
+
+def _replay_game_positions(game):
+    """Yield board and position fields for each position in game score.
+
+    The board is a list of 64 items in FEN square order which is modified
+    in place before each yield.
+
+    The position deltas are replayed in order on the board, so the initial
+    position is followed by the position after each move, including moves
+    in RAVs, in the order the moves appear in the game score.  The position
+    restored at the start and end of a RAV is not yielded because it is the
+    same as one yielded earlier.
+
+    """
+    initial_position = game.initial_position
+    if initial_position is None:
+        return
+    board = list(initial_position[0])
+    yield board, initial_position[1:]
+
+    # Tokens which are not moves repeat the preceding board state: the same
+    # object is appended to the position deltas.
+    previous_delta = None
+    for delta in game.position_deltas:
+        if delta is None or delta is previous_delta:
+            continue
+        previous_delta = delta
+        if len(delta) == 1:
+            board[:] = delta[0][0]
+            continue
+        for square, piece in delta[0][0]:
+            board[fen_squares[square].number] = None
+        for square, piece in delta[1][0]:
+            board[fen_squares[square].number] = piece
+        yield board, delta[1][1:]
+
+
+def generate_fens_for_game(game):
+    """Yield FEN for each position in game score.
+
+    The initial position is followed by the position after each move,
+    including moves in RAVs, in the order the moves appear in the game score.
+    Moves after an error in the game score, or a RAV, are not included.
+
+    """
+    for board, position in _replay_game_positions(game):
+        yield generate_fen_for_board(board, *position)
+
+
+def generate_epds_for_game(game):
+    """Yield EPD, without operations, for each position in game score.
+
+    The positions are those given by generate_fens_for_game.
+
+    """
+    for board, position in _replay_game_positions(game):
+        yield generate_epd_for_board(board, *position[:3])
+
+
+def _create_move_tables():
+    """Populate LINE_PIECE_MOVES, PAWN_ADVANCES, and PAWN_CAPTURES.
+
+    The first four lines from a square in attack_lines() are the file and
+    rank, and the last four are the diagonals.
+
+    source_squares maps a destination square to the squares from which a
+    pawn moves to it, so these are inverted.  A pawn's advances are in the
+    order one square forward then two squares forward.
+
+    """
+    for square in fen_squares.values():
+        lines = tuple(line for line in square.attack_lines() if line)
+        file_and_rank = tuple(
+            line for line in square.attack_lines()[:4] if line
+        )
+        diagonals = tuple(line for line in square.attack_lines()[4:] if line)
+        for names, piece_lines in (
+            (FEN_WHITE_QUEEN + FEN_BLACK_QUEEN, lines),
+            (FEN_WHITE_ROOK + FEN_BLACK_ROOK, file_and_rank),
+            (FEN_WHITE_BISHOP + FEN_BLACK_BISHOP, diagonals),
+        ):
+            for name in names:
+                LINE_PIECE_MOVES.setdefault(name, {})[
+                    square.name
+                ] = piece_lines
+    for name in FEN_PAWNS:
+        advances = {square: [] for square in fen_squares}
+        captures = {square: [] for square in fen_squares}
+        for destination, sources in source_squares[name].items():
+            for square in sources:
+                advances[square].append(destination)
+        for destination, sources in source_squares[
+            name + PGN_CAPTURE_MOVE
+        ].items():
+            for square in sources:
+                captures[square].append(destination)
+        PAWN_ADVANCES[name] = {
+            square: tuple(
+                sorted(
+                    destinations,
+                    key=lambda d, s=square: len(
+                        fen_squares[s].point_to_point[d]
+                    ),
+                )
+            )
+            for square, destinations in advances.items()
+        }
+        PAWN_CAPTURES[name] = {
+            square: tuple(sorted(destinations))
+            for square, destinations in captures.items()
+        }
+
+
+_create_move_tables()
+del _create_move_tables
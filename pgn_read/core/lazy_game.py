@@ -0,0 +1,136 @@
+# lazy_game.py
+# Copyright 2025 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+r"""Read the tags of PGN games and leave the moves until they are needed.
+
+The LazyPGN class splits PGN text into games with the PGNTagPair parser,
+which does not play the moves, and yields a LazyGame instance for each game
+holding the tags and the text of the game.
+
+The text is parsed by the PGN class, playing the moves, when an attribute
+other than pgn_tags or game_offset is first used: pgn_text, state,
+position_deltas, and the board properties, for example.  So reading the
+tags of all games costs about the same as PGNTagPair read_games(), while
+the full Game API is available for the games where it is needed.
+
+PGNTagPair and PGN agree where games start and end when the games have no
+errors.  Where they do not agree the games can differ in either direction,
+so LazyPGN and PGN can give different numbers of games.  The text of a
+LazyGame may hold more than one game for PGN: the first is used, as for
+the game() method of the shared_games.SharedGame class.  Or one game for
+PGN may be split between LazyGame instances: a PGN Tag after movetext
+without a game termination marker starts a new game for PGNTagPair, but
+PGN keeps the tag and following movetext in the unterminated game as an
+error.  '[Event "a"]\n1. e4\n[Event "b"]\n1. d4 *\n' is two LazyGame
+instances but one game for PGN.
+
+The game_offset of a game with errors which ends at the PGN Tag starting
+the next game can be a few characters less than the one given by PGN:
+PGNTagPair puts the end of the game before the whitespace preceding the
+tag.
+
+"""
+import io
+
+from .game import Game
+from .parser import PGN
+from .tagpair_parser import PGNTagPair, TagPairGame, RecordedSource
+
+
+class LazyGame:
+    """Tags and text of a game, and the game_class instance when needed.
+
+    Attributes not defined by LazyGame are those of the game_class instance
+    made by parsing the text on first use.
+
+    """
+
+    def __init__(self, game_class, text, tags, game_offset):
+        """Note game_class and text for building game on demand.
+
+        tags is None if the tags are not known until the text is parsed.
+
+        """
+        self._game_class = game_class
+        self.text = text
+        self._tags = tags
+        self.game_offset = game_offset
+        self._game = None
+
+    @property
+    def pgn_tags(self):
+        """Return _tags dict of PGN tag names and values."""
+        if self._tags is None:
+            return self.game().pgn_tags
+        return self._tags
+
+    @property
+    def is_game_parsed(self):
+        """Return True if the text has been parsed to give the game."""
+        return self._game is not None
+
+    def game(self):
+        """Return game_class instance created by parsing text of game.
+
+        The text is parsed on the first call only.
+
+        """
+        if self._game is None:
+            for game in PGN(game_class=self._game_class).read_games(self.text):
+                break
+            else:
+                game = self._game_class()
+            game.game_offset = self.game_offset
+            self._game = game
+        return self._game
+
+    def __getattr__(self, name):
+        """Return attribute name of game_class instance for text of game."""
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return getattr(self.game(), name)
+
+
+class LazyPGN:
+    """Yield LazyGame instances for the games in PGN text.
+
+    game_class is the class of the game built when the moves of a game are
+    first needed.
+
+    """
+
+    def __init__(self, game_class=Game):
+        """Note game_class used to build games on demand."""
+        self._game_class = game_class
+
+    def read_games(self, source, size=10000000):
+        """Yield LazyGame instances for games in source.
+
+        source and size are as in PGN read_games(), and the game_offset of
+        each game is the one given by PGNTagPair read_games().  The games
+        are split where PGNTagPair splits them, which is not always where
+        PGN splits them: see the module docstring.
+
+        """
+        if isinstance(source, str):
+            source = io.StringIO(source)
+        source = RecordedSource(source)
+        game_class = self._game_class
+        start = 0
+        for game in PGNTagPair(game_class=TagPairGame).read_games(
+            source, size=size
+        ):
+            yield LazyGame(
+                game_class,
+                source.text_between(start, game.game_offset),
+                game.pgn_tags,
+                game.game_offset,
+            )
+            start = game.game_offset
+
+        # PGNTagPair does not yield the final game when source ends without
+        # a game termination marker, but PGN does.
+        text = source.text_between(start, source.end)
+        if text.strip():
+            yield LazyGame(game_class, text, None, source.end)
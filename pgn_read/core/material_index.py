@@ -0,0 +1,391 @@
+# material_index.py
+# Copyright 2025 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Index games by material signature and pawn files for endgame queries.
+
+GameMaterialSignature extends Game by noting the material signature, like
+'KRPvKR', and the files occupied by white and black pawns each time these
+change in the main line of a game.  Material changes only when a piece is
+captured or a pawn is promoted, so the work is done for a small fraction of
+the moves in a game.
+
+MaterialIndex collects these transitions for all games in a PGN file, saves
+them in a compact binary file, and answers queries like 'which games reach
+a KRPvKR ending, and at which ply' without reading the PGN file again.
+
+"""
+import sys
+import struct
+from array import array
+
+from .constants import (
+    FILE_NAMES,
+    FEN_BLACK_ACTIVE,
+    FEN_WHITE_PAWN,
+    FEN_BLACK_PAWN,
+    FEN_WHITE_KING,
+    FEN_WHITE_QUEEN,
+    FEN_WHITE_ROOK,
+    FEN_WHITE_BISHOP,
+    FEN_WHITE_KNIGHT,
+    FEN_BLACK_KING,
+    FEN_BLACK_QUEEN,
+    FEN_BLACK_ROOK,
+    FEN_BLACK_BISHOP,
+    FEN_BLACK_KNIGHT,
+)
+from .game import Game
+from .parser import PGN
+
+# Separates the white and black pieces in a material signature.
+SIGNATURE_SIDE_SEPARATOR = "v"
+
+# Identify file as a material index and the layout version.
+INDEX_MAGIC = b"PGNMATIX"
+INDEX_VERSION = 1
+_header = struct.Struct("<8sIIIII")
+
+# Typecodes for the columns saved in the index file.
+_GAME_NUMBER = "I"
+_GAME_OFFSET = "Q"
+_PLY = "I"
+_SIGNATURE = "H"
+_PAWN_FILES = "B"
+
+_WHITE_PIECES = (
+    FEN_WHITE_KING,
+    FEN_WHITE_QUEEN,
+    FEN_WHITE_ROOK,
+    FEN_WHITE_BISHOP,
+    FEN_WHITE_KNIGHT,
+)
+_BLACK_PIECES = (
+    FEN_BLACK_KING,
+    FEN_BLACK_QUEEN,
+    FEN_BLACK_ROOK,
+    FEN_BLACK_BISHOP,
+    FEN_BLACK_KNIGHT,
+)
+_WHITE_PAWN_FILES = tuple(
+    (1 << bit, file + FEN_WHITE_PAWN) for bit, file in enumerate(FILE_NAMES)
+)
+_BLACK_PAWN_FILES = tuple(
+    (1 << bit, file + FEN_BLACK_PAWN) for bit, file in enumerate(FILE_NAMES)
+)
+
+
+class MaterialIndexError(Exception):
+    """Exception raised reading a material index file."""
+
+
+def pawn_files_mask(files):
+    """Return int bit mask for str of file names, 'a' is 1 and 'h' is 128."""
+    mask = 0
+    for file in files:
+        mask |= 1 << FILE_NAMES.index(file)
+    return mask
+
+
+def pawn_files_from_mask(mask):
+    """Return str of file names in int bit mask, 1 is 'a' and 128 is 'h'."""
+    return "".join(
+        file for bit, file in enumerate(FILE_NAMES) if mask & (1 << bit)
+    )
+
+
+def swap_signature_sides(signature):
+    """Return signature with the white and black pieces swapped."""
+    white, black = signature.split(SIGNATURE_SIDE_SEPARATOR)
+    return SIGNATURE_SIDE_SEPARATOR.join((black, white))
+
+
+class GameMaterialSignature(Game):
+    """Note material signature and pawn files when these change in main line.
+
+    The material_changes attribute is a list of (ply, signature, white pawn
+    files, black pawn files) tuples.  The ply is the number of half moves
+    played from the standard starting position, derived from the active
+    color and fullmove number, so it is correct for games starting from a
+    PGN FEN tag too.  The pawn files are int bit masks where the 'a' file is
+    1 and the 'h' file is 128.
+
+    The first item is the initial position.  Changes in RAVs are ignored.
+
+    """
+
+    def __init__(self):
+        """Extend to initialise the list of material changes."""
+        super().__init__()
+        self.material_changes = []
+
+    def set_initial_board_state(self, position_delta):
+        """Extend to note material in initial position."""
+        super().set_initial_board_state(position_delta)
+        self._append_material_change()
+
+    def _append_decorated_text(self, movetext):
+        """Extend to note material change caused by move in main line.
+
+        The castles move does not change material so the corresponding
+        _append_decorated_castles_text method is not extended.
+
+        """
+        super()._append_decorated_text(movetext)
+        if len(self._ravstack) != 1:
+            return
+        remove, place = self._position_deltas[-1]
+        remove = remove[0]
+        place = place[0]
+        if len(remove) == len(place):
+            if remove[-1][1].name == place[-1][1].name:
+                return
+        self._append_material_change()
+
+    def _append_material_change(self):
+        """Append ply, material signature, and pawn files, for position."""
+        pieces_on_board = self._pieces_on_board
+        white_pawns = 0
+        white_pawn_files = 0
+        for bit, key in _WHITE_PAWN_FILES:
+            count = len(pieces_on_board[key])
+            if count:
+                white_pawns += count
+                white_pawn_files |= bit
+        black_pawns = 0
+        black_pawn_files = 0
+        for bit, key in _BLACK_PAWN_FILES:
+            count = len(pieces_on_board[key])
+            if count:
+                black_pawns += count
+                black_pawn_files |= bit
+        signature = "".join(
+            (
+                "".join(p * len(pieces_on_board[p]) for p in _WHITE_PIECES),
+                FEN_WHITE_PAWN * white_pawns,
+                SIGNATURE_SIDE_SEPARATOR,
+                "".join(
+                    p * len(pieces_on_board[p]) for p in _BLACK_PIECES
+                ).upper(),
+                FEN_WHITE_PAWN * black_pawns,
+            )
+        )
+        ply = (self._fullmove_number - 1) * 2
+        if self._active_color == FEN_BLACK_ACTIVE:
+            ply += 1
+        self.material_changes.append(
+            (ply, signature, white_pawn_files, black_pawn_files)
+        )
+
+
+class MaterialIndex:
+    """Material signature and pawn file transitions for games in PGN text.
+
+    Each record says the game reaches the signature and pawn files at a ply
+    and these stay unchanged until the ply of the next record for the game,
+    or the end of the game.
+
+    Games are identified by their position in the PGN text, counting from 0,
+    and by the game_offset value set by parser.PGN read_games().
+
+    """
+
+    def __init__(self):
+        """Create an empty index."""
+        self.game_count = 0
+        self.signatures = []
+        self._signature_numbers = {}
+        self.game_numbers = array(_GAME_NUMBER)
+        self.game_offsets = array(_GAME_OFFSET)
+        self.record_games = array(_GAME_NUMBER)
+        self.record_plies = array(_PLY)
+        self.record_signatures = array(_SIGNATURE)
+        self.record_white_pawns = array(_PAWN_FILES)
+        self.record_black_pawns = array(_PAWN_FILES)
+
+    def index_pgn(self, source, game_class=GameMaterialSignature):
+        """Add games read from source by parser.PGN read_games() to index.
+
+        game_class must be GameMaterialSignature or a subclass.
+
+        """
+        self.index_games(PGN(game_class=game_class).read_games(source))
+
+    def index_games(self, games):
+        """Add material changes in games to index.
+
+        games is an iterable of GameMaterialSignature instances.  The games
+        are numbered from the count of games already seen by the index,
+        including those without material changes such as games with an error
+        before the first move.
+
+        """
+        signature_numbers = self._signature_numbers
+        signatures = self.signatures
+        game_numbers = self.game_numbers
+        game_offsets = self.game_offsets
+        record_games = self.record_games
+        record_plies = self.record_plies
+        record_signatures = self.record_signatures
+        record_white_pawns = self.record_white_pawns
+        record_black_pawns = self.record_black_pawns
+        for game_number, game in enumerate(games, start=self.game_count):
+            self.game_count = game_number + 1
+            if not game.material_changes:
+                continue
+            game_numbers.append(game_number)
+            game_offsets.append(game.game_offset)
+            for ply, signature, white, black in game.material_changes:
+                number = signature_numbers.get(signature)
+                if number is None:
+                    number = len(signatures)
+                    signature_numbers[signature] = number
+                    signatures.append(signature)
+                record_games.append(game_number)
+                record_plies.append(ply)
+                record_signatures.append(number)
+                record_white_pawns.append(white)
+                record_black_pawns.append(black)
+
+    def find(
+        self,
+        signature=None,
+        white_pawn_files=None,
+        black_pawn_files=None,
+        either_color=False,
+    ):
+        """Return list of (game number, game offset, ply) matching arguments.
+
+        signature is a str like 'KRPvKR', white_pawn_files and black_pawn_files
+        are str of file names like 'abf' or int bit masks.  Arguments given as
+        None are not used to select records.  'KRvKRP' is also accepted for
+        signature 'KRPvKR' when either_color is True, with the pawn files
+        swapped to match.
+
+        """
+        if isinstance(white_pawn_files, str):
+            white_pawn_files = pawn_files_mask(white_pawn_files)
+        if isinstance(black_pawn_files, str):
+            black_pawn_files = pawn_files_mask(black_pawn_files)
+        selection = [(signature, white_pawn_files, black_pawn_files)]
+        if either_color:
+            selection.append(
+                (
+                    (
+                        None
+                        if signature is None
+                        else swap_signature_sides(signature)
+                    ),
+                    black_pawn_files,
+                    white_pawn_files,
+                )
+            )
+        found = set()
+        for sig, white, black in selection:
+            if sig is None:
+                number = None
+            else:
+                number = self._signature_numbers.get(sig)
+                if number is None:
+                    continue
+            found.update(self._find_records(number, white, black))
+        offsets = dict(zip(self.game_numbers, self.game_offsets))
+        record_games = self.record_games
+        record_plies = self.record_plies
+        return [
+            (record_games[r], offsets[record_games[r]], record_plies[r])
+            for r in sorted(found)
+        ]
+
+    def _find_records(self, number, white, black):
+        """Return indicies of records matching number and pawn file masks."""
+        if number is None:
+            records = range(len(self.record_signatures))
+        else:
+            records = [
+                r for r, s in enumerate(self.record_signatures) if s == number
+            ]
+        if white is not None:
+            white_pawns = self.record_white_pawns
+            records = [r for r in records if white_pawns[r] == white]
+        if black is not None:
+            black_pawns = self.record_black_pawns
+            records = [r for r in records if black_pawns[r] == black]
+        return records
+
+    def _columns(self):
+        """Return the arrays saved in an index file in file order."""
+        return (
+            self.game_numbers,
+            self.game_offsets,
+            self.record_games,
+            self.record_plies,
+            self.record_signatures,
+            self.record_white_pawns,
+            self.record_black_pawns,
+        )
+
+    def write_index(self, path):
+        """Write index to file at path.
+
+        Numbers are written in little-endian order whatever the platform.
+
+        """
+        signatures = "\n".join(self.signatures).encode("ascii")
+        with open(path, mode="wb") as file:
+            file.write(
+                _header.pack(
+                    INDEX_MAGIC,
+                    INDEX_VERSION,
+                    self.game_count,
+                    len(self.game_numbers),
+                    len(self.record_games),
+                    len(signatures),
+                )
+            )
+            file.write(signatures)
+            for column in self._columns():
+                if sys.byteorder != "little":
+                    column = array(column.typecode, column)
+                    column.byteswap()
+                column.tofile(file)
+
+    def read_index(self, path):
+        """Replace index with the one in file at path."""
+        with open(path, mode="rb") as file:
+            header = file.read(_header.size)
+            if len(header) != _header.size:
+                raise MaterialIndexError(path + " is not a material index")
+            (
+                magic,
+                version,
+                game_count,
+                games,
+                records,
+                length,
+            ) = _header.unpack(header)
+            if magic != INDEX_MAGIC:
+                raise MaterialIndexError(path + " is not a material index")
+            if version != INDEX_VERSION:
+                raise MaterialIndexError(
+                    path + " material index version is not supported"
+                )
+            signatures = file.read(length).decode("ascii")
+            self.game_count = game_count
+            self.signatures[:] = signatures.split("\n") if length else ()
+            self._signature_numbers = {
+                s: n for n, s in enumerate(self.signatures)
+            }
+            try:
+                for column, count in zip(
+                    self._columns(),
+                    (games, games) + (records,) * 5,
+                ):
+                    del column[:]
+                    column.fromfile(file, count)
+                    if sys.byteorder != "little":
+                        column.byteswap()
+            except EOFError as exc:
+                raise MaterialIndexError(
+                    path + " material index is truncated"
+                ) from exc
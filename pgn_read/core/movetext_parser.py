@@ -153,6 +153,10 @@ class MoveText:
         """Return True if text has been found for game."""
         return self._text
 
+    def is_text_found(self):
+        """Return True if any tokens have been found for game."""
+        return bool(self._text)
+
     @property
     def state(self):
         """Return the token offset where PGN error in game occured."""
@@ -617,7 +621,7 @@ class PGNMoveText:
 
         # The final game in the input has an error, or has no error but no game
         # termination marker either.
-        if game.pgn_text:
+        if game.is_text_found():
             game.set_game_error()
             game.game_offset = pgntext_offset + len(residue)
             yield game
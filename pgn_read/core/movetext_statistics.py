@@ -0,0 +1,240 @@
+# movetext_statistics.py
+# Copyright 2025 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Count moves, comments, NAGs, and RAVs, in games without keeping tokens.
+
+The PGNStatistics class uses the movetext_parser.PGNMoveText parser to find
+the games in a PGN file, and the MoveTextStatistics class to count the
+tokens in each game.  The moves are not checked for legality, and the tokens
+are not kept except those from the first PGN error in a game.
+
+The counts are put in a GameStatistics instance holding one array for each
+column, with one item per game, from which totals and histograms can be
+calculated.  The arrays hold the following for each game:
+
+ply_count - moves in the main line.
+move_count - moves in the main line and RAVs.
+comment_count - '{...}' and ';...' comments.
+nag_count - '$n' NAGs and traditional annotations like '!?'.
+rav_count - RAVs, recursive annotation variations.
+characters - characters from end of previous game to end of game.
+error - 1 if a PGN error was found in the game, otherwise 0.
+
+"""
+import io
+from array import array
+
+from .constants import CGM_TAG_NAME, CGM_TAG_VALUE
+from .movetext_parser import PGNMoveText, MoveText
+from .tagpair_parser import decode_bad_tag
+
+# Names of columns in GameStatistics instances.
+PLY_COUNT = "ply_count"
+MOVE_COUNT = "move_count"
+COMMENT_COUNT = "comment_count"
+NAG_COUNT = "nag_count"
+RAV_COUNT = "rav_count"
+CHARACTERS = "characters"
+ERROR = "error"
+COLUMNS = (
+    PLY_COUNT,
+    MOVE_COUNT,
+    COMMENT_COUNT,
+    NAG_COUNT,
+    RAV_COUNT,
+    CHARACTERS,
+    ERROR,
+)
+
+_TYPECODES = {
+    PLY_COUNT: "I",
+    MOVE_COUNT: "I",
+    COMMENT_COUNT: "I",
+    NAG_COUNT: "I",
+    RAV_COUNT: "I",
+    CHARACTERS: "Q",
+    ERROR: "B",
+}
+
+
+class MoveTextStatistics(MoveText):
+    """Count movetext tokens rather than append them to game score.
+
+    The tokens from the first PGN error are kept in _text so PGNMoveText
+    read_games() can find the end of the game.  token_count is the number of
+    tokens counted before the first PGN error.
+
+    """
+
+    def __init__(self):
+        """Extend to initialise counts of movetext tokens."""
+        super().__init__()
+        self.token_count = 0
+        self.ply_count = 0
+        self.move_count = 0
+        self.comment_count = 0
+        self.nag_count = 0
+        self.rav_count = 0
+        self._rav_depth = 0
+
+    def is_text_found(self):
+        """Return True if any tokens have been counted or kept for game."""
+        return bool(self._text or self.token_count)
+
+    def append_comment_to_eol(self, match):
+        r"""Count ';...\n' comment token."""
+        self.token_count += 1
+        self.comment_count += 1
+
+    def append_token(self, match):
+        """Count '{...}' comment or '$n' NAG token."""
+        self.token_count += 1
+        if match.group().lstrip().startswith("{"):
+            self.comment_count += 1
+        else:
+            self.nag_count += 1
+
+    def append_reserved(self, match):
+        """Count '<...>' reserved token."""
+        self.token_count += 1
+
+    def append_bad_tag_and_set_error(self, match):
+        """Count badly formed tag.
+
+        Put game in error state if a duplicate tag name is found.
+
+        """
+        tag_name, tag_value = decode_bad_tag(match.group())
+        self._count_tag(tag_name, tag_value)
+
+    def append_start_tag(self, match):
+        """Count tag token and update game tags.
+
+        Put game in error state if a duplicate tag name is found.
+
+        """
+        if self._state is not None:
+            self.append_token_and_set_error(match)
+            return
+        group = match.group
+        self._count_tag(group(CGM_TAG_NAME), group(CGM_TAG_VALUE))
+
+    def append_move(self, match):
+        """Count move token, and ply if not in a RAV."""
+        self.token_count += 1
+        self.move_count += 1
+        if not self._rav_depth:
+            self.ply_count += 1
+
+    def append_start_rav(self, match):
+        """Count start recursive annotation variation token."""
+        self.token_count += 1
+        self.rav_count += 1
+        self._rav_depth += 1
+
+    def append_end_rav(self, match):
+        """Count end recursive annotation variation token."""
+        self.token_count += 1
+        if self._rav_depth:
+            self._rav_depth -= 1
+
+    def append_game_termination(self, match):
+        """Count game termination token."""
+        self.token_count += 1
+
+    def append_glyph_for_traditional_annotation(self, match):
+        """Count traditional annotation token as a NAG."""
+        self.token_count += 1
+        self.nag_count += 1
+
+    def _count_tag(self, tag_name, tag_value):
+        """Count tag and set error if tag_name is a duplicate."""
+        if tag_name in self._tags:
+            if self._state is None:
+                self._state = len(self._text)
+                self._text.append(
+                    "".join(("[", tag_name, '"', tag_value, '"]'))
+                )
+            return
+        self.token_count += 1
+        self._tags[tag_name] = tag_value
+
+
+class GameStatistics:
+    """Counts for games with one array per column."""
+
+    def __init__(self):
+        """Create empty arrays for COLUMNS."""
+        self.names = COLUMNS
+        self.columns = tuple(array(_TYPECODES[name]) for name in COLUMNS)
+
+    def __len__(self):
+        """Return number of games."""
+        return len(self.columns[0])
+
+    def column(self, name):
+        """Return column for name."""
+        return self.columns[self.names.index(name)]
+
+    def totals(self):
+        """Return dict of column name and sum of column values."""
+        return {
+            name: sum(column) for name, column in zip(self.names, self.columns)
+        }
+
+    def histogram(self, name, bin_width=1):
+        """Return array of games in each bin of bin_width for column name.
+
+        Item n of the array is the number of games with a value in range
+        n * bin_width to (n + 1) * bin_width - 1 in column name.
+
+        """
+        counts = array("Q")
+        for value in self.column(name):
+            index = value // bin_width
+            if index >= len(counts):
+                counts.extend((0,) * (index + 1 - len(counts)))
+            counts[index] += 1
+        return counts
+
+
+class PGNStatistics:
+    """Read counts of movetext tokens for games in PGN text."""
+
+    def __init__(self, game_class=MoveTextStatistics):
+        """Initialise parser for game_class."""
+        self._parser = PGNMoveText(game_class=game_class)
+
+    def read_statistics(self, source, size=10000000):
+        """Return GameStatistics instance for games in source.
+
+        source and size are as in PGNMoveText read_games().
+
+        A str source is read as a file so the offset of the final game in
+        source is the length of source.
+
+        """
+        if isinstance(source, str):
+            source = io.StringIO(source)
+        statistics = GameStatistics()
+        (
+            ply_counts,
+            move_counts,
+            comment_counts,
+            nag_counts,
+            rav_counts,
+            characters,
+            errors,
+        ) = statistics.columns
+        game_offset = 0
+        for game in self._parser.read_games(source, size=size):
+            ply_counts.append(game.ply_count)
+            move_counts.append(game.move_count)
+            comment_counts.append(game.comment_count)
+            nag_counts.append(game.nag_count)
+            rav_counts.append(game.rav_count)
+            characters.append(game.game_offset - game_offset)
+            errors.append(game.state is not None)
+            game_offset = game.game_offset
+        return statistics
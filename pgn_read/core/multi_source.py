@@ -0,0 +1,115 @@
+# multi_source.py
+# Copyright 2025 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Read games from several PGN files as one stream of games.
+
+The MultiSourcePGN class reads each file with a ThreadPoolPGN instance, all
+sharing one executor, and yields the games of the files either one file
+after another, or merged in the collation order given by the GameData
+seven_tag_roster_collation_value() method.
+
+In file order the files are read one at a time: the chunks of the file
+being read are parsed concurrently, but the next file is not opened until
+the games of the current file have been yielded.  A merge reads all the
+files at once, so chunks of every file are parsed concurrently.
+
+The merge is done by heapq.merge() so each file must already be in
+collation order for the merged stream to be in collation order.  Games are
+held only for the chunks being parsed in each file, not for whole files.
+Games with equal collation values are yielded in the order of the files,
+and in the order they appear in each file.
+
+Files with names ending '.gz', '.bz2', or '.xz', are decompressed while
+read.
+
+Each game is given a source_id attribute, the index of it's file in the
+list of files, and the game_offset is the one given by PGN read_games()
+for the file.
+
+"""
+import heapq
+import itertools
+import operator
+from concurrent.futures import ThreadPoolExecutor
+
+from .game import Game
+from .thread_parser import ThreadPoolPGN, CHUNK_SIZE
+from .split_pgn import open_pgn_file
+
+collation_value = operator.methodcaller("seven_tag_roster_collation_value")
+
+
+class MultiSourcePGN:
+    """Read games from several PGN files, in file order or collation order.
+
+    game_class, chunk_size, max_workers, executor, and max_pending, are as
+    for ThreadPoolPGN, with one executor shared by all files.  Reading in
+    file order parses one file at a time.  Merging files starts reading all
+    of them, so max_pending chunks of each file may be held at once.
+
+    """
+
+    def __init__(
+        self,
+        game_class=Game,
+        chunk_size=CHUNK_SIZE,
+        max_workers=None,
+        executor=None,
+        max_pending=None,
+        encoding="iso-8859-1",
+    ):
+        """Note game class, chunking, executor, and encoding of files."""
+        self.game_class = game_class
+        self.chunk_size = chunk_size
+        self.max_workers = max_workers
+        self.executor = executor
+        self.max_pending = max_pending
+        self.encoding = encoding
+
+    def read_games(self, paths, collate=False, size=10000000):
+        """Yield game_class instances for games in files at paths.
+
+        The games are in the order of files in paths, or merged in collation
+        order if collate is True.  size is as in PGN read_games().
+
+        """
+        if self.executor is None:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                yield from self._read_games(executor, paths, collate, size)
+        else:
+            yield from self._read_games(self.executor, paths, collate, size)
+
+    def _read_games(self, executor, paths, collate, size):
+        """Yield games from files at paths parsed by executor."""
+        sources = [
+            self._read_source(executor, source_id, path, size)
+            for source_id, path in enumerate(paths)
+        ]
+        try:
+            if collate:
+                yield from heapq.merge(*sources, key=collation_value)
+            else:
+                yield from itertools.chain(*sources)
+        finally:
+            for source in sources:
+                source.close()
+
+    def _read_source(self, executor, source_id, path, size):
+        """Yield games, with source_id set, from file at path.
+
+        The file is opened when the first game is wanted.
+
+        """
+        parser = ThreadPoolPGN(
+            game_class=self.game_class,
+            chunk_size=self.chunk_size,
+            max_workers=self.max_workers,
+            executor=executor,
+            max_pending=self.max_pending,
+        )
+        for game in parser.read_games(
+            open_pgn_file(path, encoding=self.encoding), size=size
+        ):
+            game.source_id = source_id
+            yield game
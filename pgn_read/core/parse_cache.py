@@ -0,0 +1,432 @@
+# parse_cache.py
+# Copyright 2025 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Cache the results of parsing PGN games in a SQLite database.
+
+The CachedPGN class splits PGN text into games with the PGNTagPair parser,
+which does not play the moves, and looks up a hash of the text of each game
+in the cache.  On a hit the stored result is used without running the Game
+class; on a miss the text is parsed by the PGN class and the result stored.
+
+The result is yielded as a CachedGame instance with the tags, text, state,
+error list, and game offset, of the game, and optionally the position at
+the end of the game in Forsyth-Edwards Notation (FEN).
+
+Entries are keyed by the game class, and whether the final position is
+kept, as well as the hash.  Entries made by a different version of pgn-read
+are deleted when the cache is opened.  The least recently used entries are
+deleted when the number of entries exceeds the limit.
+
+The PGNTagPair and PGN parsers do not agree on where every game starts.
+PGN continues a game which is not terminated past a PGN Tag if the game has
+no error yet or the error is an unterminated comment or reserved sequence.
+When PGN would continue the final game in the text of a PGNTagPair game the
+text of the following game is appended and parsed with it, so the games
+yielded are the ones PGN read_games() yields.  Leading whitespace is not
+part of the cached text of a game but trailing whitespace is.
+
+The games may still differ from the ones PGN read_games() yields when text
+in error is tokenized differently at the start or end of a PGNTagPair game
+than in the surrounding text: for example a '%' escape which is preceded by
+whitespace on the line, or a ';' comment whose newline is taken as part of
+the next game, or a game termination marker followed by other characters.
+
+The game_offset of the final game is wrong when PGN read_games() is given a
+str source, but is correct when the source is a file-like object.  The
+CachedPGN read_games() method gives the correct game_offset in both cases.
+
+"""
+import io
+import re
+import json
+import hashlib
+import sqlite3
+
+from .game import Game
+from .parser import PGN
+from .tagpair_parser import PGNTagPair, RecordedSource
+from .constants import GAME_TERMINATION, UNTERMINATED
+
+# Applied to the connection when the cache is opened.
+PRAGMAS = (
+    "pragma journal_mode = memory",
+    "pragma synchronous = off",
+    "pragma temp_store = memory",
+)
+
+# The games looked up between commits.
+BATCH_SIZE = 10000
+
+# The entries kept in the cache.
+MAX_ENTRIES = 1000000
+
+# Change when the stored result layout changes.
+CACHE_FORMAT = "1"
+
+DISTRIBUTION = "pgn-read"
+
+# Appended to game class name in keys of entries with final positions.
+FEN_KEY_SUFFIX = "+fen"
+
+SCHEMA = (
+    "".join(
+        (
+            "create table if not exists games (",
+            "game_class text, ",
+            "digest blob, ",
+            "version text, ",
+            "used integer, ",
+            "result text, ",
+            "primary key (game_class, digest))",
+        )
+    ),
+    "create index if not exists games_used on games (used)",
+)
+
+game_termination = re.compile(GAME_TERMINATION)
+_ENCODING = "utf-8"
+
+
+def library_version():
+    """Return version of installed pgn-read, or '' if not known."""
+    try:
+        from importlib import metadata
+    except ImportError:
+        return ""
+    try:
+        return metadata.version(DISTRIBUTION)
+    except metadata.PackageNotFoundError:
+        return ""
+
+
+def game_class_name(game_class):
+    """Return qualified name of game_class used in cache keys."""
+    return ".".join((game_class.__module__, game_class.__qualname__))
+
+
+class CachedGame:
+    """The result of parsing a game kept in a parse cache.
+
+    The properties give the same answers as the corresponding Game
+    properties for the parsed game.  fen is None unless the cache keeps
+    final positions and the game has movetext.
+
+    """
+
+    def __init__(self, tags, text, state, error_list, game_offset, fen):
+        """Note result of parsing game."""
+        self._tags = tags
+        self._text = text
+        self._state = state
+        self._error_list = error_list
+        self.game_offset = game_offset
+        self.fen = fen
+
+    @classmethod
+    def from_game(cls, game, fen=False):
+        """Return CachedGame for game, with final position if fen is True."""
+        if fen and game.initial_position is not None:
+            fen = game.get_fen_for_position()
+        else:
+            fen = None
+        return cls(
+            game.pgn_tags,
+            game.pgn_text,
+            game.state,
+            game.error_list,
+            game.game_offset,
+            fen,
+        )
+
+    @property
+    def pgn_tags(self):
+        """Return _tags dict of PGN tag names and values."""
+        return self._tags
+
+    @property
+    def pgn_text(self):
+        """Return _text list of PGN text (the whole game score)."""
+        return self._text
+
+    @property
+    def state(self):
+        """Return the token offset where PGN error in game occured."""
+        return self._state
+
+    @property
+    def error_list(self):
+        """Return token offsets of PGN errors in RAVs and the main line."""
+        return self._error_list
+
+    @property
+    def game_ok(self):
+        """Return True if game and all variations have no PGN errors."""
+        return bool(self._state is None and not self._error_list)
+
+    @property
+    def game_has_errors(self):
+        """Return True if game has PGN errors: variations are ignored."""
+        return bool(self._state is not None)
+
+    def get_text_of_game(self):
+        """Return current game text as a str."""
+        return "".join(self._text)
+
+    def is_terminated(self):
+        """Return True if game score ends with a game termination marker."""
+        return bool(
+            self._text and game_termination.fullmatch(self._text[-1].strip())
+        )
+
+    def encode(self):
+        """Return str of result for storing in cache."""
+        return json.dumps(
+            (
+                self._tags,
+                self._text,
+                self._state,
+                self._error_list,
+                self.game_offset,
+                self.fen,
+            ),
+            separators=(",", ":"),
+        )
+
+    @classmethod
+    def decode(cls, value):
+        """Return list of CachedGame for value from encode_games."""
+        return [cls(*item) for item in json.loads(value)]
+
+
+def _is_continued_by_pgn(game):
+    """Return True if PGN reads following text as part of the final game.
+
+    game is the final game parsed from text ending without a game
+    termination marker.  PGN read_games() starts a new game at the next PGN
+    Tag only if game has an error not at the end of text, which does not
+    start with an unterminated comment or reserved sequence.
+
+    """
+    if game.is_terminated():
+        return False
+    text = game.pgn_text
+    state = game.state
+    if state is None or state == len(text):
+        return True
+    return text[state][0] in UNTERMINATED
+
+
+def encode_games(games):
+    """Return str of results in games for storing in cache."""
+    return "".join(("[", ",".join(game.encode() for game in games), "]"))
+
+
+class CachedPGN:
+    """Parse PGN text with a cache of results for the text of each game.
+
+    The cache is a SQLite database.  Several game classes can share a cache
+    because the entries for each game class are kept apart.
+
+    """
+
+    def __init__(
+        self,
+        database,
+        game_class=Game,
+        fen=False,
+        max_entries=MAX_ENTRIES,
+        batch_size=BATCH_SIZE,
+        version=None,
+    ):
+        """Open cache and delete entries made by other versions of pgn-read.
+
+        database is a path or ':memory:' as for sqlite3.connect.  The final
+        position of each game is kept if fen is True.  version defaults to
+        the installed version of pgn-read: give a value when running from a
+        source tree, where the version may not be known.
+
+        """
+        if version is None:
+            version = library_version()
+        self.game_class = game_class
+        self.fen = fen
+        self.max_entries = max_entries
+        self.batch_size = batch_size
+        self.version = "+".join((version, CACHE_FORMAT))
+        self.hits = 0
+        self.misses = 0
+        self.connection = sqlite3.connect(database)
+        cursor = self.connection.cursor()
+        try:
+            for pragma in PRAGMAS:
+                cursor.execute(pragma)
+            for statement in SCHEMA:
+                cursor.execute(statement)
+            cursor.execute(
+                "delete from games where version != ?", (self.version,)
+            )
+            self.connection.commit()
+            self._used = (
+                cursor.execute("select max(used) from games").fetchone()[0]
+                or 0
+            )
+        finally:
+            cursor.close()
+        self._inserts = []
+        self._updates = []
+
+    def close(self):
+        """Commit outstanding changes and close cache."""
+        self._commit()
+        self.connection.close()
+        self.connection = None
+
+    def read_games(self, source, size=10000000):
+        """Yield CachedGame instances for games in source.
+
+        source and size are as in PGN read_games(), and the games, and their
+        game_offset values, are the ones given by PGN read_games() for a
+        file-like source.
+
+        """
+        key = game_class_name(self.game_class)
+        if self.fen:
+            key += FEN_KEY_SUFFIX
+        parser = PGN(game_class=self.game_class)
+        pending = None
+        carry = None
+        try:
+            for start, text in self._read_game_texts(source, size):
+                if carry is not None:
+                    if not text:
+                        # The final game continues to the end of source.
+                        carry[2][-1].game_offset = start
+                        yield from carry[2]
+                        continue
+                    start, text = carry[0], carry[1] + text
+                    carry = None
+                stripped = text.lstrip()
+                start += len(text) - len(stripped)
+                if pending is not None:
+                    pending.game_offset = start
+                    yield pending
+                    pending = None
+                if not stripped:
+                    continue
+                games = self._get_games(stripped, key, parser)
+                if not games:
+                    continue
+                for game in games:
+                    game.game_offset += start
+                last = games[-1]
+                if _is_continued_by_pgn(last):
+                    # PGN reads the next game's text as part of last.
+                    carry = start, stripped, games
+                    continue
+                if last.game_offset == start + len(stripped) and not (
+                    last.is_terminated()
+                ):
+                    # The game ends where the next game starts.
+                    pending = games.pop()
+                yield from games
+        finally:
+            self._commit()
+
+    @staticmethod
+    def _read_game_texts(source, size):
+        """Yield offset and text of each game in source split by PGNTagPair.
+
+        The final item is the offset of the end of source and ''.
+
+        """
+        if isinstance(source, str):
+            source = io.StringIO(source)
+        source = RecordedSource(source)
+        start = 0
+        for game in PGNTagPair().read_games(source, size=size):
+            yield start, source.text_between(start, game.game_offset)
+            start = game.game_offset
+        text = source.text_between(start, source.end)
+        if text.strip():
+            yield start, text
+        yield source.end, ""
+
+    def _get_games(self, text, key, parser):
+        """Return list of CachedGame instances for text of a game.
+
+        key is the game class name used in the cache and parser is the PGN
+        instance used on a miss.
+
+        text is usually one game, but may be more than one because the
+        PGNTagPair and PGN parsers do not detect errors in the same way, or
+        less than one when PGN continues the final game past text.
+
+        """
+        digest = hashlib.sha256(text.encode(_ENCODING)).digest()
+        self._used += 1
+        row = self.connection.execute(
+            "select result from games where game_class = ? and digest = ?",
+            (key, digest),
+        ).fetchone()
+        if row is not None:
+            self.hits += 1
+            self._updates.append((self._used, key, digest))
+            games = CachedGame.decode(row[0])
+        else:
+            self.misses += 1
+            games = [
+                CachedGame.from_game(game, fen=self.fen)
+                for game in parser.read_games(text)
+            ]
+            self._inserts.append(
+                (
+                    key,
+                    digest,
+                    self.version,
+                    self._used,
+                    encode_games(games),
+                )
+            )
+        if len(self._inserts) + len(self._updates) >= self.batch_size:
+            self._commit()
+        return games
+
+    def _commit(self):
+        """Apply outstanding changes, evict old entries, and commit."""
+        if self.connection is None:
+            return
+        cursor = self.connection.cursor()
+        try:
+            cursor.executemany(
+                "insert or replace into games values (?, ?, ?, ?, ?)",
+                self._inserts,
+            )
+            cursor.executemany(
+                "".join(
+                    (
+                        "update games set used = ? ",
+                        "where game_class = ? and digest = ?",
+                    )
+                ),
+                self._updates,
+            )
+            excess = (
+                cursor.execute("select count(*) from games").fetchone()[0]
+                - self.max_entries
+            )
+            if excess > 0:
+                cursor.execute(
+                    "".join(
+                        (
+                            "delete from games where rowid in (",
+                            "select rowid from games order by used limit ?)",
+                        )
+                    ),
+                    (excess,),
+                )
+            self.connection.commit()
+        finally:
+            cursor.close()
+        self._inserts = []
+        self._updates = []
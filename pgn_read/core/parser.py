@@ -53,10 +53,64 @@ from .constants import (
 ignore_case_format = re.compile(IGNORE_CASE_FORMAT)
 
 
+# Names of limits on a game, the value of limit_exceeded for a game cut off.
+MAX_GAME_CHARACTERS = "max_game_characters"
+MAX_TOKENS = "max_tokens"
+MAX_RAV_DEPTH = "max_rav_depth"
+MAX_COMMENT_LENGTH = "max_comment_length"
+
+# Limit on characters in a game when other limits are given without one.
+DEFAULT_MAX_GAME_CHARACTERS = 1000000
+
+# Tokens whose length is limited by max_comment_length.
+_COMMENT_TOKENS = frozenset(
+    (
+        IFG_COMMENT,
+        IFG_BAD_COMMENT,
+        IFG_COMMENT_TO_EOL,
+        IFG_RESERVED,
+        IFG_BAD_RESERVED,
+    )
+)
+
+# Reading resumes at a PGN Tag at the start of a line after a game is cut off.
+_RESYNC = "\n["
+
+
 class PGNError(Exception):
     """Exception raised for situations where PGN parsing cannot continue."""
 
 
+class _Scan:
+    """Iterate over tokens found by rules in string from a position.
+
+    The restart() method moves the scan to a new position.
+
+    """
+
+    def __init__(self, rules, string, start=0):
+        """Note rules, string, and start of scan."""
+        self.rules = rules
+        self.string = string
+        self.start = start
+        self._restart = start
+
+    def restart(self, start):
+        """Continue scan from start after the current token."""
+        self.start = start
+        self._restart = start
+
+    def __iter__(self):
+        """Yield tokens found by rules from start, or latest restart."""
+        while self._restart is not None:
+            start = self._restart
+            self._restart = None
+            for match in self.rules.finditer(self.string, start):
+                yield match
+                if self._restart is not None:
+                    break
+
+
 class PGN:
     """Extract tokens from text using definitions in PGN specification.
 
@@ -84,11 +138,47 @@ class PGN:
     Tokens 'Qc3' and 'e3' are passed one-by-one to a Game instance which
     decides which, if any, interpretation is valid.
 
+    The limits max_game_characters, max_tokens, max_rav_depth, and
+    max_comment_length, are None by default meaning no limit.  A game which
+    exceeds a limit is cut off at the token which exceeds it: the game is
+    yielded with an error and the name of the limit in limit_exceeded, and
+    reading resumes at the next PGN Tag at the start of a line.  The text of
+    an incomplete game held while reading the next chunk of source is then
+    limited by max_game_characters, or by max_comment_length when the game
+    has an unterminated comment, '{', or reserved, '<', sequence.
+
+    If any limit is given max_game_characters defaults to
+    DEFAULT_MAX_GAME_CHARACTERS, because an unterminated comment or reserved
+    sequence is one token whatever its length and does not increase the
+    depth of RAVs.
+
+    max_game_characters - characters from end of previous game to end of token
+    max_tokens - tokens, including ignored tokens like move numbers
+    max_rav_depth - depth of nested RAVs, '(...)'
+    max_comment_length - length of '{...}', ';...', or '<...>', token
+
     """
 
-    def __init__(self, game_class=Game):
+    def __init__(
+        self,
+        game_class=Game,
+        max_game_characters=None,
+        max_tokens=None,
+        max_rav_depth=None,
+        max_comment_length=None,
+    ):
         """Initialise switches to call game_class methods."""
         super().__init__()
+        if max_game_characters is None and not (
+            max_tokens is None
+            and max_rav_depth is None
+            and max_comment_length is None
+        ):
+            max_game_characters = DEFAULT_MAX_GAME_CHARACTERS
+        self.max_game_characters = max_game_characters
+        self.max_tokens = max_tokens
+        self.max_rav_depth = max_rav_depth
+        self.max_comment_length = max_comment_length
         if issubclass(game_class, GameIgnoreCasePGN):
             self._rules = ignore_case_format
         elif issubclass(game_class, GameTextPGN):
@@ -185,6 +275,29 @@ class PGN:
         finally:
             source.close()
 
+    def _limit_exceeded(self, match, characters, tokens, rav_depth):
+        """Return name of limit exceeded by game at match, or None.
+
+        characters, tokens, and rav_depth, are the game's values at match.
+
+        """
+        if (
+            self.max_game_characters is not None
+            and characters > self.max_game_characters
+        ):
+            return MAX_GAME_CHARACTERS
+        if self.max_tokens is not None and tokens > self.max_tokens:
+            return MAX_TOKENS
+        if self.max_rav_depth is not None and rav_depth > self.max_rav_depth:
+            return MAX_RAV_DEPTH
+        if (
+            self.max_comment_length is not None
+            and match.lastindex in _COMMENT_TOKENS
+            and match.end() - match.start() > self.max_comment_length
+        ):
+            return MAX_COMMENT_LENGTH
+        return None
+
     def read_games(self, source, size=10000000):
         """Extract games from file-like source or string.
 
@@ -198,6 +311,14 @@ class PGN:
         despatch_table = self.despatch_table
         error_despatch_table = self.error_despatch_table
         game_class = self._game_class
+        limited = (
+            self.max_game_characters is not None
+            or self.max_tokens is not None
+            or self.max_rav_depth is not None
+            or self.max_comment_length is not None
+        )
+        limited_game = None
+        skipping = False
         residue = ""
         pgntext_length = 0
         for pgntext in self._read_pgn(source, size):
@@ -212,7 +333,56 @@ class PGN:
             residue_start_on_error_at_pgntext_end = None
 
             game = game_class()
-            for match in self._rules.finditer(pgntext):
+            if not limited:
+                matches = self._rules.finditer(pgntext)
+            else:
+                # Discard text after a game cut off until a PGN Tag starts a
+                # line.  The last character is kept in case it is '\n'.
+                if skipping:
+                    resync = pgntext.find(_RESYNC)
+                    if resync < 0:
+                        residue = pgntext[-1:]
+                        continue
+                    skipping = False
+                    residue_start_on_error_at_pgntext_end = resync + 1
+                matches = _Scan(
+                    self._rules,
+                    pgntext,
+                    start=residue_start_on_error_at_pgntext_end or 0,
+                )
+            for match in matches:
+                if limited:
+                    if game is not limited_game:
+                        limited_game = game
+                        if residue_start_on_error_at_pgntext_end is None:
+                            game_start = matches.start
+                        else:
+                            game_start = residue_start_on_error_at_pgntext_end
+                        game_tokens = 0
+                        rav_depth = 0
+                    game_tokens += 1
+                    if match.lastindex == IFG_START_RAV:
+                        rav_depth += 1
+                    elif match.lastindex == IFG_END_RAV and rav_depth:
+                        rav_depth -= 1
+                    exceeded = self._limit_exceeded(
+                        match, match.end() - game_start, game_tokens, rav_depth
+                    )
+                    if exceeded is not None:
+                        game.set_game_error()
+                        game.limit_exceeded = exceeded
+                        game.game_offset = pgntext_offset + match.start()
+                        yield game
+                        game = game_class()
+                        resync = pgntext.find(_RESYNC, match.start() + 1) + 1
+                        if resync:
+                            residue_start_on_error_at_pgntext_end = resync
+                        else:
+                            skipping = True
+                            resync = len(pgntext)
+                            residue_start_on_error_at_pgntext_end = resync - 1
+                        matches.restart(resync)
+                        continue
                 if game.state is not None:
                     if match.lastindex == IFG_END_TAG:
                         # A PGN Tag in an error sequence starts a new game
@@ -275,6 +445,25 @@ class PGN:
             else:
                 residue = pgntext[residue_start_on_error_at_pgntext_end:]
 
+            # Trailing whitespace is the only way the residue can exceed
+            # max_game_characters.
+            if (
+                limited
+                and not skipping
+                and self.max_game_characters is not None
+                and len(residue) > self.max_game_characters
+            ):
+                if game.pgn_text:
+                    game.set_game_error()
+                    game.limit_exceeded = MAX_GAME_CHARACTERS
+                    game.game_offset = pgntext_length
+                    yield game
+                    game = game_class()
+                    skipping = True
+                    residue = residue[-1:]
+                else:
+                    residue = ""
+
         # The final game in the input has an error, or has no error but no game
         # termination marker either.
         if game.pgn_text:
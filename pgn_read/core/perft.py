@@ -0,0 +1,118 @@
+# perft.py
+# Copyright 2025 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Count legal move sequences from positions to test and time move making.
+
+perft(game, depth) is the number of sequences of legal moves, depth moves
+long, from the current position in game.  Each move is made by the
+_modify_game_state_* method used when reading games, and taken back by the
+unmake_move method, so the counts and times measure the board logic without
+the regular expressions which find tokens in PGN text.
+
+PERFT_POSITIONS are standard test positions with the known counts for
+depths 1, 2, 3, and so on.  A wrong count means a bug in move generation or
+in making and taking back moves: perft_divide gives the count after each
+legal move, for comparison with another program's counts.
+
+"""
+import time
+
+from .constants import TAG_FEN, TAG_SETUP, SETUP_VALUE_FEN_PRESENT
+from .gamedata import GameData, GameError
+
+# Name, Forsyth Edwards Notation (FEN), and counts for depths 1, 2, 3, ...
+PERFT_POSITIONS = (
+    (
+        "initial",
+        "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1",
+        (20, 400, 8902, 197281),
+    ),
+    (
+        "kiwipete",
+        "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1",
+        (48, 2039, 97862),
+    ),
+    (
+        "position 3",
+        "8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1",
+        (14, 191, 2812, 43238),
+    ),
+    (
+        "position 4",
+        "r3k2r/Pppp1ppp/1b3nbN/nP6/BBP1P3/q4N2/Pp1P2PP/R2Q1RK1 w kq - 0 1",
+        (6, 264, 9467, 422333),
+    ),
+    (
+        "position 5",
+        "rnbq1k1r/pp1Pbppp/2p5/8/2B5/8/PPP1NnPP/RNBQK2R w KQ - 1 8",
+        (44, 1486, 62379),
+    ),
+    (
+        "position 6",
+        "r4rk1/1pp1qppp/p1np1n2/2b1p1B1/2B1P1b1/P1NP1N2/1PP1QPPP/R4RK1 w - - "
+        "0 10",
+        (46, 2079, 89890),
+    ),
+)
+
+
+def game_for_position(fen):
+    """Return GameData instance with board set to position in fen.
+
+    GameError is raised if fen is not a valid position.
+
+    """
+    game = GameData()
+    game.pgn_tags[TAG_FEN] = fen
+    game.pgn_tags[TAG_SETUP] = SETUP_VALUE_FEN_PRESENT
+    if not game.set_initial_position():
+        raise GameError("".join(("Invalid FEN '", fen, "'")))
+    return game
+
+
+def perft(game, depth):
+    """Return number of legal move sequences, depth long, from game.
+
+    The position in game is unchanged when perft returns.
+
+    """
+    if depth < 1:
+        return 1
+    moves = game.generate_legal_moves()
+    if depth == 1:
+        return len(moves)
+    count = 0
+    for movetext, modify, arguments in moves:
+        modify(*arguments)
+        count += perft(game, depth - 1)
+        game.unmake_move()
+    return count
+
+
+def perft_divide(game, depth):
+    """Return dict of movetext mapped to perft count after the move."""
+    counts = {}
+    for movetext, modify, arguments in game.generate_legal_moves():
+        modify(*arguments)
+        counts[movetext] = perft(game, depth - 1)
+        game.unmake_move()
+    return counts
+
+
+def perft_positions(positions=PERFT_POSITIONS, maximum_depth=None):
+    """Yield (name, depth, count, expected count, seconds) for positions.
+
+    Each position is counted for each depth with a known count, up to
+    maximum_depth if given.  The time taken includes the moves at all
+    depths up to depth, so count / seconds is the leaf nodes per second.
+
+    """
+    for name, fen, expected_counts in positions:
+        for depth, expected in enumerate(expected_counts, start=1):
+            if maximum_depth is not None and depth > maximum_depth:
+                break
+            game = game_for_position(fen)
+            start = time.perf_counter()
+            count = perft(game, depth)
+            yield name, depth, count, expected, time.perf_counter() - start
@@ -0,0 +1,270 @@
+# shared_games.py
+# Copyright 2025 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Pass the results of parsing games in worker processes in shared memory.
+
+The SharedMemoryPGN class extends thread_parser.ThreadPoolPGN to parse the
+chunks of PGN text in a ProcessPoolExecutor without pickling the text or the
+Game instances.  Each chunk is put in a multiprocessing.shared_memory block
+which the worker decodes and parses.  The worker puts a flat summary of
+each game in a new shared memory block: the game offset, error state, and
+error list, as arrays, and the tags as length-prefixed strs.  Only the name
+of the block is pickled and returned.
+
+The games are yielded as SharedGame instances holding the summary and the
+text of the game.  SharedGame.game() parses the text to give the Game, or
+game_class, instance when it is needed.
+
+multiprocessing.shared_memory is available in Python 3.8 and later.
+
+"""
+import struct
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from .parser import PGN
+from .thread_parser import ThreadPoolPGN, parse_chunk
+
+# Games, items in error lists, and tag names and values, in summary.
+_header = struct.Struct("<III")
+
+# Typecodes of the arrays in a summary, after the header, in order:
+# game offset, state, count of errors, and count of tags, for each game
+# followed by the error lists, and the lengths of the encoded tag names and
+# values.  The encoded tag names and values follow the arrays.
+_GAME_TYPECODES = ("q", "i", "I", "I")
+_ERROR_TYPECODE = "I"
+_LENGTH_TYPECODE = "I"
+
+# State in summary for games without errors.
+_NO_STATE = -1
+
+# Tag names and values are length-prefixed rather than separated because
+# tag values can contain any character, including newline.
+_ENCODING = "utf-8"
+
+
+class SharedGame:
+    """Summary of a game parsed in another process and text of the game.
+
+    The properties give the same answers as the corresponding Game
+    properties for the parsed game.
+
+    """
+
+    def __init__(self, game_class, text, tags, state, error_list, offset):
+        """Note summary of game and text for building game on demand."""
+        self._game_class = game_class
+        self.text = text
+        self._tags = tags
+        self._state = state
+        self._error_list = error_list
+        self.game_offset = offset
+
+    @property
+    def pgn_tags(self):
+        """Return _tags dict of PGN tag names and values."""
+        return self._tags
+
+    @property
+    def state(self):
+        """Return the token offset where PGN error in game occured."""
+        return self._state
+
+    @property
+    def error_list(self):
+        """Return token offsets of PGN errors in RAVs and the main line."""
+        return self._error_list
+
+    @property
+    def game_ok(self):
+        """Return True if game and all variations have no PGN errors."""
+        return bool(self._state is None and not self._error_list)
+
+    @property
+    def game_has_errors(self):
+        """Return True if game has PGN errors: variations are ignored."""
+        return bool(self._state is not None)
+
+    def game(self):
+        """Return game_class instance created by parsing text of game."""
+        for game in PGN(game_class=self._game_class).read_games(self.text):
+            game.game_offset = self.game_offset
+            return game
+        return None
+
+
+def encode_games(games):
+    """Return bytes summary of games: offsets, states, errors, and tags."""
+    columns = tuple(array(typecode) for typecode in _GAME_TYPECODES)
+    offsets, states, error_counts, tag_counts = columns
+    error_lists = array(_ERROR_TYPECODE)
+    tags = []
+    for game in games:
+        offsets.append(game.game_offset)
+        states.append(_NO_STATE if game.state is None else game.state)
+        error_counts.append(len(game.error_list))
+        error_lists.extend(game.error_list)
+        tag_counts.append(len(game.pgn_tags))
+        for name, value in game.pgn_tags.items():
+            tags.append(name.encode(_ENCODING))
+            tags.append(value.encode(_ENCODING))
+    tag_lengths = array(_LENGTH_TYPECODE, (len(tag) for tag in tags))
+    return b"".join(
+        (_header.pack(len(offsets), len(error_lists), len(tags)),)
+        + tuple(column.tobytes() for column in columns)
+        + (error_lists.tobytes(), tag_lengths.tobytes())
+        + tuple(tags)
+    )
+
+
+def decode_games(buffer, game_class, text, start):
+    """Return list of SharedGame for summary in buffer of games in text.
+
+    start is the offset of text in the PGN text being read.
+
+    """
+    game_count, error_count, tag_count = _header.unpack_from(buffer)
+    position = _header.size
+    columns = []
+    for typecode, count in zip(
+        _GAME_TYPECODES + (_ERROR_TYPECODE, _LENGTH_TYPECODE),
+        (game_count,) * len(_GAME_TYPECODES) + (error_count, tag_count),
+    ):
+        column = array(typecode)
+        length = column.itemsize * count
+        column.frombytes(buffer[position : position + length])
+        columns.append(column)
+        position += length
+    offsets, states, error_counts, tag_counts, error_lists, tag_lengths = (
+        columns
+    )
+    tags = []
+    for length in tag_lengths:
+        tags.append(
+            bytes(buffer[position : position + length]).decode(_ENCODING)
+        )
+        position += length
+    tags = iter(tags)
+    games = []
+    game_start = 0
+    error_start = 0
+    for offset, state, errors, tag_count in zip(
+        offsets, states, error_counts, tag_counts
+    ):
+        games.append(
+            SharedGame(
+                game_class,
+                text[game_start:offset],
+                {next(tags): next(tags) for i in range(tag_count)},
+                None if state == _NO_STATE else state,
+                error_lists[error_start : error_start + errors].tolist(),
+                start + offset,
+            )
+        )
+        game_start = offset
+        error_start += errors
+    return games
+
+
+def parse_shared_chunk(game_class, name, length):
+    """Parse text in shared memory block and return summary in a new block.
+
+    name is the name of the shared memory block holding length bytes of
+    encoded text.
+
+    Return the name and size of the summary's block, and True if the text
+    ends with a game termination marker, see parse_chunk().  The caller is
+    responsible for unlinking the summary's block.
+
+    """
+    block = shared_memory.SharedMemory(name=name)
+    try:
+        text = bytes(block.buf[:length]).decode(_ENCODING)
+    finally:
+        block.close()
+    games, cut = parse_chunk(game_class, text)
+    summary = encode_games(games)
+    block = shared_memory.SharedMemory(create=True, size=len(summary))
+    try:
+        block.buf[: len(summary)] = summary
+    finally:
+        block.close()
+    return block.name, len(summary), cut
+
+
+class SharedMemoryPGN(ThreadPoolPGN):
+    """Read games from PGN text in chunks parsed by worker processes.
+
+    executor is a concurrent.futures executor, which is not shut down by
+    SharedMemoryPGN, or None to use a ProcessPoolExecutor with max_workers
+    processes for each read_games() call.
+
+    """
+
+    def read_games(self, source, size=10000000):
+        """Yield SharedGame instances for games in source.
+
+        source and size are as in PGN read_games().
+
+        """
+        if self.executor is None:
+            with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                yield from self._read_games(executor, source, size)
+        else:
+            yield from self._read_games(self.executor, source, size)
+
+    def _submit(self, executor, text):
+        """Return shared memory block holding text and future for parse."""
+        data = text.encode(_ENCODING)
+        block = shared_memory.SharedMemory(create=True, size=max(len(data), 1))
+        block.buf[: len(data)] = data
+        return block, executor.submit(
+            parse_shared_chunk, self.game_class, block.name, len(data)
+        )
+
+    def _discard_chunk(self, chunk):
+        """Release shared memory of chunk after read_games() closed."""
+        self._chunk_summary(chunk[2])
+
+    def _chunk_games(self, chunk, carry, last):
+        """Yield games in chunk and return None, or return text to carry.
+
+        chunk is the offset, text, and shared memory block and future, of a
+        chunk and carry is None or the offset and text of the chunks before
+        chunk which must be parsed with chunk.
+
+        """
+        start, text, submitted = chunk
+        summary, cut = self._chunk_summary(submitted)
+        if carry is not None:
+            start, text = carry[0], carry[1] + text
+            games, cut = parse_chunk(self.game_class, text)
+            summary = encode_games(games)
+        if not (cut or last):
+            return start, text
+        yield from decode_games(summary, self.game_class, text, start)
+        return None
+
+    @staticmethod
+    def _chunk_summary(submitted):
+        """Return summary and cut for parse and release shared memory.
+
+        submitted is the shared memory block holding the text and the future
+        for the parse.
+
+        """
+        block, future = submitted
+        try:
+            name, length, cut = future.result()
+        finally:
+            block.close()
+            block.unlink()
+        block = shared_memory.SharedMemory(name=name)
+        try:
+            return bytes(block.buf[:length]), cut
+        finally:
+            block.close()
+            block.unlink()
@@ -0,0 +1,222 @@
+# split_pgn.py
+# Copyright 2025 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Split a PGN file into shards of about equal size, or game count.
+
+The split_pgn function finds where games end with the PGNTagPair parser and
+the GameCount class, which do not play the moves, and copies the text
+between the chosen game ends to the shard files in large writes.  No game
+is split between shards.
+
+The file is read twice: once to find the game ends and once to copy the
+text.  The shards are balanced by the number of characters, or by the
+number of games, in each shard.
+
+A manifest giving the file name, game count, and start and end offsets in
+the source, of each shard is written as a JSON file with the shards.
+
+Source files with names ending '.gz', '.bz2', or '.xz', are decompressed
+while read, and shard files are compressed if their suffix ends with one of
+these.
+
+"""
+import os
+import io
+import json
+import bz2
+import gzip
+import lzma
+from array import array
+from bisect import bisect_left
+
+from .tagpair_parser import PGNTagPair, GameCount
+
+# Ways of balancing the shards.
+BALANCE_SIZE = "size"
+BALANCE_COUNT = "count"
+
+# Name of manifest file written with the shards.
+MANIFEST_NAME = "manifest.json"
+
+# Shard file names are SHARD_PREFIX, shard number, and suffix.
+SHARD_PREFIX = "shard_"
+SHARD_SUFFIX = ".pgn"
+
+# Functions which open compressed files in text mode, by file name suffix.
+COMPRESSION = {
+    ".gz": gzip.open,
+    ".bz2": bz2.open,
+    ".xz": lzma.open,
+}
+
+# Typecode for the game end offsets.
+_OFFSET = "Q"
+
+
+class SplitPGNError(Exception):
+    """Exception raised where a PGN file cannot be split as requested."""
+
+
+def open_pgn_file(path, mode="r", encoding="iso-8859-1"):
+    """Return text file object for path, decompressing by file name suffix.
+
+    mode is 'r' or 'w'.  Files with names ending in a COMPRESSION suffix
+    are opened by the corresponding function.
+
+    Newlines are not translated, so offsets in the text read are offsets
+    in the file's characters and shards keep the source's line endings.
+
+    """
+    opener = COMPRESSION.get(os.path.splitext(path)[1])
+    if opener is None:
+        return open(path, mode=mode, encoding=encoding, newline="")
+    return opener(path, mode=mode + "t", encoding=encoding, newline="")
+
+
+class _CountedSource:
+    """File-like object which counts characters read from source."""
+
+    def __init__(self, source):
+        """Note source and start count at zero."""
+        self._source = source
+        self.end = 0
+
+    def read(self, size):
+        """Return text read from source after adding length to count."""
+        text = self._source.read(size)
+        self.end += len(text)
+        return text
+
+    def close(self):
+        """Close source."""
+        self._source.close()
+
+
+def find_game_ends(source, size=10000000):
+    """Return array of game end offsets and length of text in source.
+
+    source is a file-like object or str.  The offsets are the game_offset
+    values given by PGNTagPair read_games() for GameCount instances.  Text
+    after the last game termination marker is not counted as a game.
+
+    """
+    if isinstance(source, str):
+        source = io.StringIO(source)
+    source = _CountedSource(source)
+    ends = array(_OFFSET)
+    for game in PGNTagPair(game_class=GameCount).read_games(source, size=size):
+        ends.append(game.game_offset)
+    return ends, source.end
+
+
+def _nearest_game_end(ends, offset):
+    """Return game end in ends nearest to offset, or 0 if no games."""
+    if not ends:
+        return 0
+    index = bisect_left(ends, offset)
+    if index == len(ends):
+        index -= 1
+    elif index and offset - ends[index - 1] < ends[index] - offset:
+        index -= 1
+    return ends[index]
+
+
+def shard_boundaries(ends, length, shards, balance=BALANCE_SIZE):
+    """Return list of offsets where shards start, and length.
+
+    ends is the array of game end offsets and length is the length of the
+    text, as returned by find_game_ends.  Each boundary except 0 and length
+    is a game end.  Shards are empty, giving equal boundaries, if there are
+    fewer games than shards.
+
+    """
+    if shards < 1:
+        raise SplitPGNError("Number of shards must be at least 1")
+    if balance not in (BALANCE_SIZE, BALANCE_COUNT):
+        raise SplitPGNError(
+            "".join(
+                (
+                    "Balance must be '",
+                    BALANCE_SIZE,
+                    "' or '",
+                    BALANCE_COUNT,
+                    "'",
+                )
+            )
+        )
+    games = len(ends)
+    boundaries = [0]
+    for shard in range(1, shards):
+        if balance == BALANCE_COUNT:
+            index = (shard * games) // shards
+            boundary = ends[index - 1] if index else 0
+        else:
+            boundary = _nearest_game_end(ends, (shard * length) // shards)
+        boundaries.append(max(boundaries[-1], boundary))
+    boundaries.append(length)
+    return boundaries
+
+
+def split_pgn(
+    path,
+    directory,
+    shards,
+    balance=BALANCE_SIZE,
+    suffix=SHARD_SUFFIX,
+    encoding="iso-8859-1",
+    size=10000000,
+):
+    """Split PGN file at path into shards in directory and return manifest.
+
+    The shard files are named SHARD_PREFIX, shard number, and suffix: give a
+    suffix like '.pgn.gz' to compress the shards.  size is the number of
+    characters read from path, and written to a shard, in each call.
+
+    The manifest is also written to MANIFEST_NAME in directory.
+
+    """
+    with open_pgn_file(path, encoding=encoding) as source:
+        ends, length = find_game_ends(source, size=size)
+    boundaries = shard_boundaries(ends, length, shards, balance=balance)
+    manifest_shards = []
+    with open_pgn_file(path, encoding=encoding) as source:
+        position = 0
+        text = ""
+        for shard, (start, end) in enumerate(
+            zip(boundaries[:-1], boundaries[1:])
+        ):
+            name = "".join((SHARD_PREFIX, str(shard).zfill(3), suffix))
+            with open_pgn_file(
+                os.path.join(directory, name), mode="w", encoding=encoding
+            ) as shard_file:
+                while position < end:
+                    if not text:
+                        text = source.read(size)
+                        if not text:
+                            break
+                    copy = text[: end - position]
+                    shard_file.write(copy)
+                    position += len(copy)
+                    text = text[len(copy) :]
+            manifest_shards.append(
+                {
+                    "name": name,
+                    "games": bisect_left(ends, end + 1)
+                    - bisect_left(ends, start + 1),
+                    "start": start,
+                    "end": end,
+                }
+            )
+    manifest = {
+        "source": path,
+        "balance": balance,
+        "games": len(ends),
+        "length": length,
+        "shards": manifest_shards,
+    }
+    with open(
+        os.path.join(directory, MANIFEST_NAME), mode="w", encoding="utf-8"
+    ) as file:
+        json.dump(manifest, file, indent=1)
+    return manifest
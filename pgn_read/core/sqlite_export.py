@@ -0,0 +1,309 @@
+# sqlite_export.py
+# Copyright 2025 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Export games read by parser.PGN to a SQLite database.
+
+The SQLiteExport class writes games, tags, moves, and errors, to a
+normalised schema.  Tag names and tag values are held once each in the
+tag_names and tag_values tables and referred to by number from the
+game_tags table.  Optionally the position after each move is recorded as
+an Extended Position Description (EPD), held once each in the positions
+table, so games reaching a position can be found by a join.
+
+Rows are inserted by executemany calls for batches of games, and each
+batch is committed as a single transaction.  The default pragmas trade
+safety for speed: a database being written when the program, or computer,
+crashes may be corrupt.
+
+Moves are found by the GameData iter_positions method, or iter_movetext
+method if positions are not recorded, so the moves recorded are those
+played in the main line and RAVs up to any error.
+
+"""
+import sqlite3
+
+from .game import Game
+from .parser import PGN
+
+# Applied to the connection when the exporter is created.
+PRAGMAS = (
+    "pragma journal_mode = memory",
+    "pragma synchronous = off",
+    "pragma temp_store = memory",
+    "pragma cache_size = -65536",
+)
+
+# The games per transaction.
+BATCH_SIZE = 10000
+
+# Separators for elements of the RAV path in the moves table.
+PATH_ELEMENT_SEPARATOR = " "
+PATH_ITEM_SEPARATOR = "."
+
+SCHEMA = (
+    "".join(
+        (
+            "create table if not exists games (",
+            "game integer primary key, ",
+            "game_offset integer, ",
+            "state integer, ",
+            "pgn text)",
+        )
+    ),
+    "".join(
+        (
+            "create table if not exists tag_names (",
+            "tag_name integer primary key, ",
+            "name text unique)",
+        )
+    ),
+    "".join(
+        (
+            "create table if not exists tag_values (",
+            "tag_value integer primary key, ",
+            "value text unique)",
+        )
+    ),
+    "".join(
+        (
+            "create table if not exists game_tags (",
+            "game integer, ",
+            "tag_name integer, ",
+            "tag_value integer)",
+        )
+    ),
+    "".join(
+        (
+            "create table if not exists moves (",
+            "game integer, ",
+            "move integer, ",
+            "ply integer, ",
+            "path text, ",
+            "movetext text, ",
+            "position integer)",
+        )
+    ),
+    "".join(
+        (
+            "create table if not exists positions (",
+            "position integer primary key, ",
+            "epd text unique)",
+        )
+    ),
+    "".join(
+        (
+            "create table if not exists errors (",
+            "game integer, ",
+            "token integer, ",
+            "text text)",
+        )
+    ),
+)
+
+# Created after the rows are inserted because maintaining the indicies
+# during bulk insertion is slow.
+INDICIES = (
+    "create index if not exists game_tags_value on "
+    "game_tags (tag_name, tag_value)",
+    "create index if not exists game_tags_game on game_tags (game)",
+    "create index if not exists moves_game on moves (game, move)",
+    "create index if not exists moves_position on moves (position)",
+    "create index if not exists errors_game on errors (game)",
+)
+
+
+def encode_path(path):
+    """Return str for RAV path from GameData iter_positions method.
+
+    The path ((1, 1), (2, 3)) is encoded as '1.1 2.3', and () as ''.
+
+    """
+    return PATH_ELEMENT_SEPARATOR.join(
+        PATH_ITEM_SEPARATOR.join((str(ply), str(number)))
+        for ply, number in path
+    )
+
+
+def decode_path(text):
+    """Return RAV path encoded by encode_path."""
+    return tuple(
+        tuple(int(i) for i in element.split(PATH_ITEM_SEPARATOR))
+        for element in text.split()
+    )
+
+
+class SQLiteExport:
+    """Export games to a SQLite database with a normalised schema.
+
+    Games are numbered from one more than the highest game number in the
+    database, so several PGN files can be exported to one database.
+
+    """
+
+    def __init__(
+        self,
+        database,
+        positions=False,
+        batch_size=BATCH_SIZE,
+        pragmas=PRAGMAS,
+    ):
+        """Open database and create schema if necessary.
+
+        database is a path or ':memory:' as for sqlite3.connect.  Positions
+        are recorded if positions is True.
+
+        """
+        self.positions = positions
+        self.batch_size = batch_size
+        self.connection = sqlite3.connect(database)
+        cursor = self.connection.cursor()
+        try:
+            for pragma in pragmas:
+                cursor.execute(pragma)
+            for statement in SCHEMA:
+                cursor.execute(statement)
+            self.connection.commit()
+            self._tag_names = dict(
+                cursor.execute("select name, tag_name from tag_names")
+            )
+            self._tag_values = dict(
+                cursor.execute("select value, tag_value from tag_values")
+            )
+            self._positions = dict(
+                cursor.execute("select epd, position from positions")
+            )
+            self._next_game = (
+                cursor.execute("select max(game) from games").fetchone()[0]
+                or 0
+            ) + 1
+        finally:
+            cursor.close()
+
+    def close(self):
+        """Create indicies and close database."""
+        cursor = self.connection.cursor()
+        try:
+            for statement in INDICIES:
+                cursor.execute(statement)
+            self.connection.commit()
+        finally:
+            cursor.close()
+        self.connection.close()
+        self.connection = None
+
+    def export_pgn(self, source, game_class=Game):
+        """Export games read from source by parser.PGN read_games().
+
+        Return the number of games exported.
+
+        """
+        return self.export_games(PGN(game_class=game_class).read_games(source))
+
+    def export_games(self, games):
+        """Export games, an iterable of Game instances, and return count.
+
+        Each batch of games is inserted and committed when complete, and
+        the final partial batch when games is exhausted.
+
+        """
+        batch_size = self.batch_size
+        tables = _Rows()
+        count = 0
+        for game in games:
+            self._add_game(game, tables)
+            count += 1
+            if count % batch_size == 0:
+                self._insert(tables)
+                tables = _Rows()
+        self._insert(tables)
+        return count
+
+    def _add_game(self, game, tables):
+        """Add rows for game to tables."""
+        number = self._next_game
+        self._next_game += 1
+        tables.games.append(
+            (number, game.game_offset, game.state, game.get_text_of_game())
+        )
+        tag_names = self._tag_names
+        tag_values = self._tag_values
+        game_tags = tables.game_tags
+        for name, value in game.pgn_tags.items():
+            name_number = tag_names.get(name)
+            if name_number is None:
+                name_number = len(tag_names) + 1
+                tag_names[name] = name_number
+                tables.tag_names.append((name_number, name))
+            value_number = tag_values.get(value)
+            if value_number is None:
+                value_number = len(tag_values) + 1
+                tag_values[value] = value_number
+                tables.tag_values.append((value_number, value))
+            game_tags.append((number, name_number, value_number))
+        moves = tables.moves
+        if self.positions:
+            positions = self._positions
+            for move, item in enumerate(game.iter_positions(epd=True)):
+                ply, path, movetext, epd = item
+                position = positions.get(epd)
+                if position is None:
+                    position = len(positions) + 1
+                    positions[epd] = position
+                    tables.positions.append((position, epd))
+                moves.append(
+                    (number, move, ply, encode_path(path), movetext, position)
+                )
+        else:
+            for move, item in enumerate(game.iter_movetext()):
+                ply, path, movetext = item
+                moves.append(
+                    (number, move, ply, encode_path(path), movetext, None)
+                )
+        text = game.pgn_text
+        tables.errors.extend(
+            (number, token, text[token]) for token in game.error_list
+        )
+
+    def _insert(self, tables):
+        """Insert rows in tables and commit."""
+        cursor = self.connection.cursor()
+        try:
+            cursor.executemany(
+                "insert into tag_names values (?, ?)", tables.tag_names
+            )
+            cursor.executemany(
+                "insert into tag_values values (?, ?)", tables.tag_values
+            )
+            cursor.executemany(
+                "insert into positions values (?, ?)", tables.positions
+            )
+            cursor.executemany(
+                "insert into games values (?, ?, ?, ?)", tables.games
+            )
+            cursor.executemany(
+                "insert into game_tags values (?, ?, ?)", tables.game_tags
+            )
+            cursor.executemany(
+                "insert into moves values (?, ?, ?, ?, ?, ?)", tables.moves
+            )
+            cursor.executemany(
+                "insert into errors values (?, ?, ?)", tables.errors
+            )
+            self.connection.commit()
+        finally:
+            cursor.close()
+
+
+class _Rows:
+    """Rows for each table waiting to be inserted in database."""
+
+    def __init__(self):
+        """Create empty lists of rows."""
+        self.games = []
+        self.tag_names = []
+        self.tag_values = []
+        self.game_tags = []
+        self.moves = []
+        self.positions = []
+        self.errors = []
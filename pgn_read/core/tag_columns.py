@@ -0,0 +1,372 @@
+# tag_columns.py
+# Copyright 2025 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Read selected PGN tag values as column oriented batches of games.
+
+The TagColumnsReader class uses the tagpair_parser.PGNTagPair parser to
+collect the values of the requested PGN tags, and a few derived values, for
+batches of games.  Each batch is a TagColumns instance holding one list, or
+array, for each column.  Memory used is bounded by the batch size whatever
+the size of the PGN file.
+
+Batches can be written to a CSV file by write_csv, or to a simple columnar
+file by write_columns which is read back by read_columns.
+
+The derived values are the number of moves in the main line, ply_count,
+whether a badly formed or duplicate tag was found, tag_error, and the
+game_offset set by PGNTagPair read_games().  The ply count is counted from
+the movetext without checking the moves are legal.
+
+"""
+import sys
+import re
+import csv
+import struct
+from array import array
+from itertools import accumulate
+
+from .constants import SEVEN_TAG_ROSTER
+from .tagpair_parser import PGNTagPair, GameCount, decode_bad_tag
+
+# Names of derived columns which follow the tag columns in each batch.
+PLY_COUNT = "ply_count"
+TAG_ERROR = "tag_error"
+GAME_OFFSET = "game_offset"
+DERIVED_COLUMNS = (PLY_COUNT, TAG_ERROR, GAME_OFFSET)
+
+DEFAULT_TAG_NAMES = SEVEN_TAG_ROSTER + ("WhiteElo", "BlackElo", "ECO")
+
+# The games in a batch except the final batch.
+BATCH_SIZE = 10000
+
+# Identify file as tag columns file and the layout version.
+COLUMNS_MAGIC = b"PGNTAGCL"
+COLUMNS_VERSION = 1
+_header = struct.Struct("<8sIII")
+_batch_header = struct.Struct("<I")
+
+# Typecodes for derived columns and offsets of values in tag columns.
+_DERIVED_TYPECODES = {PLY_COUNT: "I", TAG_ERROR: "B", GAME_OFFSET: "Q"}
+_VALUE_OFFSET = "I"
+
+_COLUMN_NAME_SEPARATOR = "\n"
+_VALUE_ENCODING = "utf-8"
+
+# Movetext elements relevant to counting moves in the main line.  Comments
+# and reserved sequences are matched to skip over them.  Group 1 is start
+# RAV, group 2 is end RAV, and group 3 is a move.
+_movetext_moves = re.compile(
+    r"|".join(
+        (
+            r"\{[^}]*\}",
+            r";[^\n]*",
+            r"<[^>]*>",
+            r"(\()",
+            r"(\))",
+            r"([KQRBN][a-h]?[1-8]?x?[a-h][1-8]|[a-h](?:x[a-h])?[1-8]"
+            r"|O-O-O|O-O|--)",
+        )
+    )
+)
+
+
+class TagColumnsError(Exception):
+    """Exception raised reading a tag columns file."""
+
+
+def count_main_line_moves(text):
+    """Return number of moves outside RAVs, comments, and reserved, in text.
+
+    The moves are not checked for legality.
+
+    """
+    depth = 0
+    count = 0
+    for start_rav, end_rav, move in _movetext_moves.findall(text):
+        if move:
+            if not depth:
+                count += 1
+        elif start_rav:
+            depth += 1
+        elif end_rav and depth:
+            depth -= 1
+    return count
+
+
+class TagColumnsGame(GameCount):
+    """Note values of selected PGN tags in a list rather than a dict.
+
+    Subclasses created by tag_columns_game_class() say which tags are noted
+    and where in the list the values are put.  Values of other tags are not
+    kept.  None means the tag was not found.
+
+    """
+
+    # Map of tag name to index in values list.
+    _column_numbers = {}
+
+    # Values for tags not found in game.
+    _empty_values = ()
+
+    def __init__(self):
+        """Extend to note tag values and derived values."""
+        super().__init__()
+        self.values = list(self._empty_values)
+        self.ply_count = 0
+        self.tag_error = False
+        self._movetext_start = None
+
+    def append_start_tag(self, match):
+        """Note value for tag name if tag is one of the selected tags.
+
+        Put game in error state if a duplicate tag name is found.
+
+        """
+        if self._state is not None:
+            self.append_token_and_set_error(match)
+            return
+        self._movetext_start = match.end()
+        self._set_tag_value(match.group(1), match.group(2))
+
+    def append_bad_tag_and_set_error(self, match):
+        """Note value for badly formed tag and note tag error."""
+        self._movetext_start = match.end()
+        self.tag_error = True
+        self._set_tag_value(*decode_bad_tag(match.group()))
+
+    def append_token_and_set_error(self, match):
+        """Extend to note start of movetext if no tags found."""
+        if self._movetext_start is None:
+            self._movetext_start = match.start()
+        super().append_token_and_set_error(match)
+
+    def append_game_termination(self, match):
+        """Note the number of moves in main line."""
+        self._count_moves(match)
+
+    def append_game_termination_after_error(self, match):
+        """Extend to note the number of moves in main line."""
+        super().append_game_termination_after_error(match)
+        self._count_moves(match)
+
+    def _set_tag_value(self, tag_name, tag_value):
+        """Note tag_value if tag_name is selected, unless a duplicate."""
+        column = self._column_numbers.get(tag_name)
+        if column is None:
+            return
+        if self.values[column] is not None:
+            self.tag_error = True
+            if self._state is None:
+                self._state = len(self._text)
+            return
+        self.values[column] = tag_value
+
+    def _count_moves(self, match):
+        """Count moves in main line from start of movetext to match."""
+        if self._movetext_start is not None:
+            self.ply_count = count_main_line_moves(
+                match.string[self._movetext_start : match.start()]
+            )
+
+
+def tag_columns_game_class(tag_names):
+    """Return TagColumnsGame subclass which notes values of tag_names."""
+    tag_names = tuple(tag_names)
+    return type(
+        TagColumnsGame.__name__,
+        (TagColumnsGame,),
+        {
+            "_column_numbers": {
+                name: number for number, name in enumerate(tag_names)
+            },
+            "_empty_values": (None,) * len(tag_names),
+        },
+    )
+
+
+class TagColumns:
+    """A batch of games with one list or array per column.
+
+    Tag columns are lists of str, or None where the tag is absent, and the
+    derived columns are arrays of int.
+
+    """
+
+    def __init__(self, tag_names, columns=None):
+        """Create empty batch, or batch with columns, for tag_names."""
+        self.tag_names = tuple(tag_names)
+        self.names = self.tag_names + DERIVED_COLUMNS
+        if columns is None:
+            columns = [[] for name in self.tag_names] + [
+                array(_DERIVED_TYPECODES[name]) for name in DERIVED_COLUMNS
+            ]
+        self.columns = tuple(columns)
+
+    def __len__(self):
+        """Return number of games in batch."""
+        return len(self.columns[-1])
+
+    def column(self, name):
+        """Return column for name."""
+        return self.columns[self.names.index(name)]
+
+    def rows(self):
+        """Return iterator of rows, a tuple of values for each game."""
+        return zip(*self.columns)
+
+
+class TagColumnsReader:
+    """Read values of PGN tags for games as batches of columns."""
+
+    def __init__(self, tag_names=DEFAULT_TAG_NAMES, batch_size=BATCH_SIZE):
+        """Note tags to be read and games per batch."""
+        self.tag_names = tuple(tag_names)
+        self.batch_size = batch_size
+        self._parser = PGNTagPair(
+            game_class=tag_columns_game_class(self.tag_names)
+        )
+
+    def read_batches(self, source, size=10000000):
+        """Yield TagColumns instances for games in source.
+
+        Each batch has batch_size games except the last which may have
+        fewer.  source and size are as in PGNTagPair read_games().
+
+        """
+        tag_names = self.tag_names
+        batch_size = self.batch_size
+        batch = TagColumns(tag_names)
+        tag_columns = batch.columns[: len(tag_names)]
+        ply_counts, tag_errors, game_offsets = batch.columns[len(tag_names) :]
+        for game in self._parser.read_games(source, size=size):
+            for column, value in zip(tag_columns, game.values):
+                column.append(value)
+            ply_counts.append(game.ply_count)
+            tag_errors.append(game.tag_error)
+            game_offsets.append(game.game_offset)
+            if len(game_offsets) == batch_size:
+                yield batch
+                batch = TagColumns(tag_names)
+                tag_columns = batch.columns[: len(tag_names)]
+                ply_counts, tag_errors, game_offsets = batch.columns[
+                    len(tag_names) :
+                ]
+        if len(batch):
+            yield batch
+
+
+def write_csv(batches, file):
+    """Write batches to file, opened with newline='', in CSV format.
+
+    The first row is the column names.  Absent tags are written as empty
+    values.
+
+    """
+    writer = csv.writer(file)
+    header = None
+    for batch in batches:
+        if header is None:
+            header = batch.names
+            writer.writerow(header)
+        writer.writerows(batch.rows())
+
+
+def write_columns(batches, path, tag_names=DEFAULT_TAG_NAMES):
+    """Write batches to columnar file at path.
+
+    tag_names must be the tag names in each batch, and is used to write the
+    file header when there are no batches.  Absent tags are written as
+    empty values.  Numbers are written in little-endian order whatever the
+    platform.
+
+    """
+    names = _COLUMN_NAME_SEPARATOR.join(
+        tuple(tag_names) + DERIVED_COLUMNS
+    ).encode(_VALUE_ENCODING)
+    with open(path, mode="wb") as file:
+        file.write(
+            _header.pack(
+                COLUMNS_MAGIC, COLUMNS_VERSION, len(tag_names), len(names)
+            )
+        )
+        file.write(names)
+        for batch in batches:
+            file.write(_batch_header.pack(len(batch)))
+            for column in batch.columns[: len(batch.tag_names)]:
+                values = [
+                    b"" if v is None else v.encode(_VALUE_ENCODING)
+                    for v in column
+                ]
+                offsets = array(_VALUE_OFFSET, (0,))
+                offsets.extend(accumulate(len(v) for v in values))
+                _write_array(offsets, file)
+                file.write(b"".join(values))
+            for column in batch.columns[len(batch.tag_names) :]:
+                _write_array(column, file)
+
+
+def read_columns(path):
+    """Yield TagColumns instances for batches in columnar file at path."""
+    with open(path, mode="rb") as file:
+        header = file.read(_header.size)
+        if len(header) != _header.size:
+            raise TagColumnsError(path + " is not a tag columns file")
+        magic, version, tag_count, length = _header.unpack(header)
+        if magic != COLUMNS_MAGIC:
+            raise TagColumnsError(path + " is not a tag columns file")
+        if version != COLUMNS_VERSION:
+            raise TagColumnsError(
+                path + " tag columns file version is not supported"
+            )
+        tag_names = file.read(length).decode(_VALUE_ENCODING)
+        tag_names = tag_names.split(_COLUMN_NAME_SEPARATOR)[:tag_count]
+        while True:
+            batch_header = file.read(_batch_header.size)
+            if not batch_header:
+                break
+            if len(batch_header) != _batch_header.size:
+                raise TagColumnsError(path + " tag columns file is truncated")
+            (rows,) = _batch_header.unpack(batch_header)
+            try:
+                columns = []
+                for name in tag_names:
+                    offsets = _read_array(_VALUE_OFFSET, rows + 1, file)
+                    values = file.read(offsets[-1])
+                    if len(values) != offsets[-1]:
+                        raise EOFError
+                    columns.append(
+                        [
+                            values[start:end].decode(_VALUE_ENCODING)
+                            for start, end in zip(offsets, offsets[1:])
+                        ]
+                    )
+                for name in DERIVED_COLUMNS:
+                    columns.append(
+                        _read_array(_DERIVED_TYPECODES[name], rows, file)
+                    )
+            except EOFError as exc:
+                raise TagColumnsError(
+                    path + " tag columns file is truncated"
+                ) from exc
+            yield TagColumns(tag_names, columns)
+
+
+def _write_array(column, file):
+    """Write column to file in little-endian order."""
+    if sys.byteorder != "little":
+        column = array(column.typecode, column)
+        column.byteswap()
+    column.tofile(file)
+
+
+def _read_array(typecode, count, file):
+    """Return array of count items read from file in little-endian order."""
+    column = array(typecode)
+    data = file.read(column.itemsize * count)
+    if len(data) != column.itemsize * count:
+        raise EOFError
+    column.frombytes(data)
+    if sys.byteorder != "little":
+        column.byteswap()
+    return column
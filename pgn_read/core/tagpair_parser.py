@@ -22,6 +22,10 @@ verifying the movetext represents a legal game or contains SAN format move
 descriptions.  This should save significant time when the moves played are
 not of interest.
 
+The RecordedSource class wraps a file-like source given to read_games so
+the text of each game can be taken from the text read, using the game_offset
+of the games.
+
 """
 import re
 
@@ -49,6 +53,25 @@ game_format = re.compile(TAG_PAIR_FORMAT)
 tagpair = re.compile(PGN_TAG)
 
 
+def decode_bad_tag(text):
+    r"""Return tag name and value for badly formed tag in text.
+
+    The tag is formed like '[ Tagname "Tagvalue" ]' with extra, or less,
+    whitespace allowed, and at least one '\' or '"' without the '\' escape
+    prefix.  The escape prefix is added as needed to the value.
+
+    """
+    bad_tag = text.strip().split('"')
+    val = (
+        '"'.join(bad_tag[1:-1])
+        .replace('"', '"')
+        .replace("\\\\", "\\")
+        .replace("\\", "\\\\")
+        .replace('"', r"\"")
+    )
+    return bad_tag[0].lstrip("[").strip(), val
+
+
 class PGNTagPairError(Exception):
     """Exception raised where PGNTagPair parsing cannot continue."""
 
@@ -283,18 +306,10 @@ class TagPairGame(GameCount):
         the unknown result symbol '*'.
 
         """
-        bad_tag = match.group().strip().split('"')
-        val = (
-            '"'.join(bad_tag[1:-1])
-            .replace('"', '"')
-            .replace("\\\\", "\\")
-            .replace("\\", "\\\\")
-            .replace('"', r"\"")
-        )
+        tag_name, val = decode_bad_tag(match.group())
 
         # Copy from append_start_tag() to apply correctly formatted PGN tag,
         # which must not be duplicated.
-        tag_name = bad_tag[0].lstrip("[").strip()
         if tag_name in self._tags:
             if self._state is None:
                 self._state = len(self._tags) - 1
@@ -527,6 +542,40 @@ class PGNTagPair:
             yield game
 
 
+class RecordedSource:
+    """File-like object which keeps text read from source until not needed.
+
+    Text before the offset given in the latest text_between call is
+    discarded when more text is read.
+
+    """
+
+    def __init__(self, source):
+        """Note source and start with no text."""
+        self._source = source
+        self._text = ""
+        self._offset = 0
+        self._consumed = 0
+        self.end = 0
+
+    def read(self, size):
+        """Return text read from source after discarding consumed text."""
+        text = self._source.read(size)
+        self._text = self._text[self._consumed - self._offset :] + text
+        self._offset = self._consumed
+        self.end += len(text)
+        return text
+
+    def close(self):
+        """Close source."""
+        self._source.close()
+
+    def text_between(self, start, end):
+        """Return text from offset start to end and mark text consumed."""
+        self._consumed = end
+        return self._text[start - self._offset : end - self._offset]
+
+
 def add_token_to_game(text, game, pos=0):
     """Apply first match in text after pos to game and return match.end().
 
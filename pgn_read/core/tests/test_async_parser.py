@@ -0,0 +1,134 @@
+# test_async_parser.py
+# Copyright 2025 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""async_parser tests"""
+
+import unittest
+import asyncio
+import io
+import concurrent.futures
+
+from .. import async_parser
+from .. import parser
+
+GAMES = "".join(
+    (
+        '[Event"A"][White"Ä"][Black"Y"][Result"1-0"]e4 e5(c5)Nf3 1-0\n',
+        '[Event"B"][White"Y"][Black"X"][Result"*"]e4 e5 Ke4 Nf3\n\n',
+        '[Event"C"][White"Z"][Black"X"][Result"*"]d4 *\n',
+    )
+)
+
+
+class _FailingStream:
+    """Stream whose read() raises an exception."""
+
+    async def read(self, size):
+        """Raise OSError."""
+        raise OSError("read failed")
+
+
+def _stream_reader(data):
+    """Return asyncio.StreamReader which will read data."""
+    stream = asyncio.StreamReader()
+    stream.feed_data(data)
+    stream.feed_eof()
+    return stream
+
+
+def _summary(games):
+    """Return list of text, state, and game offset, for games."""
+    return [(g.pgn_text, g.state, g.game_offset) for g in games]
+
+
+class AReadGames(unittest.TestCase):
+    def setUp(self):
+        self.expected = _summary(
+            parser.PGN().read_games(io.StringIO(GAMES * 5))
+        )
+
+    def tearDown(self):
+        del self.expected
+
+    def read(self, data, **kwargs):
+        """Return summary of games read from stream of data."""
+
+        async def read():
+            return [
+                game
+                async for game in async_parser.aread_games(
+                    _stream_reader(data), **kwargs
+                )
+            ]
+
+        return _summary(asyncio.run(read()))
+
+    def test_01_aread_games(self):
+        ae = self.assertEqual
+        ae(len(self.expected), 15)
+        ae(self.read((GAMES * 5).encode("iso-8859-1")), self.expected)
+
+    def test_02_small_reads_and_batches(self):
+        ae = self.assertEqual
+        ae(
+            self.read(
+                (GAMES * 5).encode("utf-8"),
+                size=7,
+                encoding="utf-8",
+                batch_size=2,
+                max_batches=1,
+            ),
+            self.expected,
+        )
+
+    def test_03_consumer_stops(self):
+        ae = self.assertEqual
+
+        async def read():
+            games = []
+            agen = async_parser.aread_games(
+                _stream_reader((GAMES * 50).encode("iso-8859-1")),
+                batch_size=1,
+                max_batches=1,
+            )
+            async for game in agen:
+                games.append(game)
+                if len(games) == 2:
+                    break
+            await agen.aclose()
+            return games
+
+        ae(_summary(asyncio.run(read())), self.expected[:2])
+
+    def test_04_read_fails(self):
+        async def read():
+            return [
+                game
+                async for game in async_parser.aread_games(_FailingStream())
+            ]
+
+        self.assertRaisesRegex(OSError, "read failed", asyncio.run, read())
+
+    def test_05_executor(self):
+        ae = self.assertEqual
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            ae(
+                self.read((GAMES * 5).encode("iso-8859-1"), executor=executor),
+                self.expected,
+            )
+        with concurrent.futures.ProcessPoolExecutor(max_workers=1) as executor:
+            self.assertRaisesRegex(
+                async_parser.AsyncParserError,
+                "executor must be a ThreadPoolExecutor$",
+                self.read,
+                b"e4 *",
+                executor=executor,
+            )
+
+
+if __name__ == "__main__":
+    runner = unittest.TextTestRunner
+    loader = unittest.defaultTestLoader.loadTestsFromTestCase
+
+    runner().run(loader(AReadGames))
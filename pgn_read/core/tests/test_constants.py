@@ -551,6 +551,8 @@ class Constants(unittest.TestCase):
             r'(?s:([18]=[QB]).*\1|[18]=N|\[\s*FEN\s*")',
         )
         ae(constants.PAWN_MOVE_TOKEN_POSSIBLE_BISHOP, r"\A[Bb][1-8]\Z")
+        ae(constants.SPLIT_LAN_DESTINATION, r"\s+([a-hA-H][1-8])(?=\s)")
+        ae(constants.SLD_DESTINATION, 1)
         ae(constants.UNTERMINATED, "<{")
         ae(
             constants.SUFFIX_ANNOTATION_TO_NAG,
@@ -605,6 +607,9 @@ class Constants(unittest.TestCase):
         ae(constants.TAG_SETUP, "SetUp")
         ae(constants.SETUP_VALUE_FEN_ABSENT, "0")
         ae(constants.SETUP_VALUE_FEN_PRESENT, "1")
+        ae(constants.TAG_ECO, "ECO")
+        ae(constants.TAG_OPENING, "Opening")
+        ae(constants.TAG_VARIATION, "Variation")
         ae(constants.PGN_CAPTURE_MOVE, "x")
         ae(constants.PGN_PAWN, "")
         ae(constants.PGN_KING, "K")
@@ -749,6 +754,11 @@ class Constants(unittest.TestCase):
             bool(re.compile(constants.PAWN_MOVE_TOKEN_POSSIBLE_BISHOP)), True
         )
 
+    def test_10_split_lan_destination_re(self):
+        self.assertEqual(
+            bool(re.compile(constants.SPLIT_LAN_DESTINATION)), True
+        )
+
 
 class CountConstants(unittest.TestCase):
     def test_01_count_constants(self):
@@ -907,6 +917,8 @@ class CountConstants(unittest.TestCase):
                 "SEVEN_TAG_ROSTER",
                 "SEVEN_TAG_ROSTER_DEFAULTS",
                 "SIDE_TO_MOVE_KING",
+                "SLD_DESTINATION",
+                "SPLIT_LAN_DESTINATION",
                 "START_RAV",
                 "SUFFIX_ANNOTATION_TO_NAG",
                 "SUPPLEMENTAL_TAG_ROSTER",
@@ -915,8 +927,10 @@ class CountConstants(unittest.TestCase):
                 "TAG_BLACKNA",
                 "TAG_BLACKTITLE",
                 "TAG_DATE",
+                "TAG_ECO",
                 "TAG_EVENT",
                 "TAG_FEN",
+                "TAG_OPENING",
                 "TAG_PAIR",
                 "TAG_PAIR_DATA_ERROR",
                 "TAG_PAIR_FORMAT",
@@ -924,6 +938,7 @@ class CountConstants(unittest.TestCase):
                 "TAG_ROUND",
                 "TAG_SETUP",
                 "TAG_SITE",
+                "TAG_VARIATION",
                 "TAG_WHITE",
                 "TAG_WHITEELO",
                 "TAG_WHITENA",
@@ -0,0 +1,255 @@
+# test_eco_trie.py
+# Copyright 2025 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""eco_trie tests"""
+
+import unittest
+import io
+import os
+import tempfile
+
+from .. import eco_trie
+from .. import parser
+
+TABLE = "".join(
+    (
+        '[ECO"B00"][Opening"King\'s pawn opening"]e4*\n',
+        '[ECO"B01"][Opening"Scandinavian"]e4 d5*\n',
+        '[ECO"B01"][Opening"Scandinavian"][Variation"Mieses-Kotrc"]',
+        "e4 d5 exd5 Qxd5 Nc3 Qa5*\n",
+        '[ECO"C44"][Opening"King\'s pawn game"]e4 e5 Nf3 Nc6*\n',
+        '[ECO"C60"][Opening"Ruy Lopez"]e4 e5 Nf3 Nc6 Bb5*\n',
+        '[ECO"C65"][Opening"Ruy Lopez"][Variation"Berlin defence"]',
+        "e4 e5 Nf3 Nc6 Bb5 Nf6 O-O*\n",
+        '[ECO"X00"][Opening"Duplicate"]e4 d5*\n',
+        '[ECO"X01"][Opening"Error"]e4 e4*\n',
+        '[ECO"X02"][SetUp"1"][FEN"4k3/8/8/8/8/8/8/4K3 w - - 0 1"]Kd2*\n',
+    )
+)
+
+
+class ECOTrie(unittest.TestCase):
+    def setUp(self):
+        self.trie = eco_trie.ECOTrie()
+        self.trie.add_pgn(io.StringIO(TABLE))
+
+    def tearDown(self):
+        del self.trie
+
+    def test_01___init__(self):
+        ae = self.assertEqual
+        trie = eco_trie.ECOTrie()
+        ae(len(trie), 1)
+        ae(trie.openings, [])
+        ae(trie.opening(0), None)
+
+    def test_02_add_pgn(self):
+        ae = self.assertEqual
+        trie = self.trie
+        ae(len(trie), 13)
+        ae(
+            trie.openings,
+            [
+                ("B00", "King's pawn opening", ""),
+                ("B01", "Scandinavian", ""),
+                ("B01", "Scandinavian", "Mieses-Kotrc"),
+                ("C44", "King's pawn game", ""),
+                ("C60", "Ruy Lopez", ""),
+                ("C65", "Ruy Lopez", "Berlin defence"),
+            ],
+        )
+
+    def test_03_child_and_opening(self):
+        ae = self.assertEqual
+        trie = self.trie
+        node = trie.child(0, "e2P-e4P")
+        ae(trie.opening(node), ("B00", "King's pawn opening", ""))
+        ae(trie.child(0, "d2P-d4P"), None)
+        node = trie.child(node, "e7p-e5p")
+        ae(trie.opening(node), None)
+        ae(trie.child(node, "g1N-f3N") is None, False)
+
+    def test_04_move_key(self):
+        ae = self.assertEqual
+        game = next(
+            parser.PGN().read_games("e4 d5 exd5 Nf6 Bb5+ c6 Nf3 Bg4 O-O*")
+        )
+        ae(game.state, None)
+        deltas = game.position_deltas
+        ae(eco_trie.move_key(deltas[0]), "e2P-e4P")
+        ae(eco_trie.move_key(deltas[2]), "d5pe4P-d5P")
+        ae(eco_trie.move_key(deltas[-2]), "e1Kh1R-f1Rg1K")
+
+    def test_05_write_and_read_trie(self):
+        ae = self.assertEqual
+        trie = self.trie
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "eco.trie")
+            trie.write_trie(path)
+            other = eco_trie.ECOTrie()
+            other.read_trie(path)
+        ae(other.openings, trie.openings)
+        ae(other.moves, trie.moves)
+        for column, other_column in zip(trie._columns(), other._columns()):
+            ae(column, other_column)
+        ae(other._children, trie._children)
+
+    def test_06_read_trie_not_trie(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "eco.trie")
+            with open(path, mode="wb") as file:
+                file.write(b"[Event")
+            self.assertRaisesRegex(
+                eco_trie.ECOTrieError,
+                "is not an ECO trie$",
+                eco_trie.ECOTrie().read_trie,
+                *(path,),
+            )
+
+    def test_07_read_trie_truncated(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "eco.trie")
+            self.trie.write_trie(path)
+            with open(path, mode="rb") as file:
+                data = file.read()
+            with open(path, mode="wb") as file:
+                file.write(data[:-3])
+            self.assertRaisesRegex(
+                eco_trie.ECOTrieError,
+                "ECO trie is truncated$",
+                eco_trie.ECOTrie().read_trie,
+                *(path,),
+            )
+
+    def test_08_write_and_read_trie_separators_in_tags(self):
+        ae = self.assertEqual
+        trie = eco_trie.ECOTrie()
+        trie.add_pgn(
+            io.StringIO(
+                "".join(
+                    (
+                        '[ECO"B01"][Opening"Scandinavian\tdefence"]',
+                        '[Variation"Main\nline"]e4 d5*\n',
+                        '[ECO"B00"][Opening"King\'s pawn"]e4*\n',
+                    )
+                )
+            )
+        )
+        ae(
+            trie.openings,
+            [
+                ("B01", "Scandinavian\tdefence", "Main\nline"),
+                ("B00", "King's pawn", ""),
+            ],
+        )
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "eco.trie")
+            trie.write_trie(path)
+            other = eco_trie.ECOTrie()
+            other.read_trie(path)
+        ae(other.openings, trie.openings)
+        ae(other.moves, trie.moves)
+
+        class Game(eco_trie.GameECO):
+            eco_trie = other
+
+        games = list(parser.PGN(game_class=Game).read_games("e4 d5 d4*"))
+        ae(games[0].state, None)
+        ae(
+            (games[0].eco, games[0].opening, games[0].variation),
+            ("B01", "Scandinavian\tdefence", "Main\nline"),
+        )
+
+
+class GameECO(unittest.TestCase):
+    def setUp(self):
+        trie = eco_trie.ECOTrie()
+        trie.add_pgn(io.StringIO(TABLE))
+
+        class Game(eco_trie.GameECO):
+            eco_trie = trie
+
+        self.pgn = parser.PGN(game_class=Game)
+
+    def tearDown(self):
+        del self.pgn
+
+    def get(self, text):
+        """Return (eco, opening, variation) for games read from text."""
+        return [
+            (game.eco, game.opening, game.variation)
+            for game in self.pgn.read_games(text)
+        ]
+
+    def test_01___init__(self):
+        ae = self.assertEqual
+        game = eco_trie.GameECO()
+        ae((game.eco, game.opening, game.variation), (None, None, None))
+
+    def test_02_no_trie(self):
+        ae = self.assertEqual
+        games = list(parser.PGN(game_class=eco_trie.GameECO).read_games("e4*"))
+        ae(games[0].state, None)
+        ae(games[0].eco, None)
+
+    def test_03_classify(self):
+        ae = self.assertEqual
+        ae(
+            self.get("e4 e5 Nf3 Nc6 Bb5 a6 Ba4 Nf6 O-O*"),
+            [("C60", "Ruy Lopez", "")],
+        )
+        ae(
+            self.get("e4 e5 Nf3 Nc6 Bb5 Nf6 O-O Nxe4*"),
+            [("C65", "Ruy Lopez", "Berlin defence")],
+        )
+        ae(self.get("e4 e5 Nf3 Nf6*"), [("B00", "King's pawn opening", "")])
+        ae(self.get("d4 d5*"), [(None, None, None)])
+
+    def test_04_classify_disambiguation_variant(self):
+        ae = self.assertEqual
+        ae(
+            self.get("e4 e5 Ng1f3 Nbc6 Bb5*"),
+            [("C60", "Ruy Lopez", "")],
+        )
+
+    def test_05_rav_ignored(self):
+        ae = self.assertEqual
+        ae(
+            self.get("e4 e5 (d5 exd5 Qxd5 Nc3 Qa5) Nf3 Nc6 (Nf6) Bb5*"),
+            [("C60", "Ruy Lopez", "")],
+        )
+
+    def test_06_fen_not_classified(self):
+        ae = self.assertEqual
+        ae(
+            self.get(
+                "".join(
+                    (
+                        '[SetUp"1"]',
+                        '[FEN"rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR ',
+                        'w KQkq - 0 1"]e4 d5*',
+                    )
+                )
+            ),
+            [(None, None, None)],
+        )
+
+    def test_07_several_games(self):
+        ae = self.assertEqual
+        ae(
+            self.get("e4 d5 exd5 Qxd5 Nc3 Qa5 d4*e4 c5*e4 d5 exd5*"),
+            [
+                ("B01", "Scandinavian", "Mieses-Kotrc"),
+                ("B00", "King's pawn opening", ""),
+                ("B01", "Scandinavian", ""),
+            ],
+        )
+
+
+if __name__ == "__main__":
+    runner = unittest.TextTestRunner
+    loader = unittest.defaultTestLoader.loadTestsFromTestCase
+
+    runner().run(loader(ECOTrie))
+    runner().run(loader(GameECO))
@@ -10,9 +10,12 @@ import re
 from .. import gamedata
 from .. import game
 from .. import game_indicate_check
+from .. import game_legal_move_counts
+from .. import game_ignore_case_pgn
 from .. import constants
 from .. import piece
 from .. import parser
+from .. import perft
 
 
 class Game(unittest.TestCase):
@@ -37,6 +40,7 @@ class Game(unittest.TestCase):
         ae(
             sorted(i for i in g.__dict__.items()),
             [
+                ("_board", [None] * 64),
                 ("_error_list", []),
                 ("_piece_placement_data", {}),
                 ("_pieces_on_board", {}),
@@ -233,9 +237,12 @@ class Game(unittest.TestCase):
     def test_19_remove_piece_on_square(self):
         ae = self.assertEqual
         g = game.Game()
-        g._piece_placement_data["mmm"] = None
-        ae(g.remove_piece_on_square(("mmm", None)), None)
+        p = piece.Piece("Q", "c5")
+        g._piece_placement_data["c5"] = p
+        g._board[p.square.number] = p
+        ae(g.remove_piece_on_square(("c5", None)), None)
         ae(g._piece_placement_data, {})
+        ae(g._board, [None] * 64)
 
     def test_20_remove_piece_from_board(self):
         ae = self.assertEqual
@@ -812,6 +819,517 @@ class GenerateFENForPosition(unittest.TestCase):
         )
 
 
+class GenerateFENForBoard(unittest.TestCase):
+    def setUp(self):
+        self.pgn = parser.PGN()
+
+    def tearDown(self):
+        del self.pgn
+
+    def get(self, text):
+        """Return first game read from text."""
+        return next(self.pgn.read_games(text))
+
+    def test_01_generate_fen_for_board(self):
+        ae = self.assertEqual
+        board = [None] * 64
+        for p in (
+            piece.Piece(constants.FEN_WHITE_KING, "e2"),
+            piece.Piece(constants.FEN_BLACK_KING, "e8"),
+            piece.Piece(constants.FEN_WHITE_PAWN, "e3"),
+            piece.Piece(constants.FEN_BLACK_PAWN, "e7"),
+        ):
+            board[p.square.number] = p
+        ae(
+            gamedata.generate_fen_for_board(board, "w", "-", "-", 0, 1),
+            "4k3/4p3/8/8/8/4P3/4K3/8 w - - 0 1",
+        )
+        ae(
+            gamedata.generate_epd_for_board(board, "w", "-", "-"),
+            "4k3/4p3/8/8/8/4P3/4K3/8 w - -",
+        )
+        ae(
+            gamedata.generate_fen_for_board([None] * 64, "b", "-", "-", 3, 9),
+            "8/8/8/8/8/8/8/8 b - - 3 9",
+        )
+
+    def test_02_get_fen_for_position(self):
+        ae = self.assertEqual
+        g = self.get("e4 e5 Nf3 Nc6 Bb5 a6 Bxc6 dxc6 O-O*")
+        ae(
+            g.get_fen_for_position(),
+            "r1bqkbnr/1pp2ppp/p1p5/4p3/4P3/5N2/PPPP1PPP/RNBQ1RK1 b kq - 1 5",
+        )
+        ae(
+            g.get_fen_for_position(),
+            gamedata.generate_fen_for_position(
+                g._piece_placement_data.values(),
+                g._active_color,
+                g._castling_availability,
+                g._en_passant_target_square,
+                g._halfmove_clock,
+                g._fullmove_number,
+            ),
+        )
+        ae(
+            g.get_epd_for_position(),
+            "r1bqkbnr/1pp2ppp/p1p5/4p3/4P3/5N2/PPPP1PPP/RNBQ1RK1 b kq -",
+        )
+
+    def test_03_generate_fens_for_game(self):
+        ae = self.assertEqual
+        g = self.get("e4{c}{c}(d4 d5(c5))e5;c\nNf3*")
+        ae(
+            list(gamedata.generate_fens_for_game(g)),
+            [
+                "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1",
+                "rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq e3 0 1",
+                "rnbqkbnr/pppppppp/8/8/3P4/8/PPP1PPPP/RNBQKBNR b KQkq d3 0 1",
+                "rnbqkbnr/ppp1pppp/8/3p4/3P4/8/PPP1PPPP/RNBQKBNR"
+                " w KQkq d6 0 2",
+                "rnbqkbnr/pp1ppppp/8/2p5/3P4/8/PPP1PPPP/RNBQKBNR"
+                " w KQkq c6 0 2",
+                "rnbqkbnr/pppp1ppp/8/4p3/4P3/8/PPPP1PPP/RNBQKBNR"
+                " w KQkq e6 0 2",
+                "rnbqkbnr/pppp1ppp/8/4p3/4P3/5N2/PPPP1PPP/RNBQKB1R"
+                " b KQkq - 1 2",
+            ],
+        )
+        ae(
+            list(gamedata.generate_epds_for_game(g))[-1],
+            "rnbqkbnr/pppp1ppp/8/4p3/4P3/5N2/PPPP1PPP/RNBQKB1R b KQkq -",
+        )
+
+    def test_04_generate_fens_for_game_long_algebraic_capture(self):
+        ae = self.assertEqual
+        g = next(
+            parser.PGN(
+                game_class=game_ignore_case_pgn.GameIgnoreCasePGN
+            ).read_games("d4 e6 c4 Bf8b4+ Nc3 Bb4xc3+*")
+        )
+        ae(g.state, None)
+        ae(
+            list(gamedata.generate_fens_for_game(g))[-1],
+            "rnbqk1nr/pppp1ppp/4p3/8/2PP4/2b5/PP2PPPP/R1BQKBNR w KQkq - 0 4",
+        )
+        ae(
+            list(gamedata.generate_fens_for_game(g))[-1],
+            g.get_fen_for_position(),
+        )
+
+
+class IterPositions(unittest.TestCase):
+    def setUp(self):
+        self.pgn = parser.PGN()
+
+    def tearDown(self):
+        del self.pgn
+
+    def get(self, text):
+        """Return first game read from text."""
+        return next(self.pgn.read_games(text))
+
+    def test_01_no_initial_position(self):
+        ae = self.assertEqual
+        ae(list(game.Game().iter_positions()), [])
+
+    def test_02_iter_positions(self):
+        ae = self.assertEqual
+        g = self.get("e4{c}(d4 d5(c5)$1 c4)(c4)e5;c\nNf3 $2 *")
+        ae(
+            [position[:3] for position in g.iter_positions()],
+            [
+                (0, (), None),
+                (1, (), "e4"),
+                (1, ((1, 1),), "d4"),
+                (2, ((1, 1),), "d5"),
+                (2, ((1, 1), (2, 1)), "c5"),
+                (3, ((1, 1),), "c4"),
+                (1, ((1, 2),), "c4"),
+                (2, (), "e5"),
+                (3, (), "Nf3"),
+            ],
+        )
+        ae(
+            [position[3] for position in g.iter_positions()],
+            list(gamedata.generate_fens_for_game(g)),
+        )
+
+    def test_03_iter_positions_epd(self):
+        ae = self.assertEqual
+        g = self.get(
+            '[SetUp"1"][FEN"4k3/8/8/8/8/8/8/R3K3 b Q - 5 40"]Kd7 O-O-O+*'
+        )
+        ae(
+            list(g.iter_positions(epd=True)),
+            [
+                (79, (), None, "4k3/8/8/8/8/8/8/R3K3 b Q -"),
+                (80, (), "Kd7", "8/3k4/8/8/8/8/8/R3K3 w Q -"),
+                (81, (), "O-O-O", "8/3k4/8/8/8/8/8/2KR4 b - -"),
+            ],
+        )
+
+    def test_04_iter_positions_error_in_rav(self):
+        ae = self.assertEqual
+        g = self.get("e4 (d4 Ke4 d5 (c4) Nf3) e5 (c5 (d5)) Nf3*")
+        ae(
+            [position[:3] for position in g.iter_positions()],
+            [
+                (0, (), None),
+                (1, (), "e4"),
+                (1, ((1, 1),), "d4"),
+                (2, (), "e5"),
+                (2, ((2, 1),), "c5"),
+                (2, ((2, 1), (2, 1)), "d5"),
+                (3, (), "Nf3"),
+            ],
+        )
+
+    def test_05_iter_positions_error_in_main_line(self):
+        ae = self.assertEqual
+        g = self.get("e4 e5 Ke4 d5 (d4) *")
+        ae(
+            [position[2] for position in g.iter_positions()],
+            [None, "e4", "e5"],
+        )
+
+    def test_06_iter_movetext(self):
+        ae = self.assertEqual
+        ae(list(game.Game().iter_movetext()), [])
+        for text in (
+            "e4{c}(d4 d5(c5)$1 c4)(c4)e5;c\nNf3 $2 *",
+            "e4 (d4 Ke4 d5 (c4) Nf3) e5 (c5 (d5)) Nf3*",
+            "e4 e5 Ke4 d5 (d4) *",
+        ):
+            g = self.get(text)
+            ae(
+                list(g.iter_movetext()),
+                [position[:3] for position in g.iter_positions()],
+            )
+
+
+class PinnedLinesAndCheck(unittest.TestCase):
+    def setUp(self):
+        self.pgn = parser.PGN()
+
+    def tearDown(self):
+        del self.pgn
+
+    def get(self, fen, text=" *"):
+        """Return first game read from text starting at position fen."""
+        return next(self.pgn.read_games('[SetUp"1"][FEN"' + fen + '"]' + text))
+
+    def test_01_get_pinned_lines_and_check(self):
+        ae = self.assertEqual
+        g = self.get("4r1k1/8/8/b7/8/8/3N4/4K3 w - - 0 1")
+        pinned_lines_and_check = g.get_pinned_lines_and_check()
+        ae(
+            pinned_lines_and_check,
+            ({"d2": frozenset(("d2", "c3", "b4", "a5"))}, True),
+        )
+        ae(
+            g.get_pinned_lines_and_check()[0] is pinned_lines_and_check[0],
+            True,
+        )
+        ae(
+            self.get(
+                "4k3/8/8/8/8/8/8/4K3 w - - 0 1"
+            ).get_pinned_lines_and_check(),
+            ({}, False),
+        )
+
+    def test_02_pinned_piece_moves(self):
+        ae = self.assertEqual
+        fen = "4k3/8/8/b7/8/8/3B4/4K3 w - - 0 1"
+        ae(self.get(fen, "Bc3 *").state, None)
+        ae(self.get(fen, "Bxa5 *").state, None)
+        ae(self.get(fen, "Be3 *").state, 2)
+        ae(self.get("4k3/8/8/b7/8/8/3N4/4K3 w - - 0 1", "Nf3 *").state, 2)
+
+    def test_03_knight_gives_check(self):
+        ae = self.assertEqual
+        fen = "4k3/8/8/8/8/3n4/P7/4K3 w - - 0 1"
+        ae(self.get(fen, "a3 *").state, 2)
+        ae(self.get(fen, "Kf2 *").state, 2)
+        ae(self.get(fen, "Ke2 *").state, None)
+
+    def test_04_pawn_gives_check(self):
+        ae = self.assertEqual
+        fen = "4k3/8/8/8/8/8/3p4/R3K3 w - - 0 1"
+        ae(self.get(fen, "Ra2 *").state, 2)
+        ae(self.get(fen, "Kxd2 *").state, None)
+
+    def test_05_ambiguous_move_with_pinned_candidate(self):
+        ae = self.assertEqual
+        fen = "4k3/8/8/b7/8/8/3N4/4K1N1 w - - 0 1"
+        ae(self.get(fen, "Nf3 *").state, None)
+        ae(self.get(fen, "Ngf3 *").state, None)
+        ae(self.get(fen, "Ndf3 *").state, 2)
+
+
+class RestoreBoardSnapshot(unittest.TestCase):
+    def setUp(self):
+        self.pgn = parser.PGN()
+
+    def tearDown(self):
+        del self.pgn
+
+    def get(self, text):
+        """Return first game read from text."""
+        return next(self.pgn.read_games(text))
+
+    def pieces_on_board(self, g):
+        """Return dict of piece names mapped to sorted squares of pieces."""
+        return {
+            key: sorted(p.square.name for p in value)
+            for key, value in g._pieces_on_board.items()
+        }
+
+    def test_01_restore_board_snapshot(self):
+        ae = self.assertEqual
+        g = self.get("e4 d5 exd5 Qxd5 Nc3*")
+        fen = g.get_fen_for_position()
+        pieces_on_board = self.pieces_on_board(g)
+        snapshot = tuple(g._board)
+        g2 = self.get("e4 d5 exd5 Qxd5 Nc3 Qa5 d4 c6 Nf3 Bf5 Bc4 e6*")
+        g.restore_board_snapshot(tuple(g2._board))
+        ae(g._board, g2._board)
+        g.restore_board_snapshot(snapshot)
+        ae(g.get_fen_for_position(), fen)
+        ae(self.pieces_on_board(g), pieces_on_board)
+        ae(
+            g._piece_placement_data,
+            {p.square.name: p for p in snapshot if p is not None},
+        )
+
+    def test_02_rav_position_deltas(self):
+        ae = self.assertEqual
+        g = self.get("e4 e5 (c5 Nf3) Nf3*")
+        ae(len(g._position_deltas[2]), 1)
+        ae(len(g._position_deltas[2][0][0]), 64)
+        ae(len(g._position_deltas[5]), 1)
+        ae(
+            gamedata.generate_epd_for_board(*g._position_deltas[2][0][:4]),
+            "rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq e3",
+        )
+        ae(
+            gamedata.generate_epd_for_board(*g._position_deltas[5][0][:4]),
+            "rnbqkbnr/pppp1ppp/8/4p3/4P3/8/PPPP1PPP/RNBQKBNR w KQkq e6",
+        )
+        ae(
+            g.get_fen_for_position(),
+            "rnbqkbnr/pppp1ppp/8/4p3/4P3/5N2/PPPP1PPP/RNBQKB1R b KQkq - 1 2",
+        )
+
+    def test_03_right_nested_ravs(self):
+        ae = self.assertEqual
+        g = self.get("e4 e5 (c5 (e6 d4) Nf3) (d5 exd5) Nf3 Nc6*")
+        ae(g.state, None)
+        ae(
+            g.get_fen_for_position(),
+            "r1bqkbnr/pppp1ppp/2n5/4p3/4P3/5N2/PPPP1PPP/RNBQKB1R w KQkq - 2 3",
+        )
+        ae(
+            self.pieces_on_board(g),
+            self.pieces_on_board(self.get("e4 e5 Nf3 Nc6*")),
+        )
+
+
+class LegalMoves(unittest.TestCase):
+    def setUp(self):
+        self.pgn = parser.PGN()
+
+    def tearDown(self):
+        del self.pgn
+
+    def get(self, fen, text=" *"):
+        """Return first game read from text starting at position fen."""
+        return next(self.pgn.read_games('[SetUp"1"][FEN"' + fen + '"]' + text))
+
+    def test_01_legal_moves(self):
+        ae = self.assertEqual
+        g = next(self.pgn.read_games("*"))
+        g.set_initial_position()
+        ae(
+            sorted(g.legal_moves()),
+            [
+                "Na3",
+                "Nc3",
+                "Nf3",
+                "Nh3",
+                "a3",
+                "a4",
+                "b3",
+                "b4",
+                "c3",
+                "c4",
+                "d3",
+                "d4",
+                "e3",
+                "e4",
+                "f3",
+                "f4",
+                "g3",
+                "g4",
+                "h3",
+                "h4",
+            ],
+        )
+
+    def test_02_disambiguation(self):
+        ae = self.assertEqual
+        g = self.get("4k3/8/8/8/8/Q7/8/Q1Q1K3 w - - 0 1")
+        ae(
+            sorted(m for m in g.legal_moves() if m.endswith("b2")),
+            ["Q3b2", "Qa1b2", "Qcb2"],
+        )
+
+    def test_03_pinned_piece(self):
+        ae = self.assertEqual
+        ae(
+            sorted(self.get("4k3/8/8/b7/8/8/3B4/4K3 w - - 0 1").legal_moves()),
+            ["Bb4", "Bc3", "Bxa5", "Kd1", "Ke2", "Kf1", "Kf2"],
+        )
+
+    def test_04_check(self):
+        ae = self.assertEqual
+        ae(
+            sorted(
+                self.get("4r1k1/8/8/8/8/8/3N4/4K3 w - - 0 1").legal_moves()
+            ),
+            ["Kd1", "Kf1", "Kf2", "Ne4"],
+        )
+
+    def test_05_castles(self):
+        ae = self.assertEqual
+        g = self.get("r3k2r/8/8/8/8/8/8/R3K2R w KQkq - 0 1")
+        ae("O-O" in g.legal_moves(), True)
+        ae("O-O-O" in g.legal_moves(), True)
+        g = self.get("4k3/8/8/8/8/5b2/8/R3K2R w KQ - 0 1")
+        ae("O-O" in g.legal_moves(), True)
+        ae("O-O-O" in g.legal_moves(), False)
+        g = self.get("4k3/8/8/8/8/8/8/R3K2R w - - 0 1")
+        ae("O-O" in g.legal_moves(), False)
+
+    def test_06_promotion(self):
+        ae = self.assertEqual
+        ae(
+            sorted(
+                m
+                for m in self.get(
+                    "1n2k3/2P5/8/8/8/8/8/4K3 w - - 0 1"
+                ).legal_moves()
+                if m.startswith("c")
+            ),
+            [
+                "c8=B",
+                "c8=N",
+                "c8=Q",
+                "c8=R",
+                "cxb8=B",
+                "cxb8=N",
+                "cxb8=Q",
+                "cxb8=R",
+            ],
+        )
+
+    def test_07_en_passant(self):
+        ae = self.assertEqual
+        ae(
+            "dxc6"
+            in self.get("4k3/8/8/2pP4/8/8/8/4K3 w - c6 0 1").legal_moves(),
+            True,
+        )
+        ae(
+            sorted(
+                self.get("4k3/8/8/K1pP3r/8/8/8/8 w - c6 0 1").legal_moves()
+            ),
+            ["Ka4", "Ka6", "Kb5", "Kb6", "d6"],
+        )
+
+    def test_08_unmake_move(self):
+        ae = self.assertEqual
+        g = self.get(
+            "r3k2r/Pppp1ppp/1b3nbN/nP6/BBP1P3/q4N2/Pp1P2PP/R2Q1RK1 w kq - 0 1"
+        )
+        fen = g.get_fen_for_position()
+        board = list(g._board)
+        for movetext, modify, arguments in g.generate_legal_moves():
+            modify(*arguments)
+            ae(g.get_fen_for_position() == fen, False)
+            g.unmake_move()
+            ae(g.get_fen_for_position(), fen)
+            ae(g._board, board)
+
+    def test_09_legal_moves_are_accepted(self):
+        ae = self.assertEqual
+        fen = (
+            "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq -"
+        )
+        for movetext in self.get(fen + " 0 1").legal_moves():
+            ae(self.get(fen + " 0 1", movetext + " *").state, None)
+
+    def test_10_perft_initial_position(self):
+        ae = self.assertEqual
+        g = next(self.pgn.read_games("*"))
+        g.set_initial_position()
+        ae([perft.perft(g, depth) for depth in (1, 2, 3)], [20, 400, 8902])
+
+    def test_11_perft(self):
+        ae = self.assertEqual
+        for fen, depth, count in (
+            (
+                "".join(
+                    (
+                        "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/",
+                        "R3K2R w KQkq - 0 1",
+                    )
+                ),
+                2,
+                2039,
+            ),
+            ("8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1", 3, 2812),
+            (
+                "".join(
+                    (
+                        "r3k2r/Pppp1ppp/1b3nbN/nP6/BBP1P3/q4N2/Pp1P2PP/",
+                        "R2Q1RK1 w kq - 0 1",
+                    )
+                ),
+                3,
+                9467,
+            ),
+            (
+                "rnbq1k1r/pp1Pbppp/2p5/8/2B5/8/PPP1NnPP/RNBQK2R w KQ - 1 8",
+                2,
+                1486,
+            ),
+        ):
+            ae(perft.perft(self.get(fen), depth), count)
+
+
+class GameLegalMoveCounts(unittest.TestCase):
+    def test_01_legal_move_counts(self):
+        ae = self.assertEqual
+        g = next(
+            parser.PGN(
+                game_class=game_legal_move_counts.GameLegalMoveCounts
+            ).read_games("e4 e5 (c5 Nf3) Nf3 *")
+        )
+        ae(g.state, None)
+        ae(g.legal_move_counts, [20, 20, 29, 30, 22, 29])
+
+    def test_02_legal_move_counts_error(self):
+        ae = self.assertEqual
+        g = next(
+            parser.PGN(
+                game_class=game_legal_move_counts.GameLegalMoveCounts
+            ).read_games("e4 e5 Ke3 *")
+        )
+        ae(g.state, 2)
+        ae(g.legal_move_counts, [20, 20, 29])
+
+
 class GameIndicateCheck(unittest.TestCase):
     def setUp(self):
         self.game = game_indicate_check.GameIndicateCheck()
@@ -1093,6 +1611,44 @@ class GameIndicateCheck(unittest.TestCase):
         )
         ae(g.is_check_given_by_move(), False)
 
+    def test_27_is_position_checkmate(self):
+        ae = self.assertEqual
+        self.setposition("r5rk/5Npp/8/8/8/8/8/6K1 b - - 1 1")
+        g = self.game
+        g.set_initial_position()
+        ae(g._is_position_checkmate(), True)
+
+    def test_28_is_position_checkmate(self):
+        ae = self.assertEqual
+        self.setposition(
+            "1r2k2r/p2pb1p1/8/6q1/2P5/N4P1K/P2P3P/2B2B1R w - - 4 21"
+        )
+        g = self.game
+        g.set_initial_position()
+        ae(g._is_position_checkmate(), True)
+
+    def test_29_is_position_checkmate(self):
+        ae = self.assertEqual
+        self.setposition("b5k1/8/8/8/8/8/6BP/r6K w - - 0 1")
+        g = self.game
+        g.set_initial_position()
+        ae(g._is_position_checkmate(), True)
+
+    def test_30_is_position_checkmate(self):
+        ae = self.assertEqual
+        self.setposition("6k1/b7/8/8/8/8/6BP/r6K w - - 0 1")
+        g = self.game
+        g.set_initial_position()
+        ae(g._is_position_checkmate(), False)
+
+    def test_31_append_check_indicator(self):
+        ae = self.assertEqual
+        self.setposition("r5rk/6pp/8/6N1/8/8/8/6K1 w - - 0 1")
+        g = self.game
+        g.set_initial_position()
+        parser.add_token_to_game("Nf7", g)
+        ae(g._text[-1], "Nf7#")
+
 
 if __name__ == "__main__":
     runner = unittest.TextTestRunner
@@ -1102,4 +1658,10 @@ if __name__ == "__main__":
     runner().run(loader(Ravstack))
     runner().run(loader(Termination))
     runner().run(loader(GenerateFENForPosition))
+    runner().run(loader(GenerateFENForBoard))
+    runner().run(loader(IterPositions))
+    runner().run(loader(PinnedLinesAndCheck))
+    runner().run(loader(RestoreBoardSnapshot))
+    runner().run(loader(LegalMoves))
+    runner().run(loader(GameLegalMoveCounts))
     runner().run(loader(GameIndicateCheck))
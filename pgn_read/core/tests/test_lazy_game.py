@@ -0,0 +1,186 @@
+# test_lazy_game.py
+# Copyright 2025 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""lazy_game tests"""
+
+import unittest
+import io
+import os
+
+from .. import lazy_game
+from .. import parser
+from .. import game_indicate_check
+
+GAMES = "".join(
+    (
+        '[Event"A"][White"Ä"][Result"1-0"]e4 e5(c5)Nf3 1-0\n',
+        '[Event"B"][Result"*"]e4 e5 Ke4 Nf3\n\n',
+        '[Event"C"][Result"*"]e4 {note 1-0\n[Event"X"]} e5 *\n',
+        '[Event"D"][Result"*"]d4 (d5 Nc6) d5 *\n',
+        '[Event"E"][Result"*"]e4 e5 Nf3\n',
+    )
+)
+
+
+class LazyGame(unittest.TestCase):
+    def test_01___init__(self):
+        ae = self.assertEqual
+        lazy = lazy_game.LazyGame(
+            game_indicate_check.GameIndicateCheck,
+            '[Event"A"]e4 e5 Qh5 Nc6 Bc4 Nf6 Qxf7 1-0',
+            {"Event": "A"},
+            40,
+        )
+        ae(lazy.pgn_tags, {"Event": "A"})
+        ae(lazy.game_offset, 40)
+        ae(lazy.is_game_parsed, False)
+
+    def test_02_game(self):
+        ae = self.assertEqual
+        lazy = lazy_game.LazyGame(
+            game_indicate_check.GameIndicateCheck,
+            '[Event"A"]e4 e5 Qh5 Nc6 Bc4 Nf6 Qxf7 1-0',
+            {"Event": "A"},
+            40,
+        )
+        game = lazy.game()
+        ae(lazy.is_game_parsed, True)
+        ae(isinstance(game, game_indicate_check.GameIndicateCheck), True)
+        ae(game.game_offset, 40)
+        ae(lazy.game() is game, True)
+
+    def test_03___getattr__(self):
+        ae = self.assertEqual
+        lazy = lazy_game.LazyGame(
+            game_indicate_check.GameIndicateCheck,
+            '[Event"A"]e4 e5 Qh5 Nc6 Bc4 Nf6 Qxf7 1-0',
+            {"Event": "A"},
+            40,
+        )
+        ae(lazy.state, None)
+        ae(lazy.is_game_parsed, True)
+        ae(lazy.pgn_text[-2:], ["Qxf7#", "1-0"])
+        ae(lazy.active_color, "b")
+        ae(len(lazy.position_deltas), 9)
+        ae(lazy.get_movetext()[-2:], ["Qxf7#", "1-0"])
+        self.assertRaisesRegex(
+            AttributeError,
+            "no_such_attribute",
+            getattr,
+            *(lazy, "no_such_attribute"),
+        )
+
+    def test_04_tags_not_known(self):
+        ae = self.assertEqual
+        lazy = lazy_game.LazyGame(
+            game_indicate_check.GameIndicateCheck, '[Event"A"]e4', None, 12
+        )
+        ae(lazy.pgn_tags, {"Event": "A"})
+        ae(lazy.is_game_parsed, True)
+        ae(lazy.state, 2)
+
+
+class LazyPGN(unittest.TestCase):
+    def test_01_read_games_tags_only(self):
+        ae = self.assertEqual
+        games = list(lazy_game.LazyPGN().read_games(GAMES))
+        ae(len(games), 5)
+        ae(
+            [game.pgn_tags["Event"] for game in games],
+            ["A", "B", "C", "D", "E"],
+        )
+        ae([game.is_game_parsed for game in games], [False] * 4 + [True])
+
+    def test_02_read_games_same_as_pgn(self):
+        ae = self.assertEqual
+        for game, lazy in zip(
+            parser.PGN().read_games(io.StringIO(GAMES)),
+            lazy_game.LazyPGN().read_games(io.StringIO(GAMES)),
+        ):
+            ae(lazy.pgn_tags, game.pgn_tags)
+            ae(lazy.pgn_text, game.pgn_text)
+            ae(lazy.state, game.state)
+            ae(lazy._error_list, game._error_list)
+            ae(
+                lazy.text,
+                GAMES[lazy.game_offset - len(lazy.text) : lazy.game_offset],
+            )
+
+    def test_03_read_games_game_offset(self):
+        ae = self.assertEqual
+        ae(
+            [
+                game.game_offset
+                for game in parser.PGN().read_games(io.StringIO(GAMES))
+            ],
+            [49, 86, 136, 174, 206],
+        )
+
+        # Game B has an error and ends before the whitespace preceding the
+        # first tag of game C.
+        ae(
+            [
+                game.game_offset
+                for game in lazy_game.LazyPGN().read_games(io.StringIO(GAMES))
+            ],
+            [49, 84, 136, 174, 206],
+        )
+
+    def test_04_read_games_game_class(self):
+        ae = self.assertEqual
+        games = list(
+            lazy_game.LazyPGN(
+                game_class=game_indicate_check.GameIndicateCheck
+            ).read_games(GAMES)
+        )
+        ae(
+            isinstance(games[0].game(), game_indicate_check.GameIndicateCheck),
+            True,
+        )
+
+    def test_05_read_games_small_size(self):
+        ae = self.assertEqual
+        games = list(
+            lazy_game.LazyPGN().read_games(io.StringIO(GAMES), size=7)
+        )
+        ae(
+            [game.text for game in games],
+            [game.text for game in lazy_game.LazyPGN().read_games(GAMES)],
+        )
+
+    def test_06_read_games_pgn_files(self):
+        ae = self.assertEqual
+        directory = os.path.join(os.path.dirname(__file__), "pgn_files")
+        for name in ("4ncl_96-97_01.pgn", "crafty06_02.pgn", "Little_01.pgn"):
+            with open(
+                os.path.join(directory, name), encoding="iso-8859-1"
+            ) as file:
+                text = file.read()
+            for game, lazy in zip(
+                parser.PGN().read_games(io.StringIO(text)),
+                lazy_game.LazyPGN().read_games(io.StringIO(text)),
+            ):
+                ae(lazy.pgn_tags, game.pgn_tags)
+                ae(lazy.pgn_text, game.pgn_text)
+                ae(lazy.state, game.state)
+                ae(lazy.game_offset, game.game_offset)
+
+    def test_07_read_games_split_not_as_pgn(self):
+        ae = self.assertEqual
+        text = '[Event "a"]\n1. e4\n[Event "b"]\n1. d4 *\n'
+        ae(
+            [game.pgn_tags for game in parser.PGN().read_games(text)],
+            [{"Event": "a"}],
+        )
+        games = list(lazy_game.LazyPGN().read_games(text))
+        ae([game.pgn_tags for game in games], [{"Event": "a"}, {"Event": "b"}])
+        ae([game.state for game in games], [2, None])
+
+
+if __name__ == "__main__":
+    runner = unittest.TextTestRunner
+    loader = unittest.defaultTestLoader.loadTestsFromTestCase
+
+    runner().run(loader(LazyGame))
+    runner().run(loader(LazyPGN))
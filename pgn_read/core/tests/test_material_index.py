@@ -0,0 +1,211 @@
+# test_material_index.py
+# Copyright 2025 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""material_index tests"""
+
+import unittest
+import io
+import os
+import tempfile
+
+from .. import material_index
+from .. import parser
+
+START = "KQRRBBNNPPPPPPPPvKQRRBBNNPPPPPPPP"
+
+
+class Functions(unittest.TestCase):
+    def test_01_pawn_files_mask(self):
+        ae = self.assertEqual
+        ae(material_index.pawn_files_mask(""), 0)
+        ae(material_index.pawn_files_mask("a"), 1)
+        ae(material_index.pawn_files_mask("h"), 128)
+        ae(material_index.pawn_files_mask("abh"), 131)
+
+    def test_02_pawn_files_from_mask(self):
+        ae = self.assertEqual
+        ae(material_index.pawn_files_from_mask(0), "")
+        ae(material_index.pawn_files_from_mask(131), "abh")
+        ae(material_index.pawn_files_from_mask(255), "abcdefgh")
+
+    def test_03_swap_signature_sides(self):
+        ae = self.assertEqual
+        ae(material_index.swap_signature_sides("KRPvKR"), "KRvKRP")
+
+
+class GameMaterialSignature(unittest.TestCase):
+    def setUp(self):
+        self.pgn = parser.PGN(game_class=material_index.GameMaterialSignature)
+
+    def tearDown(self):
+        del self.pgn
+
+    def get(self, text):
+        """Return games read from text."""
+        return list(self.pgn.read_games(text))
+
+    def test_01___init__(self):
+        ae = self.assertEqual
+        ae(material_index.GameMaterialSignature().material_changes, [])
+
+    def test_02_no_captures(self):
+        ae = self.assertEqual
+        games = self.get("e4 e5 Nf3 Nc6 Bc4 Bc5 O-O*")
+        ae(games[0].state, None)
+        ae(games[0].material_changes, [(0, START, 255, 255)])
+
+    def test_03_captures(self):
+        ae = self.assertEqual
+        games = self.get("e4 d5 exd5 Qxd5 Nc3 Qa5*")
+        ae(
+            games[0].material_changes,
+            [
+                (0, START, 255, 255),
+                (3, "KQRRBBNNPPPPPPPPvKQRRBBNNPPPPPPP", 239, 247),
+                (4, "KQRRBBNNPPPPPPPvKQRRBBNNPPPPPPP", 239, 247),
+            ],
+        )
+
+    def test_04_captures_in_rav_ignored(self):
+        ae = self.assertEqual
+        games = self.get("e4 d5 exd5 (Nc3 dxe4) Nf6 (Qxd5) Nc3*")
+        ae(
+            games[0].material_changes,
+            [
+                (0, START, 255, 255),
+                (3, "KQRRBBNNPPPPPPPPvKQRRBBNNPPPPPPP", 239, 247),
+            ],
+        )
+
+    def test_05_promotion_and_fen(self):
+        ae = self.assertEqual
+        games = self.get(
+            '[SetUp"1"][FEN"4k3/P7/8/8/8/8/8/4K3 w - - 0 60"]a8=Q+ Kd7*'
+        )
+        ae(
+            games[0].material_changes,
+            [(118, "KPvK", 1, 0), (119, "KQvK", 0, 0)],
+        )
+
+    def test_06_error_before_first_move(self):
+        ae = self.assertEqual
+        games = self.get('[SetUp"1"][FEN"4k3/8/8/8/8/8/8/4K3 w"]Kd2*')
+        ae(games[0].state, 2)
+        ae(games[0].material_changes, [])
+
+
+class MaterialIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = material_index.MaterialIndex()
+        self.index.index_pgn(
+            io.StringIO(
+                "".join(
+                    (
+                        "e4 d5 exd5 Qxd5 Nc3 Qa5*\n",
+                        '[SetUp"1"][FEN"4k3/8/8/8/8/8/8/4K3 w"]Kd2*\n',
+                        '[SetUp"1"][FEN"4k3/P7/8/8/8/8/8/4K3 w - - 0 60"]',
+                        "a8=Q+ Kd7*\n",
+                        '[SetUp"1"][FEN"4K3/8/8/8/8/8/p7/4k3 b - - 0 60"]',
+                        "a1=Q+ Kd7*\n",
+                    )
+                )
+            )
+        )
+
+    def tearDown(self):
+        del self.index
+
+    def test_01_index_games(self):
+        ae = self.assertEqual
+        index = self.index
+        ae(index.game_count, 4)
+        ae(list(index.game_numbers), [0, 2, 3])
+        ae(len(index.record_games), 7)
+        ae(
+            index.signatures,
+            [
+                START,
+                "KQRRBBNNPPPPPPPPvKQRRBBNNPPPPPPP",
+                "KQRRBBNNPPPPPPPvKQRRBBNNPPPPPPP",
+                "KPvK",
+                "KQvK",
+                "KvKP",
+                "KvKQ",
+            ],
+        )
+
+    def test_02_find(self):
+        ae = self.assertEqual
+        index = self.index
+        offsets = dict(zip(index.game_numbers, index.game_offsets))
+        ae(index.find("KRPvKR"), [])
+        ae(index.find("KPvK"), [(2, offsets[2], 118)])
+        ae(
+            index.find("KPvK", either_color=True),
+            [(2, offsets[2], 118), (3, offsets[3], 119)],
+        )
+        ae(index.find(white_pawn_files="a"), [(2, offsets[2], 118)])
+        ae(index.find(black_pawn_files=1), [(3, offsets[3], 119)])
+        ae(
+            index.find(black_pawn_files="abcefgh"),
+            [(0, offsets[0], 3), (0, offsets[0], 4)],
+        )
+        ae(
+            index.find(
+                "KQRRBBNNPPPPPPPvKQRRBBNNPPPPPPP",
+                white_pawn_files="abcdfgh",
+                black_pawn_files="abcefgh",
+            ),
+            [(0, offsets[0], 4)],
+        )
+
+    def test_03_write_and_read_index(self):
+        ae = self.assertEqual
+        index = self.index
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "material.idx")
+            index.write_index(path)
+            other = material_index.MaterialIndex()
+            other.read_index(path)
+        ae(other.game_count, index.game_count)
+        ae(other.signatures, index.signatures)
+        for column, other_column in zip(index._columns(), other._columns()):
+            ae(column, other_column)
+        ae(other.find("KvKQ"), index.find("KvKQ"))
+
+    def test_04_read_index_not_index(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "material.idx")
+            with open(path, mode="wb") as file:
+                file.write(b"[Event")
+            self.assertRaisesRegex(
+                material_index.MaterialIndexError,
+                "is not a material index$",
+                material_index.MaterialIndex().read_index,
+                *(path,),
+            )
+
+    def test_05_read_index_truncated(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "material.idx")
+            self.index.write_index(path)
+            with open(path, mode="rb") as file:
+                data = file.read()
+            with open(path, mode="wb") as file:
+                file.write(data[:-3])
+            self.assertRaisesRegex(
+                material_index.MaterialIndexError,
+                "material index is truncated$",
+                material_index.MaterialIndex().read_index,
+                *(path,),
+            )
+
+
+if __name__ == "__main__":
+    runner = unittest.TextTestRunner
+    loader = unittest.defaultTestLoader.loadTestsFromTestCase
+
+    runner().run(loader(Functions))
+    runner().run(loader(GameMaterialSignature))
+    runner().run(loader(MaterialIndex))
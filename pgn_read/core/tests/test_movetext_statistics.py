@@ -0,0 +1,113 @@
+# test_movetext_statistics.py
+# Copyright 2025 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""movetext_statistics tests"""
+
+import unittest
+import io
+
+from .. import movetext_statistics
+
+GAMES = "".join(
+    (
+        '[Event"A"][Result"1-0"]e4 e5 $1 (c5 {Sicilian} Nf3) Nf3!? 1-0\n',
+        '[Event"B"][Event"B"]e4 e5 *\n',
+        '[Event"C"][Result"*"]d4 ; comment\n(d3 (c4)) d5 *\n',
+        '[Event"D"][Result"*"]e4 e5 Nf3\n',
+    )
+)
+
+
+class MoveTextStatistics(unittest.TestCase):
+    def test_01___init__(self):
+        ae = self.assertEqual
+        game = movetext_statistics.MoveTextStatistics()
+        ae(game.token_count, 0)
+        ae(game.ply_count, 0)
+        ae(game.move_count, 0)
+        ae(game.comment_count, 0)
+        ae(game.nag_count, 0)
+        ae(game.rav_count, 0)
+        ae(game.pgn_text, [])
+        ae(game.is_text_found(), False)
+
+
+class GameStatistics(unittest.TestCase):
+    def setUp(self):
+        self.statistics = movetext_statistics.GameStatistics()
+        self.statistics.column(movetext_statistics.PLY_COUNT).extend(
+            (0, 5, 9, 10, 25)
+        )
+
+    def tearDown(self):
+        del self.statistics
+
+    def test_01_histogram(self):
+        ae = self.assertEqual
+        ae(
+            list(self.statistics.histogram(movetext_statistics.PLY_COUNT)),
+            [1, 0, 0, 0, 0, 1, 0, 0, 0, 1, 1] + [0] * 14 + [1],
+        )
+        ae(
+            list(
+                self.statistics.histogram(
+                    movetext_statistics.PLY_COUNT, bin_width=10
+                )
+            ),
+            [3, 1, 1],
+        )
+
+    def test_02_totals(self):
+        ae = self.assertEqual
+        totals = self.statistics.totals()
+        ae(totals[movetext_statistics.PLY_COUNT], 49)
+        ae(totals[movetext_statistics.RAV_COUNT], 0)
+
+
+class PGNStatistics(unittest.TestCase):
+    def test_01_read_statistics(self):
+        ae = self.assertEqual
+        statistics = movetext_statistics.PGNStatistics().read_statistics(
+            io.StringIO(GAMES)
+        )
+        ae(len(statistics), 4)
+        ae(
+            [tuple(column) for column in statistics.columns],
+            [
+                (3, 0, 2, 3),
+                (5, 0, 4, 3),
+                (1, 0, 1, 0),
+                (2, 0, 0, 0),
+                (1, 0, 2, 0),
+                (61, 28, 49, 32),
+                (0, 1, 0, 1),
+            ],
+        )
+
+    def test_02_read_statistics_str(self):
+        ae = self.assertEqual
+        statistics = movetext_statistics.PGNStatistics().read_statistics(GAMES)
+        ae(len(statistics), 4)
+        ae(
+            [tuple(column) for column in statistics.columns],
+            [
+                (3, 0, 2, 3),
+                (5, 0, 4, 3),
+                (1, 0, 1, 0),
+                (2, 0, 0, 0),
+                (1, 0, 2, 0),
+                (61, 28, 49, 32),
+                (0, 1, 0, 1),
+            ],
+        )
+        ae(sum(statistics.column(movetext_statistics.CHARACTERS)), len(GAMES))
+
+
+if __name__ == "__main__":
+    runner = unittest.TextTestRunner
+    loader = unittest.defaultTestLoader.loadTestsFromTestCase
+
+    runner().run(loader(MoveTextStatistics))
+    runner().run(loader(GameStatistics))
+    runner().run(loader(PGNStatistics))
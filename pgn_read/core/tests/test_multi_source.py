@@ -0,0 +1,150 @@
+# test_multi_source.py
+# Copyright 2025 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""multi_source tests"""
+
+import unittest
+import io
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+from .. import multi_source
+from .. import split_pgn
+from .. import game_text_pgn
+from .. import parser
+
+SOURCES = (
+    "".join(
+        (
+            '[Event"A"][Date"2024.01.03"][Result"1-0"]e4 e5 Nf3 1-0\n',
+            '[Event"B"][Date"2024.01.05"][Result"*"]e4 e5 Ke4 Nf3\n\n',
+            '[Event"C"][Date"2024.02.01"][Result"*"]d4 d5 *\n',
+        )
+    ),
+    "".join(
+        (
+            '[Event"D"][Date"2024.01.01"][Result"*"]c4 *\n',
+            '[Event"E"][Date"2024.01.05"][Result"*"]e4 e5 Nf3\n',
+        )
+    ),
+    "",
+    '[Event"F"][Date"2024.01.04"][Result"*"]Nf3 *\n',
+)
+
+
+class MultiSourcePGN(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.paths = []
+        for source_id, (text, suffix) in enumerate(
+            zip(SOURCES, (".pgn", ".pgn.gz", ".pgn", ".pgn.xz"))
+        ):
+            path = os.path.join(
+                self.directory.name, "s" + str(source_id) + suffix
+            )
+            with split_pgn.open_pgn_file(path, mode="w") as file:
+                file.write(text)
+            self.paths.append(path)
+
+    def tearDown(self):
+        self.directory.cleanup()
+        del self.directory
+
+    def summary(self, games):
+        """Return list of event, source_id, and game_offset, of games."""
+        return [
+            (game.pgn_tags["Event"], game.source_id, game.game_offset)
+            for game in games
+        ]
+
+    def test_01___init__(self):
+        ae = self.assertEqual
+        reader = multi_source.MultiSourcePGN()
+        ae(reader.game_class, multi_source.Game)
+        ae(reader.executor, None)
+        ae(reader.encoding, "iso-8859-1")
+
+    def test_02_read_games_source_order(self):
+        ae = self.assertEqual
+        ae(
+            self.summary(multi_source.MultiSourcePGN().read_games(self.paths)),
+            [
+                ("A", 0, 54),
+                ("B", 0, 109),
+                ("C", 0, 155),
+                ("D", 1, 43),
+                ("E", 1, 93),
+                ("F", 3, 44),
+            ],
+        )
+
+    def test_03_read_games_collate(self):
+        ae = self.assertEqual
+        ae(
+            self.summary(
+                multi_source.MultiSourcePGN().read_games(
+                    self.paths, collate=True
+                )
+            ),
+            [
+                ("D", 1, 43),
+                ("A", 0, 54),
+                ("F", 3, 44),
+                ("B", 0, 109),
+                ("E", 1, 93),
+                ("C", 0, 155),
+            ],
+        )
+
+    def test_04_read_games_same_as_pgn(self):
+        ae = self.assertEqual
+        games = list(
+            multi_source.MultiSourcePGN(chunk_size=10).read_games(self.paths)
+        )
+        expected = []
+        for text in SOURCES:
+            expected.extend(parser.PGN().read_games(io.StringIO(text)))
+        ae(len(games), len(expected))
+        for game, other in zip(games, expected):
+            ae(game.pgn_text, other.pgn_text)
+            ae(game.state, other.state)
+            ae(game.game_offset, other.game_offset)
+
+    def test_05_read_games_executor_and_game_class(self):
+        ae = self.assertEqual
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            games = list(
+                multi_source.MultiSourcePGN(
+                    game_class=game_text_pgn.GameTextPGN,
+                    executor=executor,
+                    max_pending=1,
+                ).read_games(self.paths, collate=True)
+            )
+        ae(len(games), 6)
+        ae(isinstance(games[0], game_text_pgn.GameTextPGN), True)
+
+    def test_06_read_games_closed_early(self):
+        ae = self.assertEqual
+        games = multi_source.MultiSourcePGN().read_games(
+            self.paths, collate=True
+        )
+        ae(next(games).pgn_tags["Event"], "D")
+        games.close()
+
+    def test_07_read_games_source_order_one_file_at_a_time(self):
+        ae = self.assertEqual
+        missing = os.path.join(self.directory.name, "missing.pgn")
+        games = multi_source.MultiSourcePGN().read_games(
+            self.paths[:1] + [missing]
+        )
+        ae([next(games).pgn_tags["Event"] for i in range(3)], ["A", "B", "C"])
+        self.assertRaises(FileNotFoundError, next, games)
+
+
+if __name__ == "__main__":
+    runner = unittest.TextTestRunner
+    loader = unittest.defaultTestLoader.loadTestsFromTestCase
+
+    runner().run(loader(MultiSourcePGN))
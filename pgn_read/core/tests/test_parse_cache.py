@@ -0,0 +1,193 @@
+# test_parse_cache.py
+# Copyright 2025 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""parse_cache tests"""
+
+import unittest
+import io
+import os
+import tempfile
+
+from .. import parse_cache
+from .. import parser
+from .. import game
+from .. import game_text_pgn
+
+GAMES = "".join(
+    (
+        '[Event"A"][White"X"][Black"Y"][Result"1-0"]e4 e5(c5)Nf3 1-0\n',
+        '[Event"B"][White"Y"][Black"X"][Result"*"]e4 e5 Ke4 Nf3\n\n',
+        '[Event"C"][White"Z"][Black"X"][Result"*"]d4 *\n',
+    )
+)
+
+
+class Functions(unittest.TestCase):
+    def test_01_game_class_name(self):
+        ae = self.assertEqual
+        ae(parse_cache.game_class_name(game.Game), "pgn_read.core.game.Game")
+
+    def test_02_library_version(self):
+        self.assertIsInstance(parse_cache.library_version(), str)
+
+    def test_03_encode_games(self):
+        ae = self.assertEqual
+        games = [
+            parse_cache.CachedGame.from_game(g, fen=True)
+            for g in parser.PGN().read_games(GAMES)
+        ]
+        other = parse_cache.CachedGame.decode(parse_cache.encode_games(games))
+        ae(len(other), 3)
+        for cached, decoded in zip(games, other):
+            ae(decoded.pgn_tags, cached.pgn_tags)
+            ae(decoded.pgn_text, cached.pgn_text)
+            ae(decoded.state, cached.state)
+            ae(decoded.error_list, cached.error_list)
+            ae(decoded.game_offset, cached.game_offset)
+            ae(decoded.fen, cached.fen)
+
+
+class CachedPGN(unittest.TestCase):
+    def setUp(self):
+        self.cache = parse_cache.CachedPGN(":memory:", version="test")
+
+    def tearDown(self):
+        if self.cache.connection is not None:
+            self.cache.connection.close()
+        del self.cache
+
+    def read(self, text):
+        """Return list of pgn_text, state, tags, and offset, for games."""
+        return [
+            (g.pgn_text, g.state, g.pgn_tags, g.game_offset)
+            for g in self.cache.read_games(io.StringIO(text))
+        ]
+
+    def test_01_read_games(self):
+        ae = self.assertEqual
+        expected = [
+            (
+                list(g.pgn_text),
+                g.state,
+                dict(g.pgn_tags),
+                g.game_offset,
+            )
+            for g in parser.PGN().read_games(io.StringIO(GAMES))
+        ]
+        ae(len(expected), 3)
+        ae(self.read(GAMES), expected)
+        ae((self.cache.hits, self.cache.misses), (0, 3))
+        ae(self.read(GAMES), expected)
+        ae((self.cache.hits, self.cache.misses), (3, 3))
+
+    def test_02_game_offset(self):
+        ae = self.assertEqual
+        ae([g[-1] for g in self.read(GAMES)], [59, 116, 161])
+        ae([g[-1] for g in self.read("\n" + GAMES)], [60, 117, 162])
+        ae([g[1] for g in self.read(GAMES[60:])], [6, None])
+        ae((self.cache.hits, self.cache.misses), (5, 3))
+
+    def test_03_fen(self):
+        ae = self.assertEqual
+        self.cache.fen = True
+        ae(
+            [g.fen for g in self.cache.read_games(GAMES)],
+            [
+                "rnbqkbnr/pppp1ppp/8/4p3/4P3/5N2/PPPP1PPP/RNBQKB1R b KQkq"
+                " - 1 2",
+                "rnbqkbnr/pppp1ppp/8/4p3/4P3/8/PPPP1PPP/RNBQKBNR w KQkq"
+                " e6 0 2",
+                "rnbqkbnr/pppppppp/8/8/3P4/8/PPP1PPPP/RNBQKBNR b KQkq"
+                " d3 0 1",
+            ],
+        )
+
+    def test_04_eviction(self):
+        ae = self.assertEqual
+        self.cache.max_entries = 2
+        self.read(GAMES)
+        ae(
+            self.cache.connection.execute(
+                "select count(*) from games"
+            ).fetchone()[0],
+            2,
+        )
+        self.read(GAMES[116:])
+        ae((self.cache.hits, self.cache.misses), (1, 3))
+        self.read(GAMES[:59])
+        ae((self.cache.hits, self.cache.misses), (1, 4))
+
+    def test_05_version_and_game_class(self):
+        ae = self.assertEqual
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "cache.sqlite")
+            cache = parse_cache.CachedPGN(path, version="1")
+            list(cache.read_games(GAMES))
+            cache.close()
+            cache = parse_cache.CachedPGN(path, version="1")
+            list(cache.read_games(GAMES))
+            ae((cache.hits, cache.misses), (3, 0))
+            cache.close()
+            cache = parse_cache.CachedPGN(
+                path, version="1", game_class=game_text_pgn.GameTextPGN
+            )
+            list(cache.read_games(GAMES))
+            ae((cache.hits, cache.misses), (0, 3))
+            cache.close()
+            cache = parse_cache.CachedPGN(path, version="2")
+            ae(
+                cache.connection.execute(
+                    "select count(*) from games"
+                ).fetchone()[0],
+                0,
+            )
+            list(cache.read_games(GAMES))
+            ae((cache.hits, cache.misses), (0, 3))
+            cache.close()
+
+    def expected(self, text):
+        """Return list of pgn_text, state, tags, and offset, from PGN."""
+        return [
+            (list(g.pgn_text), g.state, dict(g.pgn_tags), g.game_offset)
+            for g in parser.PGN().read_games(io.StringIO(text))
+        ]
+
+    def test_06_game_continued_past_tag(self):
+        ae = self.assertEqual
+        text = '1. e4 e5\n[Event "b"]\n1. d4 d5 1-0\n'
+        expected = self.expected(text)
+        ae(len(expected), 1)
+        ae(expected[0][1], 2)
+        ae(self.read(text), expected)
+        ae((self.cache.hits, self.cache.misses), (0, 2))
+        ae(self.read(text), expected)
+        ae((self.cache.hits, self.cache.misses), (2, 2))
+
+    def test_07_unterminated_comment_continued_past_tag(self):
+        ae = self.assertEqual
+        text = GAMES[:59] + '[Event"B"]e4 {comment\n' + GAMES[116:]
+        expected = self.expected(text)
+        ae(len(expected), 2)
+        ae(self.read(text), expected)
+        ae(self.read(text), expected)
+
+    def test_08_unterminated_final_token(self):
+        ae = self.assertEqual
+        for text in (
+            '[Event"A"]e4 {unterminated \n\n',
+            '[Event"A"]e4 <unterminated \n\n',
+            GAMES + '[Event"D"]e4 {unterminated\t \n',
+        ):
+            expected = self.expected(text)
+            ae(self.read(text), expected)
+            ae(self.read(text), expected)
+            ae(self.read(text)[-1][0][-1], expected[-1][0][-1])
+
+
+if __name__ == "__main__":
+    runner = unittest.TextTestRunner
+    loader = unittest.defaultTestLoader.loadTestsFromTestCase
+
+    runner().run(loader(Functions))
+    runner().run(loader(CachedPGN))
@@ -9624,6 +9624,67 @@ class GameTextPGNLongAlgebraicNotationPawnMove(_BasePGN):
         ae(games[0].state, None)
 
 
+class GameIgnoreCasePGNSplitLongAlgebraicNotation(_BasePGN):
+    """Provide tests of moves like 'e2 e4' read by GameIgnoreCasePGN."""
+
+    def setUp(self):
+        self.pgn = parser.PGN(
+            game_class=game_ignore_case_pgn.GameIgnoreCasePGN
+        )
+
+    def counts(self, game):
+        """Return look-ahead and undo recovery counts for game."""
+        return game.lookahead_recovery_count, game.undo_recovery_count
+
+    def test_01_pawn_move(self):
+        ae = self.assertEqual
+        games = self.get("e2 e4 e7 e5 *")
+        ae(len(games), 1)
+        ae(games[0].state, None)
+        ae(games[0]._text, ["e4", "e5", "*"])
+        ae(self.counts(games[0]), (1, 0))
+
+    def test_02_pawn_move_not_legal(self):
+        ae = self.assertEqual
+        games = self.get("e4 e5 d2 d5 nf3 *")
+        ae(len(games), 1)
+        ae(games[0].state, 2)
+        ae(games[0]._text, ["e4", "e5", " d2", " nf3", " *"])
+        ae(self.counts(games[0]), (1, 0))
+
+    def test_03_pawn_move_without_look_ahead(self):
+        ae = self.assertEqual
+        games = self.get("e2 e4*")
+        ae(len(games), 1)
+        ae(games[0].state, None)
+        ae(games[0]._text, ["e4", "*"])
+        ae(self.counts(games[0]), (0, 1))
+
+    def test_04_b_pawn_move(self):
+        ae = self.assertEqual
+        games = self.get("d4 e5 b2 b4 *")
+        ae(len(games), 1)
+        ae(games[0].state, None)
+        ae(games[0]._text, ["d4", "e5", "b4", "*"])
+        ae(self.counts(games[0]), (1, 0))
+
+    def test_05_b_pawn_move_bishop_possible(self):
+        ae = self.assertEqual
+        games = self.get("d4 d6 bf4 e6 b2 B4 *")
+        ae(len(games), 1)
+        ae(games[0].state, None)
+        ae(games[0]._text, ["d4", "d6", "Bf4", "e6", "b4", "*"])
+        ae(self.counts(games[0]), (1, 0))
+
+    def test_06_b_pawn_move_not_legal(self):
+        ae = self.assertEqual
+        games = self.get("e4 e5 b2 c3 nf3 *")
+        ae(len(games), 1)
+        ae(games[0].state, 2)
+        ae(games[0]._text, ["e4", "e5", " b2-c3", " c3", " nf3", " *"])
+        ae(self.counts(games[0]), (1, 0))
+
+
 if __name__ == "__main__":
     runner = unittest.TextTestRunner
     loader = unittest.defaultTestLoader.loadTestsFromTestCase
@@ -9645,3 +9706,4 @@ if __name__ == "__main__":
     runner().run(loader(GameIgnoreCasePGN))
     runner().run(loader(GameLongAlgebraicNotationPawnMove))
     runner().run(loader(GameTextPGNLongAlgebraicNotationPawnMove))
+    runner().run(loader(GameIgnoreCasePGNSplitLongAlgebraicNotation))
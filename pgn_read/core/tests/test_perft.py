@@ -0,0 +1,72 @@
+# test_perft.py
+# Copyright 2025 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""perft tests"""
+
+import unittest
+
+from .. import perft
+from .. import gamedata
+
+
+class Perft(unittest.TestCase):
+    def test_01_game_for_position(self):
+        ae = self.assertEqual
+        game = perft.game_for_position(perft.PERFT_POSITIONS[2][1])
+        ae(game.state, None)
+        ae(len(game.legal_moves()), 14)
+
+    def test_02_game_for_position_invalid_fen(self):
+        self.assertRaisesRegex(
+            gamedata.GameError,
+            "Invalid FEN 'x'$",
+            perft.game_for_position,
+            *("x",),
+        )
+
+    def test_03_perft_depth_0(self):
+        ae = self.assertEqual
+        game = perft.game_for_position(perft.PERFT_POSITIONS[0][1])
+        ae(perft.perft(game, 0), 1)
+
+    def test_04_perft_positions(self):
+        ae = self.assertEqual
+        for name, fen, counts in perft.PERFT_POSITIONS:
+            game = perft.game_for_position(fen)
+            for depth, count in enumerate(counts[:2], start=1):
+                ae((name, perft.perft(game, depth)), (name, count))
+
+    def test_05_perft_leaves_position_unchanged(self):
+        ae = self.assertEqual
+        game = perft.game_for_position(perft.PERFT_POSITIONS[1][1])
+        fen = game.get_fen_for_position()
+        moves = sorted(game.legal_moves())
+        ae(perft.perft(game, 2), 2039)
+        ae(game.get_fen_for_position(), fen)
+        ae(sorted(game.legal_moves()), moves)
+
+    def test_06_perft_divide(self):
+        ae = self.assertEqual
+        game = perft.game_for_position(perft.PERFT_POSITIONS[2][1])
+        counts = perft.perft_divide(game, 2)
+        ae(len(counts), 14)
+        ae(counts["Rxf4"], 2)
+        ae(counts["g3"], 4)
+        ae(counts["g4"], 17)
+        ae(sum(counts.values()), 191)
+
+    def test_07_perft_positions(self):
+        ae = self.assertEqual
+        results = list(perft.perft_positions(maximum_depth=2))
+        ae(len(results), 2 * len(perft.PERFT_POSITIONS))
+        for name, depth, count, expected, seconds in results:
+            ae((name, depth, count), (name, depth, expected))
+            self.assertGreaterEqual(seconds, 0)
+
+
+if __name__ == "__main__":
+    runner = unittest.TextTestRunner
+    loader = unittest.defaultTestLoader.loadTestsFromTestCase
+
+    runner().run(loader(Perft))
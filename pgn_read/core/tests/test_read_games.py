@@ -191,6 +191,149 @@ class WhitespaceReservedPGN(_WhitespaceCommentPGN, _PGNtests):
     """Do tests with whitespace."""
 
 
+class ReadLimits(unittest.TestCase):
+    """Test games cut off by limits with all buffer lengths."""
+
+    def setUp(self):
+        self.text = "".join(
+            (
+                '[Event "G1"]\ne4 e5 *\n',
+                '[Event "Bad"]\ne4 { unterminated\n',
+                "x " * 20,
+                '\n[Event "G2"]\nd4 (c4 (b4 (a4))) d5 1-0\n',
+                '[Event "G3"]\nNf3 Nf6 g3 g6 Bg2 Bg7 O-O O-O 0-1\n',
+            )
+        )
+
+    def tearDown(self):
+        del self.text
+
+    def get(self, size, **limits):
+        """Return event, state, limit_exceeded, and game_offset, of games."""
+        return [
+            (
+                game.pgn_tags.get("Event"),
+                game.state,
+                game.limit_exceeded,
+                game.game_offset,
+            )
+            for game in parser.PGN(**limits).read_games(
+                io.StringIO(self.text), size
+            )
+        ]
+
+    def do_limit_tests(self, expected, **limits):
+        ae = self.assertEqual
+        for size in range(1, len(self.text) + 2):
+            ae(self.get(size, **limits), expected)
+
+    def test_001_no_limits(self):
+        self.do_limit_tests(
+            [("G1", None, None, 20), ("Bad", 2, None, len(self.text))]
+        )
+
+    def test_002_max_comment_length(self):
+        self.do_limit_tests(
+            [
+                ("G1", None, None, 20),
+                ("Bad", 2, parser.MAX_COMMENT_LENGTH, 38),
+                ("G2", None, None, 131),
+                ("G3", None, None, 178),
+            ],
+            max_comment_length=30,
+        )
+
+    def test_003_max_game_characters(self):
+        self.do_limit_tests(
+            [
+                ("G1", None, None, 20),
+                ("Bad", 2, parser.MAX_GAME_CHARACTERS, 38),
+                ("G2", None, None, 131),
+                ("G3", 8, parser.MAX_GAME_CHARACTERS, 171),
+            ],
+            max_game_characters=40,
+        )
+
+    def test_004_max_tokens(self):
+        self.do_limit_tests(
+            [
+                ("G1", None, None, 20),
+                ("Bad", 2, None, len(self.text)),
+            ],
+            max_tokens=10,
+        )
+        self.text = self.text.replace("{", "")
+        self.do_limit_tests(
+            [
+                ("G1", None, None, 20),
+                ("Bad", 2, parser.MAX_TOKENS, 58),
+                ("G2", 6, parser.MAX_TOKENS, 117),
+                ("G3", 6, parser.MAX_TOKENS, 162),
+            ],
+            max_tokens=6,
+        )
+
+    def test_005_max_rav_depth(self):
+        self.do_limit_tests(
+            [
+                ("G1", None, None, 20),
+                ("Bad", 2, None, len(self.text)),
+            ],
+            max_rav_depth=2,
+        )
+        self.text = self.text.replace("{", "")
+        self.do_limit_tests(
+            [
+                ("G1", None, None, 20),
+                ("Bad", 2, None, 93),
+                ("G2", 6, parser.MAX_RAV_DEPTH, 117),
+                ("G3", None, None, 177),
+            ],
+            max_rav_depth=2,
+        )
+
+    def test_006_trailing_whitespace(self):
+        ae = self.assertEqual
+        self.text = "e4 e5" + " " * 50 + 'Nf3 *\n[Event "G1"]\ne4 e5 *\n'
+
+        # The game is cut off at the end of the buffer if whitespace at the
+        # end of the buffer exceeds the limit, otherwise at 'Nf3'.
+        for size, offset in ((20, 55), (45, 45), (50, 50), (1000, 55)):
+            ae(
+                self.get(size, max_game_characters=40),
+                [
+                    (None, 2, parser.MAX_GAME_CHARACTERS, offset),
+                    ("G1", None, None, 81),
+                ],
+            )
+
+    def test_007_unterminated_comment_default_max_game_characters(self):
+        ae = self.assertEqual
+        ae(parser.PGN().max_game_characters, None)
+        ae(
+            parser.PGN(max_tokens=10).max_game_characters,
+            parser.DEFAULT_MAX_GAME_CHARACTERS,
+        )
+        ae(parser.PGN(max_tokens=10, max_game_characters=5).max_tokens, 10)
+        game = "".join(
+            (
+                '[Event "G"]\n[Annotator "',
+                "x" * 1000,
+                '"]\ne4 *\n',
+            )
+        )
+        count = parser.DEFAULT_MAX_GAME_CHARACTERS // len(game) + 10
+        bad = '[Event "Bad"]\ne4 { unterminated\n'
+        self.text = bad + game * count
+        for limits in (dict(max_tokens=10), dict(max_rav_depth=2)):
+            for size in (10000, 100000):
+                games = self.get(size, **limits)
+                ae(len(games), count + 1)
+                ae(games[0], ("Bad", 2, parser.MAX_GAME_CHARACTERS, 17))
+                ae(games[1], ("G", None, None, len(bad + game) - 1))
+                ae(games[-1], ("G", None, None, len(self.text) - 1))
+
+
 if __name__ == "__main__":
     runner = unittest.TextTestRunner
     loader = unittest.defaultTestLoader.loadTestsFromTestCase
@@ -200,3 +343,4 @@ if __name__ == "__main__":
     runner().run(loader(WhitespaceCommentPGN))
     runner().run(loader(NoWhitespaceReservedPGN))
     runner().run(loader(WhitespaceReservedPGN))
+    runner().run(loader(ReadLimits))
@@ -0,0 +1,147 @@
+# test_shared_games.py
+# Copyright 2025 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""shared_games tests"""
+
+import unittest
+import io
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    from .. import shared_games
+except ImportError:  # multiprocessing.shared_memory is not available.
+    shared_games = None
+from .. import parser
+from .. import game
+from .. import game_text_pgn
+
+GAMES = "".join(
+    (
+        '[Event"A"][White"Ä"][Result"1-0"]e4 e5(c5)Nf3 1-0\n',
+        '[Event"B"][Result"*"]e4 e5 Ke4 Nf3\n\n',
+        '[Event"C"][Result"*"]e4 {note 1-0\n[Event"X"]} e5 *\n',
+        '[Event"D"][Result"*"]d4 (d5 Nc6) d5 *\n',
+        '[Event"E"][Result"*"]e4 e5 Nf3\n',
+    )
+)
+
+
+def _summary(games):
+    """Return list of text, state, errors, tags, and game offset, for games."""
+    return [
+        (
+            list(g.pgn_text),
+            g.state,
+            list(g.error_list),
+            dict(g.pgn_tags),
+            g.game_offset,
+        )
+        for g in games
+    ]
+
+
+@unittest.skipIf(shared_games is None, "shared_memory not available")
+class Functions(unittest.TestCase):
+    def test_01_encode_games_decode_games(self):
+        ae = self.assertEqual
+        games = list(parser.PGN().read_games(io.StringIO(GAMES)))
+        shared = shared_games.decode_games(
+            shared_games.encode_games(games), game.Game, GAMES, 10
+        )
+        ae(len(shared), 5)
+        for other, original in zip(shared, games):
+            ae(other.pgn_tags, original.pgn_tags)
+            ae(other.state, original.state)
+            ae(other.error_list, original.error_list)
+            ae(other.game_offset, original.game_offset + 10)
+        ae(shared[0].text, GAMES[: games[0].game_offset])
+        ae(shared[1].text, GAMES[games[0].game_offset : games[1].game_offset])
+        ae(shared[3].game_ok, False)
+        ae(shared[3].game_has_errors, False)
+        ae(shared[4].game_has_errors, True)
+
+    def test_02_encode_games_no_games(self):
+        ae = self.assertEqual
+        ae(
+            shared_games.decode_games(
+                shared_games.encode_games([]), game.Game, "", 0
+            ),
+            [],
+        )
+
+    def test_03_encode_games_newline_in_tag_value(self):
+        ae = self.assertEqual
+        text = '[Event "a\nb"][Site "c\td"]e4 *\n[Event"E"][Site"S"]d4 *\n'
+        games = list(parser.PGN().read_games(text))
+        ae(games[0].pgn_tags, {"Event": "a\nb", "Site": "c\td"})
+        shared = shared_games.decode_games(
+            shared_games.encode_games(games), game.Game, text, 0
+        )
+        ae(
+            [other.pgn_tags for other in shared],
+            [{"Event": "a\nb", "Site": "c\td"}, {"Event": "E", "Site": "S"}],
+        )
+
+
+@unittest.skipIf(shared_games is None, "shared_memory not available")
+class SharedMemoryPGN(unittest.TestCase):
+    def setUp(self):
+        self.executor = ProcessPoolExecutor(max_workers=2)
+
+    def tearDown(self):
+        self.executor.shutdown()
+        del self.executor
+
+    def read(self, text, **kwargs):
+        """Return SharedGame instances for games in text."""
+        return list(
+            shared_games.SharedMemoryPGN(
+                executor=self.executor, **kwargs
+            ).read_games(io.StringIO(text), size=97)
+        )
+
+    def test_01_read_games(self):
+        ae = self.assertEqual
+        expected = _summary(parser.PGN().read_games(io.StringIO(GAMES * 2)))
+        ae(len(expected), 10)
+        for chunk_size in (1, 100, 1000):
+            shared = self.read(GAMES * 2, chunk_size=chunk_size)
+            ae(
+                [
+                    (g.state, g.error_list, g.pgn_tags, g.game_offset)
+                    for g in shared
+                ],
+                [e[1:] for e in expected],
+            )
+            ae(_summary(g.game() for g in shared), expected)
+
+    def test_02_game_class(self):
+        ae = self.assertEqual
+        shared = self.read(
+            GAMES, chunk_size=1, game_class=game_text_pgn.GameTextPGN
+        )
+        ae(
+            _summary(g.game() for g in shared),
+            _summary(
+                parser.PGN(game_class=game_text_pgn.GameTextPGN).read_games(
+                    io.StringIO(GAMES)
+                )
+            ),
+        )
+
+    def test_03_close_early(self):
+        ae = self.assertEqual
+        games = shared_games.SharedMemoryPGN(
+            executor=self.executor, chunk_size=1
+        ).read_games(io.StringIO(GAMES * 5))
+        ae(next(games).pgn_tags["Event"], "A")
+        games.close()
+
+
+if __name__ == "__main__":
+    runner = unittest.TextTestRunner
+    loader = unittest.defaultTestLoader.loadTestsFromTestCase
+
+    runner().run(loader(Functions))
+    runner().run(loader(SharedMemoryPGN))
@@ -0,0 +1,195 @@
+# test_split_pgn.py
+# Copyright 2025 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""split_pgn tests"""
+
+import unittest
+import os
+import json
+import tempfile
+import gzip
+
+from .. import split_pgn
+
+GAMES = "".join(
+    (
+        '[Event"A"][Result"1-0"]e4 e5 Nf3 1-0\n',
+        '[Event"B"][Result"*"]e4 e5 Ke4 Nf3\n\n',
+        '[Event"C"][Result"*"]e4 {note 1-0\n[Event"X"]} e5 *\n',
+        '[Event"D"][Result"*"]d4 (d5 Nc6) d5 Nf3 Nf6 c4 e6 Nc3 Be7 *\n',
+        '[Event"E"][Result"*"]e4 e5 Nf3\n',
+    )
+)
+
+
+class Functions(unittest.TestCase):
+    def test_01_find_game_ends(self):
+        ae = self.assertEqual
+        ends, length = split_pgn.find_game_ends(GAMES)
+        ae(list(ends), [36, 71, 123, 183])
+        ae(length, len(GAMES))
+
+    def test_02_find_game_ends_small_size(self):
+        ae = self.assertEqual
+        ae(
+            split_pgn.find_game_ends(GAMES, size=7),
+            split_pgn.find_game_ends(GAMES),
+        )
+
+    def test_03_shard_boundaries_count(self):
+        ae = self.assertEqual
+        ends, length = split_pgn.find_game_ends(GAMES)
+        ae(
+            split_pgn.shard_boundaries(
+                ends, length, 2, balance=split_pgn.BALANCE_COUNT
+            ),
+            [0, 71, length],
+        )
+        ae(
+            split_pgn.shard_boundaries(
+                ends, length, 1, balance=split_pgn.BALANCE_COUNT
+            ),
+            [0, length],
+        )
+
+    def test_04_shard_boundaries_size(self):
+        ae = self.assertEqual
+        ends, length = split_pgn.find_game_ends(GAMES)
+        ae(split_pgn.shard_boundaries(ends, length, 2), [0, 123, length])
+        ae(
+            split_pgn.shard_boundaries(ends, length, 3),
+            [0, 71, 123, length],
+        )
+
+    def test_05_shard_boundaries_more_shards_than_games(self):
+        ae = self.assertEqual
+        ends, length = split_pgn.find_game_ends(GAMES[:123])
+        ae(
+            split_pgn.shard_boundaries(
+                ends, length, 4, balance=split_pgn.BALANCE_COUNT
+            ),
+            [0, 0, 36, 71, 123],
+        )
+        ae(split_pgn.shard_boundaries([], 0, 2), [0, 0, 0])
+
+    def test_06_shard_boundaries_errors(self):
+        self.assertRaisesRegex(
+            split_pgn.SplitPGNError,
+            "Number of shards must be at least 1$",
+            split_pgn.shard_boundaries,
+            *([], 0, 0),
+        )
+        self.assertRaisesRegex(
+            split_pgn.SplitPGNError,
+            "Balance must be 'size' or 'count'$",
+            split_pgn.shard_boundaries,
+            *([], 0, 2),
+            **dict(balance="games"),
+        )
+
+
+class SplitPGN(unittest.TestCase):
+    def split(self, directory, source_suffix, **kwargs):
+        """Write GAMES to file in directory and return split_pgn result."""
+        path = os.path.join(directory, "games" + source_suffix)
+        with split_pgn.open_pgn_file(path, mode="w") as file:
+            file.write(GAMES)
+        shards = os.path.join(directory, "shards")
+        os.mkdir(shards)
+        return path, shards, split_pgn.split_pgn(path, shards, 2, **kwargs)
+
+    def test_01_split_pgn(self):
+        ae = self.assertEqual
+        with tempfile.TemporaryDirectory() as directory:
+            path, shards, manifest = self.split(directory, ".pgn")
+            ae(
+                manifest,
+                {
+                    "source": path,
+                    "balance": "size",
+                    "games": 4,
+                    "length": len(GAMES),
+                    "shards": [
+                        {
+                            "name": "shard_000.pgn",
+                            "games": 3,
+                            "start": 0,
+                            "end": 123,
+                        },
+                        {
+                            "name": "shard_001.pgn",
+                            "games": 1,
+                            "start": 123,
+                            "end": len(GAMES),
+                        },
+                    ],
+                },
+            )
+            with open(
+                os.path.join(shards, split_pgn.MANIFEST_NAME), encoding="utf-8"
+            ) as file:
+                ae(json.load(file), manifest)
+            text = []
+            for shard in manifest["shards"]:
+                with open(
+                    os.path.join(shards, shard["name"]), encoding="iso-8859-1"
+                ) as file:
+                    text.append(file.read())
+            ae(text, [GAMES[:123], GAMES[123:]])
+
+    def test_02_split_pgn_compressed(self):
+        ae = self.assertEqual
+        for suffix in split_pgn.COMPRESSION:
+            with tempfile.TemporaryDirectory() as directory:
+                path, shards, manifest = self.split(
+                    directory,
+                    ".pgn" + suffix,
+                    balance=split_pgn.BALANCE_COUNT,
+                    suffix=".pgn" + suffix,
+                    size=10,
+                )
+                ae([shard["games"] for shard in manifest["shards"]], [2, 2])
+                text = []
+                for shard in manifest["shards"]:
+                    ae(shard["name"].endswith(suffix), True)
+                    with split_pgn.open_pgn_file(
+                        os.path.join(shards, shard["name"])
+                    ) as file:
+                        text.append(file.read())
+                ae(text, [GAMES[:71], GAMES[71:]])
+
+    def test_03_split_pgn_crlf(self):
+        ae = self.assertEqual
+        source = GAMES.replace("\n", "\r\n").encode("iso-8859-1")
+        for suffix, write in (
+            (".pgn", lambda data: data),
+            (".pgn.gz", gzip.compress),
+        ):
+            with tempfile.TemporaryDirectory() as directory:
+                path = os.path.join(directory, "games" + suffix)
+                with open(path, mode="wb") as file:
+                    file.write(write(source))
+                shards = os.path.join(directory, "shards")
+                os.mkdir(shards)
+                manifest = split_pgn.split_pgn(
+                    path, shards, 2, suffix=suffix, size=10
+                )
+                ae(manifest["games"], 4)
+                ae(manifest["length"], len(source))
+                for shard in manifest["shards"]:
+                    with open(
+                        os.path.join(shards, shard["name"]), mode="rb"
+                    ) as file:
+                        data = file.read()
+                    if suffix != ".pgn":
+                        data = gzip.decompress(data)
+                    ae(data, source[shard["start"] : shard["end"]])
+
+
+if __name__ == "__main__":
+    runner = unittest.TextTestRunner
+    loader = unittest.defaultTestLoader.loadTestsFromTestCase
+
+    runner().run(loader(Functions))
+    runner().run(loader(SplitPGN))
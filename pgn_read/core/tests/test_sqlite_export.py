@@ -0,0 +1,146 @@
+# test_sqlite_export.py
+# Copyright 2025 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""sqlite_export tests"""
+
+import unittest
+import io
+import os
+import tempfile
+
+from .. import sqlite_export
+
+GAMES = "".join(
+    (
+        '[Event"A"][White"X"][Black"Y"][Result"1-0"]e4 e5(c5)Nf3 1-0\n',
+        '[Event"A"][White"Y"][Black"X"][Result"*"]e4 e5 Ke4 *\n',
+    )
+)
+
+
+class Functions(unittest.TestCase):
+    def test_01_encode_path(self):
+        ae = self.assertEqual
+        ae(sqlite_export.encode_path(()), "")
+        ae(sqlite_export.encode_path(((1, 1), (2, 3))), "1.1 2.3")
+
+    def test_02_decode_path(self):
+        ae = self.assertEqual
+        ae(sqlite_export.decode_path(""), ())
+        ae(sqlite_export.decode_path("1.1 2.3"), ((1, 1), (2, 3)))
+
+
+class SQLiteExport(unittest.TestCase):
+    def setUp(self):
+        self.export = sqlite_export.SQLiteExport(":memory:")
+
+    def tearDown(self):
+        if self.export.connection is not None:
+            self.export.connection.close()
+        del self.export
+
+    def select(self, statement):
+        """Return rows selected by statement."""
+        return self.export.connection.execute(statement).fetchall()
+
+    def test_01_export_pgn(self):
+        ae = self.assertEqual
+        ae(self.export.export_pgn(io.StringIO(GAMES)), 2)
+        ae(
+            self.select("select game, state from games"),
+            [(1, None), (2, 6)],
+        )
+        ae(
+            self.select("select name from tag_names"),
+            [("Event",), ("White",), ("Black",), ("Result",)],
+        )
+        ae(
+            self.select("select value from tag_values"),
+            [("A",), ("X",), ("Y",), ("1-0",), ("*",)],
+        )
+        ae(len(self.select("select * from game_tags")), 8)
+        ae(
+            self.select(
+                " ".join(
+                    (
+                        "select game from game_tags",
+                        "join tag_names using (tag_name)",
+                        "join tag_values using (tag_value)",
+                        "where name = 'White' and value = 'Y'",
+                    )
+                )
+            ),
+            [(2,)],
+        )
+
+    def test_02_moves_and_errors(self):
+        ae = self.assertEqual
+        self.export.export_pgn(io.StringIO(GAMES))
+        ae(
+            self.select("select * from moves where game = 1"),
+            [
+                (1, 0, 0, "", None, None),
+                (1, 1, 1, "", "e4", None),
+                (1, 2, 2, "", "e5", None),
+                (1, 3, 2, "2.1", "c5", None),
+                (1, 4, 3, "", "Nf3", None),
+            ],
+        )
+        ae(self.select("select * from positions"), [])
+        ae(self.select("select * from errors"), [(2, 6, " Ke4")])
+
+    def test_03_positions(self):
+        ae = self.assertEqual
+        self.export.positions = True
+        self.export.export_pgn(io.StringIO(GAMES))
+        ae(len(self.select("select * from positions")), 5)
+        ae(
+            self.select(
+                " ".join(
+                    (
+                        "select game, move from moves",
+                        "join positions using (position)",
+                        "where epd =",
+                        "'rnbqkbnr/pppp1ppp/8/4p3/4P3/8/PPPP1PPP/RNBQKBNR",
+                        "w KQkq e6' order by game",
+                    )
+                )
+            ),
+            [(1, 2), (2, 2)],
+        )
+
+    def test_04_batches(self):
+        ae = self.assertEqual
+        self.export.batch_size = 1
+        ae(self.export.export_pgn(io.StringIO(GAMES * 2)), 4)
+        ae(len(self.select("select * from games")), 4)
+        ae(len(self.select("select * from tag_values")), 5)
+
+    def test_05_append_to_database(self):
+        ae = self.assertEqual
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "games.sqlite")
+            export = sqlite_export.SQLiteExport(path)
+            export.export_pgn(io.StringIO(GAMES))
+            export.close()
+            export = sqlite_export.SQLiteExport(path)
+            export.export_pgn(io.StringIO(GAMES))
+            connection = export.connection
+            ae(
+                connection.execute("select game from games").fetchall(),
+                [(1,), (2,), (3,), (4,)],
+            )
+            ae(
+                connection.execute("select * from tag_names").fetchall(),
+                [(1, "Event"), (2, "White"), (3, "Black"), (4, "Result")],
+            )
+            export.close()
+
+
+if __name__ == "__main__":
+    runner = unittest.TextTestRunner
+    loader = unittest.defaultTestLoader.loadTestsFromTestCase
+
+    runner().run(loader(Functions))
+    runner().run(loader(SQLiteExport))
@@ -0,0 +1,149 @@
+# test_tag_columns.py
+# Copyright 2025 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""tag_columns tests"""
+
+import unittest
+import io
+import os
+import tempfile
+
+from .. import tag_columns
+
+GAMES = "".join(
+    (
+        '[Event"A"][White"X"][Black"Y"][Result"1-0"]\n',
+        "1. e4 e5 2. Nf3 {Re1 Qd1} (2. Qh5 Nc6) Nc6 3. Bb5 a6 ; Bxc6\n",
+        "4. Ba4 Nf6 5. O-O 1-0\n",
+        '[Event"B"][White"Y"][Result"*"][White"Z"]d4 *\n',
+        '[Event"C\\"][Black"X"]*\n',
+    )
+)
+
+
+class Functions(unittest.TestCase):
+    def test_01_count_main_line_moves(self):
+        ae = self.assertEqual
+        ae(tag_columns.count_main_line_moves(""), 0)
+        ae(tag_columns.count_main_line_moves("1.e4e5 2.Qh4xe1"), 3)
+        ae(tag_columns.count_main_line_moves("e4 (d4 (c4) d5) e5"), 2)
+        ae(tag_columns.count_main_line_moves("e4 {(d4} <x) d5> e5"), 2)
+        ae(tag_columns.count_main_line_moves("e4 ;(d4\ne5 exd6 Nbd7"), 4)
+
+    def test_02_tag_columns_game_class(self):
+        ae = self.assertEqual
+        game_class = tag_columns.tag_columns_game_class(("White", "Black"))
+        ae(issubclass(game_class, tag_columns.TagColumnsGame), True)
+        ae(game_class._column_numbers, {"White": 0, "Black": 1})
+        ae(game_class().values, [None, None])
+
+
+class TagColumnsReader(unittest.TestCase):
+    def setUp(self):
+        self.reader = tag_columns.TagColumnsReader(
+            tag_names=("Event", "White", "Black"), batch_size=2
+        )
+
+    def tearDown(self):
+        del self.reader
+
+    def test_01_read_batches(self):
+        ae = self.assertEqual
+        batches = list(self.reader.read_batches(io.StringIO(GAMES)))
+        ae(len(batches), 2)
+        ae([len(batch) for batch in batches], [2, 1])
+        ae(
+            batches[0].names,
+            (
+                "Event",
+                "White",
+                "Black",
+                "ply_count",
+                "tag_error",
+                "game_offset",
+            ),
+        )
+        ae(batches[0].column("White"), ["X", "Y"])
+        ae(batches[0].column("Black"), ["Y", None])
+        ae(list(batches[0].column("ply_count")), [9, 1])
+        ae(list(batches[0].column("tag_error")), [0, 1])
+        ae(batches[1].column("Event"), ["C\\\\"])
+        ae(list(batches[1].column("tag_error")), [1])
+        ae(
+            list(batches[1].column("game_offset")),
+            [len(GAMES) - 1],
+        )
+
+    def test_02_write_csv(self):
+        ae = self.assertEqual
+        file = io.StringIO(newline="")
+        tag_columns.write_csv(
+            self.reader.read_batches(io.StringIO(GAMES)), file
+        )
+        ae(
+            file.getvalue().splitlines()[:3],
+            [
+                "Event,White,Black,ply_count,tag_error,game_offset",
+                "A,X,Y,9,0,125",
+                "B,Y,,1,1,171",
+            ],
+        )
+
+    def test_03_write_and_read_columns(self):
+        ae = self.assertEqual
+        batches = list(self.reader.read_batches(io.StringIO(GAMES)))
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "tags.columns")
+            tag_columns.write_columns(
+                batches, path, tag_names=self.reader.tag_names
+            )
+            other = list(tag_columns.read_columns(path))
+        ae(len(other), len(batches))
+        for batch, other_batch in zip(batches, other):
+            ae(other_batch.names, batch.names)
+            ae(
+                list(other_batch.rows()),
+                [
+                    tuple("" if v is None else v for v in row)
+                    for row in batch.rows()
+                ],
+            )
+
+    def test_04_read_columns_not_columns(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "tags.columns")
+            with open(path, mode="wb") as file:
+                file.write(b"[Event")
+            self.assertRaisesRegex(
+                tag_columns.TagColumnsError,
+                "is not a tag columns file$",
+                list,
+                *(tag_columns.read_columns(path),),
+            )
+
+    def test_05_read_columns_truncated(self):
+        batches = self.reader.read_batches(io.StringIO(GAMES))
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "tags.columns")
+            tag_columns.write_columns(
+                batches, path, tag_names=self.reader.tag_names
+            )
+            with open(path, mode="rb") as file:
+                data = file.read()
+            with open(path, mode="wb") as file:
+                file.write(data[:-3])
+            self.assertRaisesRegex(
+                tag_columns.TagColumnsError,
+                "tag columns file is truncated$",
+                list,
+                *(tag_columns.read_columns(path),),
+            )
+
+
+if __name__ == "__main__":
+    runner = unittest.TextTestRunner
+    loader = unittest.defaultTestLoader.loadTestsFromTestCase
+
+    runner().run(loader(Functions))
+    runner().run(loader(TagColumnsReader))
@@ -785,6 +785,31 @@ class AddTokenToGame(unittest.TestCase):
         ae(game.state, 0)
 
 
+class RecordedSource(unittest.TestCase):
+    def test_01_text_of_games(self):
+        ae = self.assertEqual
+        text = '[Event"A"]e4 e5 1-0\n[Event"B"]d4 d5 *\n[Event"C"]c4'
+        source = tagpair_parser.RecordedSource(io.StringIO(text))
+        games = []
+        start = 0
+        for game in tagpair_parser.PGNTagPair().read_games(source, size=7):
+            games.append(source.text_between(start, game.game_offset))
+            start = game.game_offset
+        ae(source.end, len(text))
+        games.append(source.text_between(start, source.end))
+        ae("".join(games), text)
+        ae(games[0], '[Event"A"]e4 e5 1-0')
+
+    def test_02_consumed_text_discarded(self):
+        ae = self.assertEqual
+        source = tagpair_parser.RecordedSource(io.StringIO("abcdefghij"))
+        ae(source.read(4), "abcd")
+        ae(source.text_between(0, 3), "abc")
+        ae(source.read(4), "efgh")
+        ae(source._text, "defgh")
+        ae(source.text_between(3, 8), "defgh")
+
+
 if __name__ == "__main__":
     runner = unittest.TextTestRunner
     loader = unittest.defaultTestLoader.loadTestsFromTestCase
@@ -797,3 +822,4 @@ if __name__ == "__main__":
     runner().run(loader(GameCountPGN))
     runner().run(loader(TagPairGamePGN))
     runner().run(loader(AddTokenToGame))
+    runner().run(loader(RecordedSource))
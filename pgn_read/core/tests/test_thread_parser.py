@@ -0,0 +1,128 @@
+# test_thread_parser.py
+# Copyright 2025 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""thread_parser tests"""
+
+import unittest
+import io
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from .. import thread_parser
+from .. import parser
+from .. import game
+from .. import game_text_pgn
+from .. import game_ignore_case_pgn
+
+GAMES = "".join(
+    (
+        '[Event"A"][Result"1-0"]e4 e5(c5)Nf3 1-0\n',
+        '[Event"B"][Result"*"]e4 e5 Ke4 Nf3\n\n',
+        '[Event"C"][Result"*"]e4 {note 1-0\n[Event"X"]} e5 *\n',
+        '[Event"D"][Result"*"]d4 (d5 Nc6) d5 *\n',
+        '[Event"E"][Result"*"]e4 e5 Nf3\n',
+    )
+)
+
+PGN_FILES = os.path.join(os.path.dirname(__file__), "pgn_files")
+
+
+def _summary(games):
+    """Return list of text, state, errors, and game offset, for games."""
+    return [
+        (list(g.pgn_text), g.state, list(g._error_list), g.game_offset)
+        for g in games
+    ]
+
+
+class Functions(unittest.TestCase):
+    def test_01_parse_chunk(self):
+        ae = self.assertEqual
+        games, cut = thread_parser.parse_chunk(game.Game, GAMES[:127])
+        ae([g.game_offset for g in games], [39, 76, 126])
+        ae(cut, True)
+        games, cut = thread_parser.parse_chunk(game.Game, GAMES[:110])
+        ae([g.game_offset for g in games], [39, 76, 110])
+        ae(cut, False)
+
+    def test_02_chunk_end(self):
+        ae = self.assertEqual
+        ae(
+            [m.end() for m in thread_parser.chunk_end.finditer(GAMES)],
+            [40, 110, 127, 165],
+        )
+
+
+class ThreadPoolPGN(unittest.TestCase):
+    def read(self, text, **kwargs):
+        """Return summary of games read from text by ThreadPoolPGN."""
+        return _summary(
+            thread_parser.ThreadPoolPGN(**kwargs).read_games(
+                io.StringIO(text), size=97
+            )
+        )
+
+    def test_01_read_games(self):
+        ae = self.assertEqual
+        expected = _summary(parser.PGN().read_games(io.StringIO(GAMES)))
+        ae(len(expected), 5)
+        ae(self.read(GAMES), expected)
+        ae(self.read(GAMES, chunk_size=1), expected)
+        ae(self.read(GAMES, chunk_size=60, max_workers=2), expected)
+
+    def test_02_game_classes(self):
+        ae = self.assertEqual
+        for game_class in (
+            game_text_pgn.GameTextPGN,
+            game_ignore_case_pgn.GameIgnoreCasePGN,
+        ):
+            ae(
+                self.read(GAMES * 3, game_class=game_class, chunk_size=1),
+                _summary(
+                    parser.PGN(game_class=game_class).read_games(
+                        io.StringIO(GAMES * 3)
+                    )
+                ),
+            )
+
+    def test_03_executor(self):
+        ae = self.assertEqual
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            ae(
+                self.read(GAMES * 5, chunk_size=1, executor=executor),
+                _summary(parser.PGN().read_games(io.StringIO(GAMES * 5))),
+            )
+
+    def test_04_max_pending(self):
+        ae = self.assertEqual
+        expected = _summary(parser.PGN().read_games(io.StringIO(GAMES * 3)))
+        for max_pending in (0, 1, 20):
+            ae(
+                self.read(GAMES * 3, chunk_size=1, max_pending=max_pending),
+                expected,
+            )
+
+    def test_05_stress(self):
+        ae = self.assertEqual
+        texts = []
+        for name in sorted(os.listdir(PGN_FILES)):
+            with open(
+                os.path.join(PGN_FILES, name), encoding="iso-8859-1"
+            ) as file:
+                texts.append(file.read())
+        text = "\n".join(texts)
+        expected = _summary(parser.PGN().read_games(io.StringIO(text)))
+        for chunk_size in (1, 5000):
+            ae(
+                self.read(text, chunk_size=chunk_size, max_workers=16),
+                expected,
+            )
+
+
+if __name__ == "__main__":
+    runner = unittest.TextTestRunner
+    loader = unittest.defaultTestLoader.loadTestsFromTestCase
+
+    runner().run(loader(Functions))
+    runner().run(loader(ThreadPoolPGN))
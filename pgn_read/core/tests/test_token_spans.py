@@ -0,0 +1,110 @@
+# test_token_spans.py
+# Copyright 2025 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""token_spans tests"""
+
+import unittest
+import io
+
+from .. import token_spans
+from .. import parser
+from .. import game_text_pgn
+from .. import game_indicate_check
+
+GAMES = "".join(
+    (
+        '[Event "A"]\n[Result"1-0"]\n1. e4 e5 (1... c5) 2. Nf3 {good} 1-0\n',
+        "e4 e5 *\n",
+        '[Event"B"][Result"*"]e4 e5 Ke4 Nf3\n\n',
+        '[Event"D"][Result"*"]d4 (d5 Nc6) d5 Nf3+ *\n',
+        '[Event"E"][Result"*"]e4 e5 Nf3\n',
+    )
+)
+
+
+def _summary(games):
+    """Return list of text, state, errors, text of game, and game offset."""
+    return [
+        (
+            list(g.pgn_text),
+            g.state,
+            list(g._error_list),
+            g.get_text_of_game(),
+            g.game_offset,
+        )
+        for g in games
+    ]
+
+
+class TokenSpans(unittest.TestCase):
+    def test_01_from_tokens(self):
+        ae = self.assertEqual
+        spans = token_spans.TokenSpans.from_tokens(
+            ['[Event"A"]', "e4", "e5", " Bb4", "Nf3"],
+            '[Event "A"]\n1. e4 e5\nBb4 2.Nf3',
+        )
+        ae(len(spans), 5)
+        ae(spans.override_count, 2)
+        ae(list(spans), ['[Event"A"]', "e4", "e5", " Bb4", "Nf3"])
+        ae(list(spans._starts), [0, 15, 18, 0, 27])
+        ae(spans[-1], "Nf3")
+        ae(spans[1:3], ["e4", "e5"])
+        ae(spans[3], " Bb4")
+        self.assertRaises(IndexError, spans.__getitem__, 5)
+        ae(spans[-5], '[Event"A"]')
+        self.assertRaises(IndexError, spans.__getitem__, -6)
+
+    def test_02_from_tokens_position(self):
+        ae = self.assertEqual
+        spans = token_spans.TokenSpans.from_tokens(["e4"], "e4 e5 e4", 3)
+        ae(list(spans._starts), [6])
+
+    def test_03___eq__(self):
+        ae = self.assertEqual
+        spans = token_spans.TokenSpans.from_tokens(["e4", "e5"], "e4 e5")
+        ae(spans == ["e4", "e5"], True)
+        ae(spans == ("e4", "e5"), True)
+        ae(spans == ["e4"], False)
+        ae(spans == "e4e5", False)
+
+
+class TokenSpansPGN(unittest.TestCase):
+    def test_01_read_games(self):
+        ae = self.assertEqual
+        games = list(
+            token_spans.TokenSpansPGN().read_games(io.StringIO(GAMES))
+        )
+        ae(
+            _summary(games),
+            _summary(parser.PGN().read_games(io.StringIO(GAMES))),
+        )
+        ae(
+            [isinstance(g.pgn_text, token_spans.TokenSpans) for g in games],
+            [True, False, True, True, True],
+        )
+        ae(games[0].pgn_text.override_count, 1)
+
+    def test_02_game_classes(self):
+        ae = self.assertEqual
+        for game_class in (
+            game_text_pgn.GameTextPGN,
+            game_indicate_check.GameIndicateCheck,
+        ):
+            games = token_spans.TokenSpansPGN(game_class=game_class)
+            ae(
+                _summary(games.read_games(io.StringIO(GAMES * 3), size=50)),
+                _summary(
+                    parser.PGN(game_class=game_class).read_games(
+                        io.StringIO(GAMES * 3), size=50
+                    )
+                ),
+            )
+
+
+if __name__ == "__main__":
+    runner = unittest.TextTestRunner
+    loader = unittest.defaultTestLoader.loadTestsFromTestCase
+
+    runner().run(loader(TokenSpans))
+    runner().run(loader(TokenSpansPGN))
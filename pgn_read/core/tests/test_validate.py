@@ -0,0 +1,83 @@
+# test_validate.py
+# Copyright 2025 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""validate tests"""
+
+import unittest
+import io
+import collections
+
+from .. import validate
+
+GAMES = "".join(
+    (
+        '[Event"A"][Result"1-0"]e4 e5(c5)Nf3 1-0\n',
+        '[Event"B"][Result"*"]e4 e5 Ke4 Nf3\n\n',
+        '[Event"C"][Result"*"]d4 (d5 Nc6) d5 *\n',
+        '[Event"D"][Result"*"]e4 e5 Nf3\n',
+    )
+)
+
+
+class GameValidate(unittest.TestCase):
+    def test_01___init__(self):
+        ae = self.assertEqual
+        game = validate.GameValidate()
+        ae(isinstance(game._position_deltas, collections.deque), True)
+        ae(game._position_deltas.maxlen, validate.POSITION_DELTAS_KEPT)
+        ae(game.error_ply, None)
+        ae(game.error_fen, None)
+
+
+class PGNValidate(unittest.TestCase):
+    def setUp(self):
+        self.validate = validate.PGNValidate()
+
+    def tearDown(self):
+        del self.validate
+
+    def test_01_read_errors(self):
+        ae = self.assertEqual
+        ae(
+            list(self.validate.read_errors(io.StringIO(GAMES))),
+            [
+                (
+                    2,
+                    76,
+                    4,
+                    " Ke4",
+                    2,
+                    "rnbqkbnr/pppp1ppp/8/4p3/4P3/8/PPPP1PPP/RNBQKBNR w KQkq"
+                    " e6 0 2",
+                ),
+                (
+                    3,
+                    113,
+                    4,
+                    " d5",
+                    0,
+                    "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq"
+                    " - 0 1",
+                ),
+                (
+                    4,
+                    145,
+                    5,
+                    None,
+                    3,
+                    "rnbqkbnr/pppp1ppp/8/4p3/4P3/5N2/PPPP1PPP/RNBQKB1R b KQkq"
+                    " - 1 2",
+                ),
+            ],
+        )
+        ae(self.validate.game_count, 4)
+        ae(self.validate.error_count, 3)
+
+
+if __name__ == "__main__":
+    runner = unittest.TextTestRunner
+    loader = unittest.defaultTestLoader.loadTestsFromTestCase
+
+    runner().run(loader(GameValidate))
+    runner().run(loader(PGNValidate))
@@ -0,0 +1,71 @@
+# timeit_eco_trie.py
+# Copyright 2025 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Time reading games with Game and GameECO, and loading the ECO trie.
+
+The difference between the two reading times is the cost of classifying
+the openings.  The ECO table file name and the games file name can be given
+as arguments, otherwise file dialogues are used.
+
+"""
+import sys
+import os
+import io
+import tempfile
+import timeit
+
+from pgn_read.core.parser import PGN
+from pgn_read.core.game import Game
+from pgn_read.core.eco_trie import ECOTrie, GameECO
+
+
+def read(text, game_class):
+    """Read games in text with game_class."""
+    for game in PGN(game_class=game_class).read_games(io.StringIO(text)):
+        pass
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 2:
+        ecofile, pgnfile = sys.argv[1:3]
+    else:
+        import tkinter.filedialog
+
+        ecofile = tkinter.filedialog.askopenfilename(title="ECO table")
+        pgnfile = tkinter.filedialog.askopenfilename(title="Games")
+    if ecofile and pgnfile:
+        trie = ECOTrie()
+        with open(ecofile, mode="r", encoding="iso-8859-1") as file:
+            trie.add_pgn(file)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "eco.trie")
+            trie.write_trie(path)
+            print(
+                "load trie".ljust(20),
+                min(
+                    timeit.repeat(
+                        "ECOTrie().read_trie(path)",
+                        globals=globals(),
+                        number=1,
+                        repeat=3,
+                    )
+                ),
+                len(trie),
+                "nodes",
+            )
+        GameECO.eco_trie = trie
+        with open(pgnfile, mode="r", encoding="iso-8859-1") as file:
+            text = file.read()
+        for game_class in (Game, GameECO):
+            print(
+                game_class.__name__.ljust(20),
+                min(
+                    timeit.repeat(
+                        "read(text, game_class)",
+                        globals=globals(),
+                        number=1,
+                        repeat=3,
+                    )
+                ),
+            )
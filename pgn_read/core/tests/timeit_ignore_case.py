@@ -0,0 +1,98 @@
+# timeit_ignore_case.py
+# Copyright 2025 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Time reading games with GameIgnoreCasePGN in several versions of a file.
+
+The movetext is read as found, in lower case, in mixed case, and with long
+algebraic moves like 'e2-e4' split into two tokens like 'e2 e4'.  The PGN
+Tags are not changed because the FEN Tag is case sensitive.
+
+The counts of moves decided by peeking at the next token, and of PGN errors
+undone when processing the next token, are printed for each version.  The
+split version is the interesting one if the file is in long algebraic
+notation.
+
+The file name can be given as an argument, otherwise a file dialogue is
+used.
+
+"""
+import sys
+import io
+import re
+import random
+import timeit
+
+from pgn_read.core.parser import PGN
+from pgn_read.core.game_ignore_case_pgn import GameIgnoreCasePGN
+
+tag = re.compile(r"(\[[^\]]*\])")
+long_algebraic_move = re.compile(r"\b([a-h][1-8])-([a-h][1-8])")
+
+
+def movetext(text, convert):
+    """Return text with convert applied to text which is not a PGN Tag."""
+    return "".join(
+        part if part.startswith("[") else convert(part)
+        for part in tag.split(text)
+    )
+
+
+def mixed_case(text):
+    """Return text with case of each character chosen at random."""
+    choice = random.Random(0).choice
+    return "".join(choice((char.lower(), char.upper())) for char in text)
+
+
+def split_moves(text):
+    """Return lower case text with 'e2-e4' like moves split as 'e2 e4'."""
+    return long_algebraic_move.sub(r"\1 \2", text.lower())
+
+
+def read(text):
+    """Print games, errors, and recovery counts, for games in text."""
+    games = 0
+    errors = 0
+    lookahead = 0
+    undo = 0
+    for game in PGN(game_class=GameIgnoreCasePGN).read_games(
+        io.StringIO(text)
+    ):
+        games += 1
+        errors += game.state is not None
+        lookahead += game.lookahead_recovery_count
+        undo += game.undo_recovery_count
+    return games, errors, lookahead, undo
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        pgnfile = sys.argv[1]
+    else:
+        import tkinter.filedialog
+
+        pgnfile = tkinter.filedialog.askopenfilename()
+    if pgnfile:
+        with open(pgnfile, mode="r", encoding="iso-8859-1") as file:
+            original = file.read()
+        for name, text in (
+            ("as read", original),
+            ("lower", movetext(original, str.lower)),
+            ("mixed", movetext(original, mixed_case)),
+            ("split", movetext(original, split_moves)),
+        ):
+            result = []
+            print(
+                name.ljust(10),
+                timeit.timeit(
+                    "result.append(read(text))",
+                    globals=globals(),
+                    number=1,
+                ),
+            )
+            print(
+                " " * 10,
+                "games {}  errors {}  look-ahead {}  undo {}".format(
+                    *result[0]
+                ),
+            )
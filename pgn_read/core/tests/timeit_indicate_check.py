@@ -0,0 +1,79 @@
+# timeit_indicate_check.py
+# Copyright 2025 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Time reading games with Game and GameIndicateCheck, and checkmate tests.
+
+The difference between the two times is the cost of adding check and
+checkmate indicators to movetext.  The number of checkmate tests, one for
+each move giving check, and the checkmates found are printed with the time
+taken by the tests.
+
+The file name can be given as an argument, otherwise a file dialogue is
+used.
+
+"""
+import sys
+import io
+import time
+import timeit
+
+from pgn_read.core.parser import PGN
+from pgn_read.core.game import Game
+from pgn_read.core.game_indicate_check import GameIndicateCheck
+
+
+class TimedGameIndicateCheck(GameIndicateCheck):
+    """Accumulate count, checkmates, and time, of checkmate tests."""
+
+    tests = 0
+    checkmates = 0
+    seconds = 0
+
+    def _is_position_checkmate(self):
+        """Delegate and accumulate time taken and result."""
+        start = time.perf_counter()
+        checkmate = super()._is_position_checkmate()
+        cls = TimedGameIndicateCheck
+        cls.seconds += time.perf_counter() - start
+        cls.tests += 1
+        cls.checkmates += checkmate
+        return checkmate
+
+
+def read(text, game_class):
+    """Read games in text with game_class."""
+    for game in PGN(game_class=game_class).read_games(io.StringIO(text)):
+        pass
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        pgnfile = sys.argv[1]
+    else:
+        import tkinter.filedialog
+
+        pgnfile = tkinter.filedialog.askopenfilename()
+    if pgnfile:
+        with open(pgnfile, mode="r", encoding="iso-8859-1") as file:
+            text = file.read()
+        for game_class in (Game, GameIndicateCheck):
+            print(
+                game_class.__name__.ljust(20),
+                min(
+                    timeit.repeat(
+                        "read(text, game_class)",
+                        globals=globals(),
+                        number=1,
+                        repeat=3,
+                    )
+                ),
+            )
+        read(text, TimedGameIndicateCheck)
+        print(
+            "checkmate tests {}  checkmates {}  seconds {}".format(
+                TimedGameIndicateCheck.tests,
+                TimedGameIndicateCheck.checkmates,
+                TimedGameIndicateCheck.seconds,
+            )
+        )
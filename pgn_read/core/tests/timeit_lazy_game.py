@@ -0,0 +1,51 @@
+# timeit_lazy_game.py
+# Copyright 2025 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Time collecting tags of games with PGN, PGNTagPair, and LazyPGN.
+
+The file name can be given as an argument, otherwise a file dialogue is
+used.
+
+"""
+import sys
+import io
+import timeit
+
+from pgn_read.core.parser import PGN
+from pgn_read.core.tagpair_parser import PGNTagPair, TagPairGame
+from pgn_read.core.lazy_game import LazyPGN
+
+
+def read(text, parser):
+    """Read tags of games in text with parser."""
+    for game in parser.read_games(io.StringIO(text)):
+        game.pgn_tags
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        pgnfile = sys.argv[1]
+    else:
+        import tkinter.filedialog
+
+        pgnfile = tkinter.filedialog.askopenfilename()
+    if pgnfile:
+        with open(pgnfile, mode="r", encoding="iso-8859-1") as file:
+            text = file.read()
+        for parser in (
+            PGN(),
+            PGNTagPair(game_class=TagPairGame),
+            LazyPGN(),
+        ):
+            print(
+                parser.__class__.__name__.ljust(20),
+                min(
+                    timeit.repeat(
+                        "read(text, parser)",
+                        globals=globals(),
+                        number=1,
+                        repeat=3,
+                    )
+                ),
+            )
@@ -0,0 +1,34 @@
+# timeit_perft.py
+# Copyright 2025 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Time perft counts for the standard test positions.
+
+The count, whether it agrees with the known count, the time taken, and the
+nodes per second, are printed for each position and depth.
+
+The maximum depth can be given as an argument, otherwise the depths with
+known counts are used.
+
+"""
+import sys
+
+from pgn_read.core.perft import perft_positions
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        maximum_depth = int(sys.argv[1])
+    else:
+        maximum_depth = None
+    for name, depth, count, expected, seconds in perft_positions(
+        maximum_depth=maximum_depth
+    ):
+        print(
+            name.ljust(12),
+            depth,
+            str(count).rjust(8),
+            "OK   " if count == expected else "WRONG",
+            "seconds {:.3f}".format(seconds),
+            "nodes/second {:.0f}".format(count / seconds if seconds else 0),
+        )
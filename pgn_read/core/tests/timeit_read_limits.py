@@ -0,0 +1,91 @@
+# timeit_read_limits.py
+# Copyright 2025 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Time reading adversarial PGN with and without limits on games.
+
+The peak memory allocated while reading is shown too.  The adversarial
+games are an unterminated comment, deeply nested RAVs, and a very long
+game, each followed by a normal game.
+
+The number of characters in each adversarial game can be given as an
+argument, default 2000000.
+
+"""
+import sys
+import io
+import timeit
+import tracemalloc
+
+from pgn_read.core.parser import PGN
+
+NORMAL = '[Event "Normal"]\n[Result "*"]\n\n1. e4 e5 2. Nf3 Nc6 *\n\n'
+
+LIMITS = dict(
+    max_game_characters=100000,
+    max_tokens=10000,
+    max_rav_depth=100,
+    max_comment_length=20000,
+)
+
+
+def adversarial_texts(length):
+    """Return dict of adversarial PGN texts about length characters long."""
+    return {
+        "comment": "".join(
+            (
+                NORMAL,
+                '[Event "Comment"]\n\n1. e4 { ',
+                "unterminated comment\n" * (length // 21),
+                NORMAL,
+            )
+        ),
+        "rav": "".join(
+            (
+                NORMAL,
+                '[Event "RAV"]\n\n1. e4 ',
+                "( e4 " * (length // 5),
+                NORMAL,
+            )
+        ),
+        "long game": "".join(
+            (
+                NORMAL,
+                '[Event "Long"]\n\n1. Nf3 Nf6 ',
+                "Ng1 Ng8 Nf3 Nf6 " * (length // 16),
+                "*\n\n",
+                NORMAL,
+            )
+        ),
+    }
+
+
+def read(text, parser):
+    """Read games in text with parser."""
+    for game in parser.read_games(io.StringIO(text), size=65536):
+        pass
+
+
+if __name__ == "__main__":
+    length = int(sys.argv[1]) if len(sys.argv) > 1 else 2000000
+    for name, text in adversarial_texts(length).items():
+        for limits in ({}, LIMITS):
+            parser = PGN(**limits)
+            tracemalloc.start()
+            read(text, parser)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print(
+                " ".join((name, "limits" if limits else "no limits")).ljust(
+                    30
+                ),
+                min(
+                    timeit.repeat(
+                        "read(text, parser)",
+                        globals=globals(),
+                        number=1,
+                        repeat=3,
+                    )
+                ),
+                peak,
+            )
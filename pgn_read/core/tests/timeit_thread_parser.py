@@ -0,0 +1,85 @@
+# timeit_thread_parser.py
+# Copyright 2025 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Time reading games with PGN, and ThreadPoolPGN with threads or processes.
+
+The games read by each way are compared with those read by PGN to show the
+output is identical.
+
+The file name can be given as an argument, otherwise a file dialogue is
+used.  The number of workers can be given as a second argument, the default
+is the number of CPUs.
+
+On a build of Python where the GIL is enabled the threads take turns, so
+expect the thread pool to be slower than PGN.
+
+"""
+import sys
+import os
+import io
+import timeit
+from concurrent.futures import ProcessPoolExecutor
+
+from pgn_read.core.parser import PGN
+from pgn_read.core.thread_parser import ThreadPoolPGN
+
+CHUNK_SIZE = 1000000
+
+
+def summary(games):
+    """Return list of text, state, and game offset, for games."""
+    return [(g.pgn_text, g.state, g.game_offset) for g in games]
+
+
+def pgn():
+    """Return summary of games read by PGN."""
+    return summary(PGN().read_games(io.StringIO(text)))
+
+
+def threads():
+    """Return summary of games read by ThreadPoolPGN with threads."""
+    return summary(
+        ThreadPoolPGN(chunk_size=CHUNK_SIZE, max_workers=workers).read_games(
+            io.StringIO(text)
+        )
+    )
+
+
+def processes():
+    """Return summary of games read by ThreadPoolPGN with processes."""
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return summary(
+            ThreadPoolPGN(
+                chunk_size=CHUNK_SIZE, max_workers=workers, executor=executor
+            ).read_games(io.StringIO(text))
+        )
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        pgnfile = sys.argv[1]
+    else:
+        import tkinter.filedialog
+
+        pgnfile = tkinter.filedialog.askopenfilename()
+    if len(sys.argv) > 2:
+        workers = int(sys.argv[2])
+    else:
+        workers = os.cpu_count() or 1
+    if pgnfile:
+        with open(pgnfile, mode="r", encoding="iso-8859-1") as file:
+            text = file.read()
+        expected = pgn()
+        print(len(expected), "games", workers, "workers")
+        for name in ("pgn", "threads", "processes"):
+            result = []
+            print(
+                name.ljust(10),
+                timeit.timeit(
+                    "result.append(" + name + "())",
+                    globals=globals(),
+                    number=1,
+                ),
+            )
+            print(" " * 10, "identical:", result[0] == expected)
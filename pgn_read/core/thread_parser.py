@@ -0,0 +1,174 @@
+# thread_parser.py
+# Copyright 2025 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Read games from PGN text by parsing chunks of the text in a thread pool.
+
+The ThreadPoolPGN class cuts the text into chunks, each starting with a PGN
+tag at the start of a line after a game termination marker, and parses the
+chunks with the PGN class in a concurrent.futures executor.  The games are
+yielded in the order they appear in the text, with the game_offset values
+given by PGN read_games() for the whole text.
+
+A chunk is accepted only if the final game in the chunk ends with a game
+termination marker at the end of the chunk, when PGN read_games() for the
+whole text must start a new game at the same place.  Otherwise the chunk is
+parsed again together with the following chunk: a comment containing
+'1-0' followed by a PGN tag at the start of a line for example.
+
+On free-threaded builds of Python the chunks are parsed in parallel by the
+default ThreadPoolExecutor.  Where the GIL is enabled the threads take turns
+so a ProcessPoolExecutor, given as the executor argument, may be quicker
+despite the cost of pickling the games.
+
+Game instances do not share mutable state.  The square and piece tables in
+the squares module are built when the module is imported and not changed
+after that: Piece.set_square() binds a shared square object to the piece
+but does not change the square.  Compiled regular expressions can be used
+by several threads at once.  Each chunk is parsed by it's own PGN instance.
+
+"""
+import os
+import re
+import io
+from concurrent.futures import ThreadPoolExecutor
+
+from .game import Game
+from .parser import PGN
+
+# Characters in a chunk before looking for the place to end the chunk.
+CHUNK_SIZE = 1000000
+
+# A game termination marker, the rest of it's line, and whitespace before a
+# PGN tag at the start of a line.
+chunk_end = re.compile(r"(?:1-0|0-1|1/2-1/2|\*)[ \t\r]*\n\s*(?=\[)")
+
+
+def parse_chunk(game_class, text):
+    """Return list of game_class games in text and True if cut at text end.
+
+    The cut is good if the final game ends with a game termination marker
+    followed by nothing but whitespace.  Text is read as a file so the
+    game_offset of an unterminated final game is the length of text.
+
+    """
+    games = list(PGN(game_class=game_class).read_games(io.StringIO(text)))
+    return games, bool(games) and games[-1].game_offset == len(text.rstrip())
+
+
+class ThreadPoolPGN:
+    """Read games from PGN text in chunks parsed by an executor.
+
+    executor is a concurrent.futures executor, which is not shut down by
+    ThreadPoolPGN, or None to use a ThreadPoolExecutor with max_workers
+    threads for each read_games() call.
+
+    max_pending is the number of chunks submitted to the executor before
+    waiting for the first to be parsed, at least 1, or None for twice the
+    number of workers.
+
+    """
+
+    def __init__(
+        self,
+        game_class=Game,
+        chunk_size=CHUNK_SIZE,
+        max_workers=None,
+        executor=None,
+        max_pending=None,
+    ):
+        """Note game class, chunk size, and executor to parse chunks."""
+        self.game_class = game_class
+        self.chunk_size = chunk_size
+        self.max_workers = max_workers
+        self.executor = executor
+        self.max_pending = max_pending
+
+    def read_games(self, source, size=10000000):
+        """Yield game_class instances for games in source.
+
+        source and size are as in PGN read_games().
+
+        """
+        if self.executor is None:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                yield from self._read_games(executor, source, size)
+        else:
+            yield from self._read_games(self.executor, source, size)
+
+    def _read_games(self, executor, source, size):
+        """Yield games from chunks of source parsed by executor."""
+        max_pending = self.max_pending
+        if max_pending is None:
+            max_pending = 2 * (self.max_workers or os.cpu_count() or 1)
+
+        # The last chunk must be pending when the source is exhausted.
+        max_pending = max(max_pending, 1)
+        pending = []
+        carry = None
+        try:
+            for start, text in self._read_chunks(source, size):
+                pending.append((start, text, self._submit(executor, text)))
+                if len(pending) > max_pending:
+                    carry = yield from self._chunk_games(
+                        pending.pop(0), carry, False
+                    )
+            while pending:
+                chunk = pending.pop(0)
+                carry = yield from self._chunk_games(chunk, carry, not pending)
+        finally:
+            for chunk in pending:
+                self._discard_chunk(chunk)
+
+    def _submit(self, executor, text):
+        """Return future for parse of text by executor."""
+        return executor.submit(parse_chunk, self.game_class, text)
+
+    def _discard_chunk(self, chunk):
+        """Cancel parse of chunk not wanted because read_games() closed."""
+        chunk[2].cancel()
+
+    def _chunk_games(self, chunk, carry, last):
+        """Yield games in chunk and return None, or return text to carry.
+
+        chunk is the offset, text, and future, of a chunk and carry is None
+        or the offset and text of the chunks before chunk which must be
+        parsed with chunk.  Chunks are carried forward until a good cut is
+        found, or the last chunk is reached.
+
+        """
+        start, text, future = chunk
+        if carry is None:
+            games, cut = future.result()
+        else:
+            future.cancel()
+            start, text = carry[0], carry[1] + text
+            games, cut = parse_chunk(self.game_class, text)
+        if not (cut or last):
+            return start, text
+        for game in games:
+            game.game_offset += start
+            yield game
+        return None
+
+    def _read_chunks(self, source, size):
+        """Yield offset and text of chunks of source.
+
+        Each chunk except the last ends with a game termination marker and
+        whitespace before a PGN tag.
+
+        """
+        chunk_size = self.chunk_size
+        offset = 0
+        text = ""
+        for pgntext in PGN._read_pgn(source, size):
+            text += pgntext
+            while len(text) > chunk_size:
+                match = chunk_end.search(text, chunk_size)
+                if match is None:
+                    break
+                yield offset, text[: match.end()]
+                offset += match.end()
+                text = text[match.end() :]
+        if text:
+            yield offset, text
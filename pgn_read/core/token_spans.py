@@ -0,0 +1,160 @@
+# token_spans.py
+# Copyright 2025 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Keep the tokens of parsed games as spans of the text read.
+
+The TokenSpansPGN class extends parser.PGN to replace the list of token
+strings in each game's _text with a TokenSpans instance: the start and
+length of each token in the text read from the PGN file, and a small table
+of tokens which do not appear in the text.  PGN tags for example, which
+the Game class rebuilds without spaces, and tokens after a PGN error,
+which are given a separator prefix.  Token strings are created when they
+are accessed by pgn_text or get_text_of_game().
+
+All games read from one chunk of text, see the size argument of
+read_games(), refer to the chunk.  So memory is saved when most of the
+games read are kept, but keeping a few games keeps the chunks holding
+them too.
+
+The spans of a game are found when parsing of the game is finished, so the
+game's list of token strings exists until then.  Peak memory while a game
+is parsed is not reduced: the saving is in the games kept after they are
+yielded by read_games().
+
+"""
+from array import array
+from collections.abc import Sequence
+
+from .game import Game
+from .parser import PGN
+
+# Characters searched for a token in the text after the previous token, in
+# addition to the token's length: enough for move numbers, dots, and
+# whitespace.  A token not found is put in the table of overrides.
+SEARCH_SLACK = 64
+
+
+class TokenSpans(Sequence):
+    """Read only sequence of token strings held as spans of a source str.
+
+    Item n is source[starts[n] : starts[n] + lengths[n]] unless n is in
+    the overrides dict, when the token is overrides[n].
+
+    """
+
+    def __init__(self, source, starts, lengths, overrides):
+        """Note source text, token spans, and tokens not in source."""
+        self._source = source
+        self._starts = starts
+        self._lengths = lengths
+        self._overrides = overrides
+
+    @classmethod
+    def from_tokens(cls, tokens, source, position=0):
+        """Return TokenSpans for tokens found, in order, in source.
+
+        The search for the first token starts at position in source.  The
+        search for each token is widened by the length of any tokens not
+        found since the previous token found.
+
+        """
+        starts = array("Q")
+        lengths = array("I")
+        overrides = {}
+        find = source.find
+        missing = 0
+        for index, token in enumerate(tokens):
+            length = len(token)
+            start = find(
+                token, position, position + length + missing + SEARCH_SLACK
+            )
+            if start < 0:
+                overrides[index] = token
+                starts.append(0)
+                lengths.append(0)
+                missing += length
+                continue
+            starts.append(start)
+            lengths.append(length)
+            position = start + length
+            missing = 0
+        return cls(source, starts, lengths, overrides)
+
+    def __len__(self):
+        """Return number of tokens."""
+        return len(self._starts)
+
+    def __getitem__(self, index):
+        """Return token, or list of tokens if index is a slice."""
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self._starts)
+            if index < 0:
+                raise IndexError("TokenSpans index out of range")
+        token = self._overrides.get(index)
+        if token is not None:
+            return token
+        start = self._starts[index]
+        return self._source[start : start + self._lengths[index]]
+
+    def __eq__(self, other):
+        """Return True if other is a sequence of the same tokens."""
+        if not isinstance(other, Sequence) or isinstance(other, str):
+            return NotImplemented
+        return len(self) == len(other) and all(
+            token == other_token for token, other_token in zip(self, other)
+        )
+
+    def __repr__(self):
+        """Return representation of list of tokens."""
+        return repr(list(self))
+
+    @property
+    def override_count(self):
+        """Return number of tokens not found in source."""
+        return len(self._overrides)
+
+
+def token_spans_game_class(game_class):
+    """Return game_class subclass which notes where its PGN tags start."""
+
+    def append_start_tag(self, match):
+        """Note text being parsed and start of first tag, and delegate."""
+        if self._source is None:
+            self._source = match.string
+            self._source_start = match.start()
+        game_class.append_start_tag(self, match)
+
+    return type(
+        game_class.__name__,
+        (game_class,),
+        {
+            "_source": None,
+            "_source_start": 0,
+            "append_start_tag": append_start_tag,
+        },
+    )
+
+
+class TokenSpansPGN(PGN):
+    """Extend to keep tokens of each game as spans of the text read.
+
+    Games without PGN tags keep the list of token strings.
+
+    """
+
+    def __init__(self, game_class=Game):
+        """Extend to parse with subclass of game_class noting source text."""
+        super().__init__(game_class=token_spans_game_class(game_class))
+
+    def read_games(self, source, size=10000000):
+        """Extend to replace token strings in games with token spans."""
+        for game in super().read_games(source, size=size):
+            if game._source is not None:
+                game._text = TokenSpans.from_tokens(
+                    game._text, game._source, game._source_start
+                )
+                game._source = None
+            yield game
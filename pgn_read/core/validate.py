@@ -0,0 +1,116 @@
+# validate.py
+# Copyright 2025 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Report the PGN errors in games without keeping anything for valid games.
+
+The PGNValidate class reads games with the GameValidate class and yields a
+tuple for each game with an error: the game number, game offset, number of
+the first error token, the first error token, and the ply and Forsyth
+Edwards Notation (FEN) of the position before the first error.
+
+The GameValidate class keeps only the latest position deltas rather than
+the position deltas for every token, so the positions in a game cannot be
+replayed but memory used does not grow with the length of a game.  The
+position is noted when the first error is found.
+
+"""
+from collections import deque
+
+from .game import Game
+from .gamedata import _ply_for_position
+from .parser import PGN
+
+# The position deltas kept by GameValidate: the latest position delta is
+# needed to start a RAV, and the one before to undo an illegal move.
+POSITION_DELTAS_KEPT = 2
+
+
+class GameValidate(Game):
+    """Game which notes the position at the first PGN error.
+
+    error_ply and error_fen are None until a PGN error is found in the
+    movetext, and also if the error is found before the initial position
+    is set.
+
+    """
+
+    def __init__(self):
+        """Extend to keep latest position deltas and note first error."""
+        super().__init__()
+        self._position_deltas = deque(maxlen=POSITION_DELTAS_KEPT)
+        self.error_ply = None
+        self.error_fen = None
+
+    def pgn_error_notification(self):
+        """Note position at first error in main line or a RAV."""
+        if self.error_ply is None and self._active_color is not None:
+            self.error_ply = self._get_ply()
+            self.error_fen = self.get_fen_for_position()
+
+    def _get_ply(self):
+        """Return half moves to position from standard starting position."""
+        return _ply_for_position(
+            (
+                self._active_color,
+                self._castling_availability,
+                self._en_passant_target_square,
+                self._halfmove_clock,
+                self._fullmove_number,
+            )
+        )
+
+
+class PGNValidate:
+    """Yield details of games with PGN errors and count games.
+
+    game_count and error_count are the games read, and the games with
+    errors, so far.
+
+    """
+
+    def __init__(self, game_class=GameValidate):
+        """Initialise counts and parser for game_class."""
+        self._parser = PGN(game_class=game_class)
+        self.game_count = 0
+        self.error_count = 0
+
+    def read_errors(self, source, size=10000000):
+        """Yield tuple of error details for each game with an error.
+
+        source and size are as in PGN read_games().
+
+        The tuple is (game number, game_offset, token number, token, ply,
+        FEN).  The game number counts from 1.  The first error is the
+        first error in the main line or a RAV, or the error set at the end
+        of an incomplete game if there are no other errors.  Token is None
+        if the game has no tokens after that error.  The ply and FEN are
+        for the position before the first error: when the error is not a
+        move in the movetext they are for the position at end of game, and
+        are None if the initial position was not set.
+
+        """
+        for game in self._parser.read_games(source, size=size):
+            self.game_count += 1
+            if game.state is None and not game.error_list:
+                continue
+            self.error_count += 1
+            if game.error_list:
+                token_number = game.error_list[0]
+            else:
+                token_number = game.state
+            text = game.pgn_text
+            token = text[token_number] if token_number < len(text) else None
+            ply = game.error_ply
+            fen = game.error_fen
+            if ply is None and game.active_color is not None:
+                ply = game._get_ply()
+                fen = game.get_fen_for_position()
+            yield (
+                self.game_count,
+                game.game_offset,
+                token_number,
+                token,
+                ply,
+                fen,
+            )
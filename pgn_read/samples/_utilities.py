@@ -12,7 +12,6 @@ import os
 import time
 
 from ..core.parser import PGN
-from ..core.gamedata import generate_fen_for_position
 
 
 def read_pgn(filename, game_class=None, size=10000000):
@@ -36,16 +35,7 @@ def read_pgn(filename, game_class=None, size=10000000):
             game_not_ok_token_count += len(y._text)
             games_with_error.append(y._text[: y.state])
             if y._piece_placement_data:
-                last_fen_before_error.append(
-                    generate_fen_for_position(
-                        y._piece_placement_data.values(),
-                        y._active_color,
-                        y._castling_availability,
-                        y._en_passant_target_square,
-                        y._halfmove_clock,
-                        y._fullmove_number,
-                    )
-                )
+                last_fen_before_error.append(y.get_fen_for_position())
             else:
                 last_fen_before_error.append("No FEN")
             error_text.append(y._text[y.state :])